@@ -119,6 +119,19 @@ class Agent(ABC):
         )
         return None
 
+    def reset_for_run(self, shared_context: SharedContext) -> None:
+        """
+        Clears any per-run state before the agent is reused for a new run.
+
+        The orchestrator pools agent instances across `run_cacm` calls and
+        calls this when a run checks the instance out of the pool, so agents
+        that accumulate state during a run should override this.
+
+        Args:
+            shared_context (SharedContext): The context of the run about to start.
+        """
+        pass
+
     @abstractmethod
     async def run(
         self,
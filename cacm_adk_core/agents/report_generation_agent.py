@@ -312,6 +312,10 @@ class ReportGenerationAgent(Agent):
             "report_package": report_package_output,  # Ensure this key matches workflow outputBinding
         }
 
+    def reset_for_run(self, shared_context: SharedContext) -> None:
+        """Discards results received directly from other agents in a previous run."""
+        self.stored_results = []
+
     async def receive_analysis_results(
         self, sending_agent_name: str, results: Dict[str, Any]
     ):
@@ -10,6 +10,18 @@ class SharedContext:
     throughout a CACM execution session.
     """
 
+    # One context is created per run and read by every step; slots avoid a
+    # per-instance __dict__ and speed up attribute access.
+    __slots__ = (
+        "session_id",
+        "cacm_id",
+        "document_references",
+        "knowledge_base_references",
+        "global_parameters",
+        "data_store",
+        "logger",
+    )
+
     def __init__(self, cacm_id: str, session_id: Optional[str] = None):
         self.session_id: str = session_id or str(uuid.uuid4())
         self.cacm_id: str = cacm_id
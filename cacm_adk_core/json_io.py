@@ -0,0 +1,129 @@
+# cacm_adk_core/json_io.py
+"""
+JSON file loading helpers shared by components that read catalogs and templates.
+
+Files are parsed with `orjson` when it is installed. Files of at least
+`MMAP_MIN_SIZE` bytes are memory-mapped and parsed straight from the mapped
+pages instead of first being copied into a Python object; smaller files are
+read in one call, where the mapping setup would cost more than the copy.
+Without `orjson` the standard `json` module is used. Parse errors are raised as
+`json.JSONDecodeError` in both cases (`orjson.JSONDecodeError` is a subclass
+of it).
+"""
+
+import json
+import mmap
+import os
+import time
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files smaller than this are read into memory rather than memory-mapped.
+MMAP_MIN_SIZE = 64 * 1024
+
+# Parsed files keyed by absolute path, stored with the (mtime_ns, size, inode)
+# they were read at.
+_json_file_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+# Coarsest file timestamp granularity we allow for (FAT's 2 seconds). A file
+# modified this recently may be rewritten without its mtime changing.
+_MTIME_RESOLUTION_NS = 2_000_000_000
+
+
+def load_json_file(filepath: str) -> Any:
+    """
+    Reads and parses a JSON file.
+
+    Args:
+        filepath (str): Path to the JSON file.
+
+    Returns:
+        Any: The parsed JSON document.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is empty or not valid JSON.
+    """
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap cannot map an empty file; report it like any other bad document.
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        if size < MMAP_MIN_SIZE:
+            content = f.read()
+            return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ORJSON_AVAILABLE:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            return json.loads(mm[:])
+
+
+def load_json_file_cached(filepath: str) -> Any:
+    """
+    Like `load_json_file`, but reuses the parsed document while the file is unchanged.
+
+    The cache is keyed by absolute path and invalidated when the file's
+    modification time, size or inode changes. A file modified within the
+    timestamp resolution before it was read could change again without any of
+    those changing, so it is not cached until it is older.
+
+    The returned object is shared between callers and must not be mutated;
+    copy any part that needs changing.
+    """
+    abs_path = os.path.abspath(filepath)
+    read_started_ns = time.time_ns()
+    stat = os.stat(abs_path)
+    file_version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _json_file_cache.get(abs_path)
+    if cached is not None and cached[0] == file_version:
+        return cached[1]
+    data = load_json_file(abs_path)
+    if stat.st_mtime_ns < read_started_ns - _MTIME_RESOLUTION_NS:
+        _json_file_cache[abs_path] = (file_version, data)
+    else:
+        _json_file_cache.pop(abs_path, None)
+    return data
+
+
+def dumps_json(obj: Any, indent: bool = False) -> str:
+    """
+    Serializes `obj` to JSON text for logging and tracing.
+
+    Output is compact, or indented by two spaces if `indent` is True. Uses
+    `orjson` (with NumPy and non-string key support) when installed. Values
+    that are not JSON serializable are rendered with `str()`.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError, e.g. recursion or huge ints
+            pass
+    try:
+        return json.dumps(obj, default=str, indent=2 if indent else None)
+    except (TypeError, ValueError):
+        return str(obj)
+
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """
+    Serializes `obj` to JSON bytes with sorted keys, e.g. for content hashing.
+
+    Raises:
+        TypeError: If `obj` is not JSON serializable.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
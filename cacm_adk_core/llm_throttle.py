@@ -0,0 +1,122 @@
+# cacm_adk_core/llm_throttle.py
+"""
+Concurrency limit and retry policy for LLM (OpenAI chat completion) calls.
+
+All throttled calls made on an event loop share one semaphore, so fan-out
+callers cannot have more than the configured number of requests in flight.
+Rate-limit, timeout, connection and server errors are retried with randomized
+exponential backoff.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import random
+import weakref
+from typing import Any, Awaitable, Callable, TypeVar
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_LLM_CONCURRENCY = int(os.environ.get("OPENAI_MAX_CONCURRENCY", "16"))
+LLM_MAX_ATTEMPTS = 6
+LLM_BACKOFF_MIN = 1.0  # seconds
+LLM_BACKOFF_MAX = 60.0  # seconds
+
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+_llm_concurrency = DEFAULT_LLM_CONCURRENCY
+# asyncio.Semaphore is bound to the loop it is first used on, so keep one per loop.
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_llm_concurrency(limit: int) -> None:
+    """
+    Sets the maximum number of LLM calls in flight per event loop.
+
+    Calls already waiting on or holding the previous semaphore are unaffected.
+    """
+    global _llm_concurrency
+    if limit < 1:
+        raise ValueError("LLM concurrency limit must be at least 1.")
+    _llm_concurrency = limit
+    _semaphores.clear()
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Returns the LLM semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_llm_concurrency)
+    return semaphore
+
+
+def _is_retryable(error: BaseException) -> bool:
+    # semantic-kernel wraps OpenAI errors in its own exceptions; check the causes too.
+    while error is not None:
+        if isinstance(error, _RETRYABLE_ERRORS):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Random delay in [LLM_BACKOFF_MIN, min(LLM_BACKOFF_MAX, LLM_BACKOFF_MIN * 2**attempt)]."""
+    ceiling = min(LLM_BACKOFF_MAX, LLM_BACKOFF_MIN * 2**attempt)
+    return max(LLM_BACKOFF_MIN, random.uniform(0, ceiling))
+
+
+async def call_with_llm_limits(
+    func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Awaits func(*args, **kwargs) under the LLM semaphore, retrying retryable
+    errors up to LLM_MAX_ATTEMPTS times. The semaphore is released while
+    backing off.
+    """
+    attempt = 1
+    while True:
+        try:
+            async with get_llm_semaphore():
+                return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt >= LLM_MAX_ATTEMPTS or not _is_retryable(e):
+                raise
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                "LLM call failed (attempt %d/%d): %s. Retrying in %.1fs.",
+                attempt,
+                LLM_MAX_ATTEMPTS,
+                e,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def throttle_chat_completion(service: Any) -> Any:
+    """
+    Routes the chat completion service's get_chat_message_contents (which
+    get_chat_message_content also goes through) via call_with_llm_limits.
+
+    Returns the service, patched in place.
+    """
+    original = service.get_chat_message_contents
+
+    @functools.wraps(original)
+    async def get_chat_message_contents(*args: Any, **kwargs: Any) -> Any:
+        return await call_with_llm_limits(original, *args, **kwargs)
+
+    # Services are pydantic models, which reject unknown attributes via setattr.
+    object.__setattr__(service, "get_chat_message_contents", get_chat_message_contents)
+    return service
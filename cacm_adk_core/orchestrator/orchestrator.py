@@ -1,12 +1,27 @@
 # cacm_adk_core/orchestrator/orchestrator.py
+import asyncio
+import contextvars
+import copy
+import hashlib
 import json
-import random
 import logging
+import os
+import re
+import sys
+import types
 import uuid  # Added
-from typing import List, Dict, Any, Tuple, Callable, Type, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple, Callable, Type, Optional, Mapping
 import importlib
+import functools
 
 from cacm_adk_core.validator.validator import Validator
+from cacm_adk_core.json_io import (
+    canonical_json_bytes,
+    dumps_json,
+    load_json_file,
+    load_json_file_cached,
+)
 
 # Assuming basic_functions might be directly imported if needed, but registration handles it
 # from cacm_adk_core.compute_capabilities import basic_functions
@@ -15,16 +30,281 @@ from cacm_adk_core.semantic_kernel_adapter import KernelService
 from cacm_adk_core.agents.base_agent import Agent
 from cacm_adk_core.context.shared_context import SharedContext  # Added
 
-# Placeholder agent imports - will be done in a registration method
-# from cacm_adk_core.agents.data_ingestion_agent import DataIngestionAgent
-# from cacm_adk_core.agents.analysis_agent import AnalysisAgent
-# from cacm_adk_core.agents.report_generation_agent import ReportGenerationAgent
+from cacm_adk_core.agents.data_ingestion_agent import DataIngestionAgent
+from cacm_adk_core.agents.analysis_agent import AnalysisAgent
+from cacm_adk_core.agents.report_generation_agent import ReportGenerationAgent
 from cacm_adk_core.agents.fundamental_analyst_agent import FundamentalAnalystAgent
 from cacm_adk_core.agents.SNC_analyst_agent import SNCAnalystAgent
 from cacm_adk_core.agents.data_retrieval_agent import DataRetrievalAgent
 from cacm_adk_core.agents.catalyst_wrapper_agent import CatalystWrapperAgent
 from cacm_adk_core.agents.knowledge_graph_agent import KnowledgeGraphAgent
 
+# Agent classes registered with every Orchestrator, built once at import time.
+_DEFAULT_AGENT_REGISTRY: Dict[str, Type[Agent]] = {
+    "DataIngestionAgent": DataIngestionAgent,
+    "AnalysisAgent": AnalysisAgent,
+    "ReportGenerationAgent": ReportGenerationAgent,
+    "FundamentalAnalystAgent": FundamentalAnalystAgent,
+    "SNCAnalystAgent": SNCAnalystAgent,
+    "DataRetrievalAgent": DataRetrievalAgent,
+    "CatalystWrapperAgent": CatalystWrapperAgent,
+    "KnowledgeGraphAgent": KnowledgeGraphAgent,
+}
+
+# Upper bound on pooled agent instances per Orchestrator (least recently used evicted).
+DEFAULT_MAX_POOLED_AGENTS = 128
+
+
+class _RunAgents:
+    """Agent instances checked out of an Orchestrator's pool by one run_cacm call."""
+
+    __slots__ = ("shared_context", "instances")
+
+    def __init__(self):
+        self.shared_context: Optional[SharedContext] = None
+        self.instances: Dict[str, Agent] = {}
+
+
+# Agents of the run_cacm call executing in the current task (and the step tasks
+# it spawns), so concurrent runs never share an agent instance.
+_current_run_agents: contextvars.ContextVar[Optional[_RunAgents]] = (
+    contextvars.ContextVar("cacm_run_agents", default=None)
+)
+
+# Catalog left in place when loading fails; read-only so it cannot be filled by accident.
+_EMPTY_CATALOG: Mapping[str, Mapping[str, Any]] = types.MappingProxyType({})
+
+# Number of memoized run_cacm results kept per Orchestrator (least recently used evicted).
+RUN_CACHE_SIZE = 64
+
+# Binding reference prefixes understood by run_cacm.
+_CACM_INPUTS_PREFIX = "cacm.inputs."
+_CACM_OUTPUTS_PREFIX = "cacm.outputs."
+_STEPS_PREFIX = "steps."
+_SHARED_CONTEXT_PREFIX = "shared_context."
+# Prefix lengths, used to slice the referenced key off a binding string.
+_CACM_INPUTS_PREFIX_LEN = len(_CACM_INPUTS_PREFIX)
+_CACM_OUTPUTS_PREFIX_LEN = len(_CACM_OUTPUTS_PREFIX)
+_SHARED_CONTEXT_PREFIX_LEN = len(_SHARED_CONTEXT_PREFIX)
+
+# Catalog entry fields that are used as lookup keys on every workflow step.
+_INTERNED_CAPABILITY_KEYS = (
+    "id",
+    "agent_type",
+    "skill_plugin_name",
+    "skill_function_name",
+)
+
+
+def _intern_capability(cap_def: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a copy of a compute capability entry with its fixed string fields
+    interned; `cap_def` itself (shared via the JSON file cache) is not modified.
+
+    These strings are compared and used as dict keys for every workflow step,
+    so interning them once at catalog-load time lets those lookups take the
+    identity fast path instead of a full string compare.
+    """
+    interned = dict(cap_def)
+    for key in _INTERNED_CAPABILITY_KEYS:
+        value = interned.get(key)
+        if isinstance(value, str):
+            interned[key] = sys.intern(value)
+    inputs = interned.get("inputs")
+    if isinstance(inputs, list):  # Legacy catalog entries use a name->type dict
+        interned_inputs = []
+        for input_def in inputs:
+            if isinstance(input_def, dict):
+                input_def = dict(input_def)
+                for key in ("name", "type"):
+                    value = input_def.get(key)
+                    if isinstance(value, str):
+                        input_def[key] = sys.intern(value)
+            interned_inputs.append(input_def)
+        interned["inputs"] = interned_inputs
+    return interned
+
+
+_BINDING_PREFIXES = (
+    _CACM_INPUTS_PREFIX,
+    _STEPS_PREFIX,
+    _CACM_OUTPUTS_PREFIX,
+    _SHARED_CONTEXT_PREFIX,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _binding_prefix(binding_value_source: str) -> Optional[str]:
+    """Returns the reference prefix of a binding string, or None for a literal value."""
+    for prefix in _BINDING_PREFIXES:
+        if binding_value_source.startswith(prefix):
+            return prefix
+    return None
+
+
+# steps.<stepId>.<section>.<outputName>; the section is conventionally "outputs".
+_STEP_OUTPUT_REF_RE = re.compile(r"steps\.([^.]+)\.[^.]*\.([^.]+)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _step_output_ref(binding_value_source: str) -> Optional[Tuple[str, str]]:
+    """Parses a 'steps.X.outputs.Y' reference into (X, Y), or None if malformed."""
+    match = _STEP_OUTPUT_REF_RE.fullmatch(binding_value_source)
+    return match.group(1, 2) if match else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _input_binding_path(binding_value_source: str) -> Tuple[str, ...]:
+    """Splits a 'cacm.inputs.a.b' reference into its key path, once per reference."""
+    return tuple(binding_value_source[_CACM_INPUTS_PREFIX_LEN:].split("."))
+
+
+def _walk_input_path(inputs: Any, path: Tuple[str, ...]) -> Any:
+    """
+    Follows a precomputed key path through the CACM inputs.
+
+    Returns None as soon as a key is missing or a non-mapping value is reached.
+    """
+    value = inputs
+    try:
+        for part in path:
+            value = value[part]
+    except (KeyError, TypeError, IndexError):
+        return None
+    return value
+
+
+def _workflow_step_waves(
+    workflow_steps: List[Dict[str, Any]],
+    agent_type_of: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Layers workflow steps into waves whose steps do not depend on each other.
+
+    A step depends on every earlier step it references through `steps.X...`,
+    on every earlier step binding a `cacm.outputs` key it reads or also writes,
+    and on all earlier steps if it reads from SharedContext. Steps keep their
+    workflow order within a wave.
+
+    Args:
+        agent_type_of: Returns the agent type a step runs, or None. A run uses
+            one instance per agent type, and agents keep per-call state on the
+            instance, so steps of the same agent type are put in separate waves.
+    """
+    # Highest wave seen so far of the steps with a given stepId / writing a given
+    # output / running a given agent type.
+    step_id_levels: Dict[Any, int] = {}
+    output_levels: Dict[str, int] = {}
+    agent_levels: Dict[str, int] = {}
+    levels: List[int] = []
+    max_level = -1
+    for step in workflow_steps:
+        level = 0
+        reads_shared_context = False
+        read_outputs = []
+        for source in step.get("inputBindings", {}).values():
+            if not isinstance(source, str):
+                continue
+            if source.startswith(_STEPS_PREFIX):
+                producer_level = step_id_levels.get(source.split(".")[1])
+                if producer_level is not None:
+                    level = max(level, producer_level + 1)
+            elif source.startswith(_CACM_OUTPUTS_PREFIX):
+                read_outputs.append(source[_CACM_OUTPUTS_PREFIX_LEN:])
+            elif source.startswith(_SHARED_CONTEXT_PREFIX):
+                reads_shared_context = True
+        writes = [
+            target[_CACM_OUTPUTS_PREFIX_LEN:]
+            for target in step.get("outputBindings", {}).values()
+            if isinstance(target, str) and target.startswith(_CACM_OUTPUTS_PREFIX)
+        ]
+
+        if reads_shared_context:
+            level = max(level, max_level + 1)
+        for output_key in read_outputs + writes:
+            writer_level = output_levels.get(output_key)
+            if writer_level is not None:
+                level = max(level, writer_level + 1)
+        agent_type = agent_type_of(step) if agent_type_of is not None else None
+        if agent_type is not None:
+            agent_level = agent_levels.get(agent_type)
+            if agent_level is not None:
+                level = max(level, agent_level + 1)
+            agent_levels[agent_type] = level
+
+        levels.append(level)
+        max_level = max(max_level, level)
+        step_id = step.get("stepId", "Unknown Step")
+        step_id_levels[step_id] = max(level, step_id_levels.get(step_id, level))
+        for output_key in writes:
+            output_levels[output_key] = max(level, output_levels.get(output_key, level))
+
+    waves: List[List[Dict[str, Any]]] = [[] for _ in range(max_level + 1)]
+    for step, level in zip(workflow_steps, levels):
+        waves[level].append(step)
+    return waves
+
+
+class _JsonText:
+    """
+    Renders a step result as JSON text when a log message is actually formatted.
+
+    Step results can be large; wrapping them defers serialization to the point
+    where `_RunLog` (or the logging module) formats the message.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return dumps_json(self.value)
+
+
+class _RunLog:
+    """
+    Sink for the log messages of a `run_cacm` call.
+
+    Messages take %-style arguments and are only formatted when they are kept:
+    either appended to `messages` with their "LEVEL: Orchestrator: " prefix when
+    the caller collects logs, or passed to the logger if its level is enabled.
+    """
+
+    __slots__ = ("logger", "collect", "messages")
+
+    _PREFIXES = {
+        logging.INFO: "INFO: Orchestrator: ",
+        logging.WARNING: "WARN: Orchestrator: ",
+        logging.ERROR: "ERROR: Orchestrator: ",
+    }
+
+    def __init__(self, logger: logging.Logger, collect: bool = True):
+        self.logger = logger
+        self.collect = collect
+        self.messages: List[str] = []
+
+    def child(self) -> "_RunLog":
+        """Returns an empty sink with the same settings, e.g. for one concurrent step."""
+        return _RunLog(self.logger, self.collect)
+
+    def log(self, level: int, msg: str, *args: Any, prefix: Optional[str] = None):
+        if self.collect:
+            if prefix is None:
+                prefix = self._PREFIXES[level]
+            self.messages.append(prefix + (msg % args if args else msg))
+        elif self.logger.isEnabledFor(level):
+            self.logger.log(level, msg, *args)
+
+    def info(self, msg: str, *args: Any):
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg: str, *args: Any):
+        self.log(logging.WARNING, msg, *args)
+
+    def error(self, msg: str, *args: Any):
+        self.log(logging.ERROR, msg, *args)
+
 
 class Orchestrator:
     def __init__(
@@ -33,18 +313,32 @@ class Orchestrator:
         validator: Validator = None,
         catalog_filepath="config/compute_capability_catalog.json",
         load_catalog_on_init=True,
+        max_agents: int = DEFAULT_MAX_POOLED_AGENTS,
     ):  # Validator optional, added load_catalog_on_init
         self.kernel_service = kernel_service  # Added
         self.validator = validator
-        self.compute_catalog = {}  # Initialize as empty dict
+        # Capability entries keyed by id; entries are read-only views of the catalog file.
+        self.compute_catalog: Mapping[str, Mapping[str, Any]] = {}
+        self._empty_catalog_warned = False  # Empty-catalog warning already logged
         self.capability_function_map: Dict[str, Callable] = (
             {}
         )  # Kept for mixed workflows
         self.agents: Dict[str, Type[Agent]] = {}  # Added for agent classes
-        self.agent_instances: Dict[str, Agent] = (
-            {}
-        )  # Added for active agent instances per run
+        # Idle pooled agent instances, reused across runs. A run checks an
+        # instance out (resetting it) and returns it when it ends. Kept in
+        # least-recently-used order and bounded by max_agents.
+        self.agent_instances: "OrderedDict[str, Agent]" = OrderedDict()
+        self._max_agents = max_agents
+        # Memoized run_cacm results, keyed by instance hash and run options.
+        self._run_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
         self.logger = logging.getLogger("Orchestrator")  # Initialize logger
+        # Kernel functions resolved from kernel.plugins, keyed by (plugin, function)
+        self._kernel_functions: Dict[Tuple[str, str], Any] = {}
+        self._kernel_functions_owner: Any = None  # Kernel the cache was filled from
+        # Direct execution paths used by execute_cacm, keyed by template file name
+        self._template_fast_paths: Dict[
+            str, Callable[[dict, dict, List[str]], Dict[str, Any]]
+        ] = {"basic_ratio_analysis_template.json": self._execute_basic_ratio_analysis}
 
         if load_catalog_on_init:  # Conditional loading
             self.load_compute_capability_catalog(catalog_filepath)
@@ -56,26 +350,8 @@ class Orchestrator:
         self._register_placeholder_agents()  # Register agent classes
 
     def _register_placeholder_agents(self):
-        """Imports and registers known agent classes."""
-        from cacm_adk_core.agents.data_ingestion_agent import DataIngestionAgent
-        from cacm_adk_core.agents.analysis_agent import AnalysisAgent
-        from cacm_adk_core.agents.report_generation_agent import ReportGenerationAgent
-
-        # FundamentalAnalystAgent and SNCAnalystAgent are already imported at the top level
-        # DataRetrievalAgent is also imported at the top level
-
-        self.register_agent("DataIngestionAgent", DataIngestionAgent)
-        self.register_agent(
-            "AnalysisAgent", AnalysisAgent
-        )  # Placeholder, might be replaced or removed if DRA is the one
-        self.register_agent("ReportGenerationAgent", ReportGenerationAgent)
-        self.register_agent("FundamentalAnalystAgent", FundamentalAnalystAgent)
-        self.register_agent("SNCAnalystAgent", SNCAnalystAgent)
-        self.register_agent("DataRetrievalAgent", DataRetrievalAgent)
-        self.register_agent("CatalystWrapperAgent", CatalystWrapperAgent)
-        self.register_agent(
-            "KnowledgeGraphAgent", KnowledgeGraphAgent
-        )  # Added KnowledgeGraphAgent registration
+        """Registers the known agent classes from the module-level default registry."""
+        self.agents.update(_DEFAULT_AGENT_REGISTRY)
         print(f"INFO: Orchestrator: Registered {len(self.agents)} agent types.")
 
     def register_agent(self, agent_name_key: str, agent_class: Type[Agent]):
@@ -85,32 +361,60 @@ class Orchestrator:
                 f"Cannot register {agent_class.__name__}: not a subclass of Agent."
             )
         self.agents[agent_name_key] = agent_class
+        # Drop any pooled instance built from a previously registered class.
+        self.agent_instances.pop(agent_name_key, None)
+        self._run_cache.clear()
         print(
             f"INFO: Orchestrator: Agent type '{agent_name_key}' registered with class {agent_class.__name__}."
         )
 
+    def register_template_fast_path(
+        self,
+        template_filename: str,
+        executor: Callable[[dict, dict, List[str]], Dict[str, Any]],
+    ):
+        """
+        Registers a direct execution path used by execute_cacm for a template.
+
+        Args:
+            template_filename (str): File name of the template, e.g.
+                "basic_ratio_analysis_template.json".
+            executor (Callable): Called as executor(template, input_data, log_messages)
+                and returns the execute_cacm result.
+        """
+        self._template_fast_paths[template_filename] = executor
+
     def load_compute_capability_catalog(
         self, catalog_filepath="config/compute_capability_catalog.json"
     ):
+        self._empty_catalog_warned = False
         try:
-            with open(catalog_filepath, "r") as f:
-                data = json.load(f)
-                self.compute_catalog = {
-                    cap["id"]: cap for cap in data.get("computeCapabilities", [])
-                }
-            print(
-                f"INFO: Orchestrator: Loaded {len(self.compute_catalog)} compute capabilities from {catalog_filepath}"
+            # The parsed file is shared through the JSON file cache, so entries are
+            # interned into copies and exposed as read-only mapping proxies.
+            data = load_json_file_cached(catalog_filepath)
+            self._run_cache.clear()
+            compute_catalog = {}
+            for cap in data.get("computeCapabilities", []):
+                cap = _intern_capability(cap)
+                compute_catalog[cap["id"]] = types.MappingProxyType(cap)
+            self.compute_catalog = compute_catalog
+            self.logger.info(
+                "Orchestrator: Loaded %d compute capabilities from %s",
+                len(self.compute_catalog),
+                catalog_filepath,
             )
         except FileNotFoundError:
-            print(
-                f"ERROR: Orchestrator: Compute capability catalog not found at {catalog_filepath}"
+            self.logger.error(
+                "Orchestrator: Compute capability catalog not found at %s",
+                catalog_filepath,
             )
-            self.compute_catalog = {}
+            self.compute_catalog = _EMPTY_CATALOG
         except json.JSONDecodeError:
-            print(
-                f"ERROR: Orchestrator: Could not decode JSON from catalog file {catalog_filepath}"
+            self.logger.error(
+                "Orchestrator: Could not decode JSON from catalog file %s",
+                catalog_filepath,
             )
-            self.compute_catalog = {}
+            self.compute_catalog = _EMPTY_CATALOG
 
     def _register_capabilities(self):  # New method
         log_messages_temp: List[str] = []  # For local logging during registration
@@ -146,19 +450,20 @@ class Orchestrator:
                     )
 
         # Print registration logs to server console (not returned to run_cacm logs)
-        for msg in log_messages_temp:
-            print(msg)
+        # in a single write rather than one print per capability.
+        if log_messages_temp:
+            sys.stdout.write("\n".join(log_messages_temp) + "\n")
 
     def execute_cacm(self, template_path: str, input_data: dict) -> Dict[str, Any]:
         """
         Executes a CACM based on a template file and input data.
-        Focuses on special handling for basic_ratio_analysis_template.json for this task.
+        Only templates with a direct execution path (see register_template_fast_path)
+        are supported; basic_ratio_analysis_template.json is registered by default.
         """
         log_messages: List[str] = []
 
         try:
-            with open(template_path, "r") as f:
-                template = json.load(f)
+            template = load_json_file_cached(template_path)
             log_messages.append(
                 f"INFO: Orchestrator: Successfully loaded template: {template_path}"
             )
@@ -181,512 +486,824 @@ class Orchestrator:
 
         cacm_id_from_template = template.get("cacmId", "UnknownCACM")
 
-        # --- Special Handling for Basic Ratio Analysis Template ---
-        # Using endswith as a simple check for this specific task; robust check would be full path or ID.
-        if template_path.endswith("basic_ratio_analysis_template.json"):
+        executor = self._template_fast_paths.get(os.path.basename(template_path))
+        if executor is not None:
+            return executor(template, input_data, log_messages)
 
-            log_messages.append(
-                f"INFO: Orchestrator: Detected Basic Ratio Analysis Template ('{cacm_id_from_template}'). Using direct execution path."
-            )
+        # Fallback for other templates - indicates not implemented for this specific task scope
+        log_messages.append(
+            f"INFO: Orchestrator: CACM ID '{cacm_id_from_template}' or template path '{template_path}' not specially handled by this simplified execute_cacm."
+        )
+        print("\n".join(log_messages))  # Print logs for debugging this path
+        return {
+            "errors": [
+                f"Execution path for template '{template_path}' (CACM ID: '{cacm_id_from_template}') is not implemented in this version."
+            ],
+            "cacm_id": cacm_id_from_template,
+            "outputs": {},
+        }
 
-            # 1. Extract financialStatementData from top-level input_data
-            # Template defines inputs.financialStatementData
-            financial_statement_data_from_input = input_data.get(
-                "financialStatementData"
-            )
+    def _execute_basic_ratio_analysis(
+        self, template: dict, input_data: dict, log_messages: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Direct execution path for basic_ratio_analysis_template.json.
 
-            if financial_statement_data_from_input is None:
-                err_msg = "Input 'financialStatementData' not found in input_data."
-                log_messages.append(f"ERROR: Orchestrator: {err_msg}")
-                return {
-                    "errors": [err_msg],
-                    "cacm_id": cacm_id_from_template,
-                    "outputs": {},
-                }
-
-            if not isinstance(financial_statement_data_from_input, dict):
-                err_msg = f"'financialStatementData' in input_data is not a valid dictionary, got {type(financial_statement_data_from_input).__name__}."
-                log_messages.append(f"ERROR: Orchestrator: {err_msg}")
-                return {
-                    "errors": [err_msg],
-                    "cacm_id": cacm_id_from_template,
-                    "outputs": {},
-                }
-
-            # 2. Extract roundingPrecision from template's parameters
-            rounding_precision = 2  # Default
-            template_parameters = template.get("parameters", [])
-            if isinstance(template_parameters, list):
-                for param_def in template_parameters:
-                    if isinstance(param_def, dict) and (
-                        param_def.get("paramId") == "roundingPrecision"
-                        or param_def.get("name") == "Rounding Precision"
-                    ):
-                        rounding_precision = param_def.get("defaultValue", 2)
-                        break
-            log_messages.append(
-                f"INFO: Orchestrator: Using rounding precision: {rounding_precision}"
-            )
+        Calls financial_ratios.calculate_basic_ratios with the
+        financialStatementData from `input_data` and the template's
+        roundingPrecision parameter.
+        """
+        cacm_id_from_template = template.get("cacmId", "UnknownCACM")
 
-            # 3. Call the financial_ratios.calculate_basic_ratios function
-            try:
-                result_from_module = financial_ratios.calculate_basic_ratios(
-                    financial_data=financial_statement_data_from_input,  # Pass the nested dict
-                    rounding_precision=rounding_precision,
-                )
-                log_messages.append(
-                    f"INFO: Orchestrator: Called financial_ratios.calculate_basic_ratios. Result: {result_from_module}"
-                )
-            except Exception as e:
-                err_msg = f"Error calling calculate_basic_ratios: {str(e)}"
-                log_messages.append(f"ERROR: Orchestrator: {err_msg}")
-                return {
-                    "errors": [err_msg],
-                    "cacm_id": cacm_id_from_template,
-                    "outputs": {},
-                }
+        log_messages.append(
+            f"INFO: Orchestrator: Detected Basic Ratio Analysis Template ('{cacm_id_from_template}'). Using direct execution path."
+        )
 
-            # 4. Structure the output according to the template's outputs section
-            # Template output schema: {"outputs": {"calculatedRatios": {"type": "object", ...}}}
-            # Module output: {"calculated_ratios": {...ratios...}, "errors": [...]}
+        # 1. Extract financialStatementData from top-level input_data
+        # Template defines inputs.financialStatementData
+        financial_statement_data_from_input = input_data.get("financialStatementData")
 
-            final_cacm_output_payload = {}
-            template_output_schema = template.get("outputs", {})
+        if financial_statement_data_from_input is None:
+            err_msg = "Input 'financialStatementData' not found in input_data."
+            log_messages.append(f"ERROR: Orchestrator: {err_msg}")
+            return {
+                "errors": [err_msg],
+                "cacm_id": cacm_id_from_template,
+                "outputs": {},
+            }
 
-            if (
-                "calculatedRatios" in template_output_schema
-            ):  # Key in template's output schema
-                final_cacm_output_payload["calculatedRatios"] = result_from_module.get(
-                    "calculated_ratios", {}
-                )
-            else:
-                # If template output structure is different, this part would need adjustment
-                # For now, we directly map the module's main result if the key matches.
-                log_messages.append(
-                    f"WARN: Orchestrator: Template output schema does not directly define 'calculatedRatios'. Using module's output structure."
-                )
-                final_cacm_output_payload = result_from_module.get(
-                    "calculated_ratios", {}
-                )
+        if not isinstance(financial_statement_data_from_input, dict):
+            err_msg = f"'financialStatementData' in input_data is not a valid dictionary, got {type(financial_statement_data_from_input).__name__}."
+            log_messages.append(f"ERROR: Orchestrator: {err_msg}")
+            return {
+                "errors": [err_msg],
+                "cacm_id": cacm_id_from_template,
+                "outputs": {},
+            }
 
-            # Consolidate errors
-            orchestrator_errors = []  # For errors generated by orchestrator itself
-            module_errors = result_from_module.get("errors", [])
-            if module_errors:
-                orchestrator_errors.extend(module_errors)
+        # 2. Extract roundingPrecision from template's parameters
+        rounding_precision = 2  # Default
+        template_parameters = template.get("parameters", [])
+        if isinstance(template_parameters, list):
+            for param_def in template_parameters:
+                if isinstance(param_def, dict) and (
+                    param_def.get("paramId") == "roundingPrecision"
+                    or param_def.get("name") == "Rounding Precision"
+                ):
+                    rounding_precision = param_def.get("defaultValue", 2)
+                    break
+        log_messages.append(
+            f"INFO: Orchestrator: Using rounding precision: {rounding_precision}"
+        )
 
-            log_messages.append(
-                f"INFO: Orchestrator: Basic Ratio Analysis execution completed."
+        # 3. Call the financial_ratios.calculate_basic_ratios function
+        try:
+            result_from_module = financial_ratios.calculate_basic_ratios(
+                financial_data=financial_statement_data_from_input,  # Pass the nested dict
+                rounding_precision=rounding_precision,
             )
-            # The return for execute_cacm is just the output payload, errors are illustrative for logging here.
-            # A more robust implementation would have a consistent return type like Tuple[Dict, List[str]]
-            if (
-                orchestrator_errors
-            ):  # If there were errors from the module, include them in a standard way
-                final_cacm_output_payload["execution_errors"] = orchestrator_errors
-
-            return final_cacm_output_payload
-
-        else:
-            # Fallback for other templates - indicates not implemented for this specific task scope
             log_messages.append(
-                f"INFO: Orchestrator: CACM ID '{cacm_id_from_template}' or template path '{template_path}' not specially handled by this simplified execute_cacm."
+                f"INFO: Orchestrator: Called financial_ratios.calculate_basic_ratios. Result: {result_from_module}"
             )
-            print("\n".join(log_messages))  # Print logs for debugging this path
+        except Exception as e:
+            err_msg = f"Error calling calculate_basic_ratios: {str(e)}"
+            log_messages.append(f"ERROR: Orchestrator: {err_msg}")
             return {
-                "errors": [
-                    f"Execution path for template '{template_path}' (CACM ID: '{cacm_id_from_template}') is not implemented in this version."
-                ],
+                "errors": [err_msg],
                 "cacm_id": cacm_id_from_template,
                 "outputs": {},
             }
 
+        # 4. Structure the output according to the template's outputs section
+        # Template output schema: {"outputs": {"calculatedRatios": {"type": "object", ...}}}
+        # Module output: {"calculated_ratios": {...ratios...}, "errors": [...]}
+
+        final_cacm_output_payload = {}
+        template_output_schema = template.get("outputs", {})
+
+        if (
+            "calculatedRatios" in template_output_schema
+        ):  # Key in template's output schema
+            final_cacm_output_payload["calculatedRatios"] = result_from_module.get(
+                "calculated_ratios", {}
+            )
+        else:
+            # If template output structure is different, this part would need adjustment
+            # For now, we directly map the module's main result if the key matches.
+            log_messages.append(
+                f"WARN: Orchestrator: Template output schema does not directly define 'calculatedRatios'. Using module's output structure."
+            )
+            final_cacm_output_payload = result_from_module.get("calculated_ratios", {})
+
+        # Consolidate errors
+        orchestrator_errors = []  # For errors generated by orchestrator itself
+        module_errors = result_from_module.get("errors", [])
+        if module_errors:
+            orchestrator_errors.extend(module_errors)
+
+        log_messages.append(
+            f"INFO: Orchestrator: Basic Ratio Analysis execution completed."
+        )
+        # The return for execute_cacm is just the output payload, errors are illustrative for logging here.
+        # A more robust implementation would have a consistent return type like Tuple[Dict, List[str]]
+        if (
+            orchestrator_errors
+        ):  # If there were errors from the module, include them in a standard way
+            final_cacm_output_payload["execution_errors"] = orchestrator_errors
+
+        return final_cacm_output_payload
+
     async def run_cacm(
-        self, cacm_instance_data: dict
+        self,
+        cacm_instance_data: dict,
+        parallel_steps: bool = False,
+        collect_logs: bool = True,
+        memoize: bool = False,
+        mock_outputs: bool = True,
     ) -> Tuple[bool, List[str], Dict[str, Any]]:
-        log_messages: List[str] = []
+        """
+        Validates and executes a CACM instance.
+
+        Args:
+            cacm_instance_data (dict): The CACM instance to execute.
+            parallel_steps (bool): If True, steps are grouped into waves from the
+                dependencies declared in their `inputBindings` and the steps of a
+                wave run concurrently. Steps running the same agent type are put
+                in separate waves, as the run shares one instance of each agent.
+                Steps that only communicate implicitly through SharedContext must
+                keep the default sequential execution.
+            collect_logs (bool): If True (default), log messages are formatted and
+                returned. If False, they are passed to `self.logger` instead and only
+                formatted when its level is enabled; the returned list is empty.
+            memoize (bool): If True, the result of an identical earlier run (same
+                instance content and options) is returned without validating or
+                executing again. Only use this for workflows whose steps are
+                deterministic and free of side effects the caller relies on. The
+                cache is cleared when the catalog is reloaded or an agent is
+                registered.
+            mock_outputs (bool): If True (default), steps whose capability has no
+                execution path get placeholder values for their output bindings.
+                Callers that only check the success flag can pass False to skip
+                building them; such steps then produce no result, and the bound
+                CACM outputs are absent.
+
+        Returns:
+            Tuple[bool, List[str], Dict[str, Any]]: Success flag, log messages and
+            the collected CACM outputs.
+        """
+        if not memoize:
+            return await self._run_cacm_uncached(
+                cacm_instance_data, parallel_steps, collect_logs, mock_outputs
+            )
+
+        try:
+            cache_key = (
+                hashlib.blake2b(
+                    canonical_json_bytes(cacm_instance_data), digest_size=16
+                ).digest(),
+                parallel_steps,
+                collect_logs,
+                mock_outputs,
+            )
+        except (TypeError, ValueError):  # Not JSON serializable; run uncached
+            return await self._run_cacm_uncached(
+                cacm_instance_data, parallel_steps, collect_logs, mock_outputs
+            )
+
+        cached = self._run_cache.get(cache_key)
+        if cached is not None:
+            self._run_cache.move_to_end(cache_key)
+            success, messages, outputs = cached
+            return success, list(messages), copy.deepcopy(outputs)
+
+        success, messages, outputs = await self._run_cacm_uncached(
+            cacm_instance_data, parallel_steps, collect_logs, mock_outputs
+        )
+        try:
+            outputs_copy = copy.deepcopy(outputs)
+        except Exception:  # Outputs hold uncopyable objects; leave the run uncached
+            return success, messages, outputs
+        self._run_cache[cache_key] = (success, tuple(messages), outputs_copy)
+        if len(self._run_cache) > RUN_CACHE_SIZE:
+            self._run_cache.popitem(last=False)
+        return success, messages, outputs
+
+    def clear_run_cache(self):
+        """Drops all memoized run_cacm results."""
+        self._run_cache.clear()
+
+    async def _run_cacm_uncached(
+        self,
+        cacm_instance_data: dict,
+        parallel_steps: bool,
+        collect_logs: bool,
+        mock_outputs: bool = True,
+    ) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """Validates and executes a CACM instance; see run_cacm for the arguments."""
+        run_agents = _RunAgents()
+        token = _current_run_agents.set(run_agents)
+        try:
+            return await self._execute_run(
+                cacm_instance_data,
+                parallel_steps,
+                collect_logs,
+                mock_outputs,
+                run_agents,
+            )
+        finally:
+            _current_run_agents.reset(token)
+            self._return_run_agents(run_agents)
+
+    async def _execute_run(
+        self,
+        cacm_instance_data: dict,
+        parallel_steps: bool,
+        collect_logs: bool,
+        mock_outputs: bool,
+        run_agents: _RunAgents,
+    ) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """Body of _run_cacm_uncached, run with `run_agents` as the current run's agents."""
+        run_log = _RunLog(self.logger, collect_logs)
         final_cacm_outputs: Dict[str, Any] = {}
         step_outputs: Dict[str, Any] = {}
-        self.agent_instances.clear()  # Clear instances at the start of a new run
-        log_messages.append(
-            "INFO: Orchestrator: Cleared active agent instances for new run_cacm execution."
-        )
 
         # Create SharedContext for this run
         cacm_id = cacm_instance_data.get("cacmId", f"UnknownCACM_{str(uuid.uuid4())}")
         shared_context = SharedContext(cacm_id=cacm_id)
+        # Pooled agents are reset for this context as the run checks them out.
+        run_agents.shared_context = shared_context
         shared_context.set_global_parameter(
             "initial_inputs", cacm_instance_data.get("inputs", {})
         )
-        log_messages.append(
-            f"INFO: Orchestrator: Initialized SharedContext for session {shared_context.get_session_id()} (CACM ID: {shared_context.get_cacm_id()})"
+        run_log.info(
+            "Initialized SharedContext for session %s (CACM ID: %s)",
+            shared_context.get_session_id(),
+            shared_context.get_cacm_id(),
         )
 
         if not self.validator or not self.validator.schema:
-            log_messages.append(
-                "ERROR: Orchestrator: Validator or schema not properly initialized."
-            )
-            return False, log_messages, final_cacm_outputs
+            run_log.error("Validator or schema not properly initialized.")
+            return False, run_log.messages, final_cacm_outputs
 
         is_valid, errors = self.validator.validate_cacm_against_schema(
             cacm_instance_data
         )
         if not is_valid:
-            log_messages.append(
-                "ERROR: Orchestrator: CACM instance is invalid. Cannot execute."
-            )
+            run_log.error("CACM instance is invalid. Cannot execute.")
             for error in errors:
-                log_messages.append(
-                    f"  Validation Error: Path: {'.'.join(map(str, error.get('path',[]))) if error.get('path') else 'N/A'}, Message: {error.get('message', 'N/A')}"
+                run_log.log(
+                    logging.ERROR,
+                    "Validation Error: Path: %s, Message: %s",
+                    (
+                        ".".join(map(str, error.get("path", [])))
+                        if error.get("path")
+                        else "N/A"
+                    ),
+                    error.get("message", "N/A"),
+                    prefix="  ",
                 )
-            return False, log_messages, final_cacm_outputs
-
-        log_messages.append(
-            "INFO: Orchestrator: CACM instance is valid. Starting execution..."
-        )
+            return False, run_log.messages, final_cacm_outputs
+
+        run_log.info("CACM instance is valid. Starting execution...")
+        if not self.compute_catalog and not self._empty_catalog_warned:
+            # Reported once per catalog rather than by every step's catalog lookup.
+            self._empty_catalog_warned = True
+            run_log.warning(
+                "The compute capability catalog is empty; steps referencing catalog capabilities will fail until load_compute_capability_catalog succeeds."
+            )
 
         workflow_steps = cacm_instance_data.get("workflow", [])
         if not workflow_steps:
-            log_messages.append("INFO: Orchestrator: Workflow has no steps.")
-
-        for step in workflow_steps:
-            step_id = step.get("stepId", "Unknown Step")
-            description = step.get("description", "No description")
-            capability_ref = step.get("computeCapabilityRef")
+            run_log.info("Workflow has no steps.")
+
+        if parallel_steps:
+            step_waves = _workflow_step_waves(workflow_steps, self._step_agent_type)
+            run_log.info(
+                "Dispatching %s step(s) in %s parallel wave(s).",
+                len(workflow_steps),
+                len(step_waves),
+            )
+        else:
+            step_waves = [[step] for step in workflow_steps]
+
+        for wave in step_waves:
+            # Each step logs into its own list; the lists are merged into the run
+            # log with one extend per step, in workflow order.
+            wave_logs = [run_log.child() for _ in wave]
+            step_runs = [
+                self._run_step(
+                    step,
+                    cacm_instance_data,
+                    shared_context,
+                    step_outputs,
+                    final_cacm_outputs,
+                    step_logs,
+                    mock_outputs,
+                )
+                for step, step_logs in zip(wave, wave_logs)
+            ]
+            if len(step_runs) == 1:
+                # Sequential runs await the step directly instead of wrapping it in a Task.
+                wave_results = [await step_runs[0]]
+            else:
+                wave_results = await asyncio.gather(*step_runs)
+            for step_logs in wave_logs:
+                run_log.messages.extend(step_logs.messages)
+            if not all(wave_results):
+                return False, run_log.messages, final_cacm_outputs
 
-            log_messages.append(
-                f"INFO: Orchestrator: --- Executing Step '{step_id}': {description} ---"
+        # Log final context summary
+        if shared_context:  # Ensure shared_context exists
+            shared_context.log_context_summary()
+            run_log.info(
+                "SharedContext summary logged for session %s",
+                shared_context.get_session_id(),
             )
 
-            if not capability_ref:
-                log_messages.append(
-                    f"ERROR: Orchestrator: Step '{step_id}' is missing 'computeCapabilityRef'. Skipping."
-                )
-                continue
+        run_log.info("Execution completed.")
+        return True, run_log.messages, final_cacm_outputs
 
-            capability_def = self.compute_catalog.get(capability_ref)
-            if not capability_def:
-                log_messages.append(
-                    f"ERROR: Orchestrator: Capability '{capability_ref}' not found in catalog for step '{step_id}'. Skipping."
-                )
-                continue
+    def _step_agent_type(self, step: Dict[str, Any]) -> Optional[str]:
+        """Returns the agent type the step's capability runs, or None."""
+        capability_ref = step.get("computeCapabilityRef")
+        if not isinstance(capability_ref, str):
+            return None
+        capability_def = self.compute_catalog.get(capability_ref)
+        return capability_def.get("agent_type") if capability_def else None
 
-            log_messages.append(
-                f"INFO: Orchestrator:   Compute Capability Ref: {capability_ref}"
+    async def _run_step(
+        self,
+        step: Dict[str, Any],
+        cacm_instance_data: dict,
+        shared_context: SharedContext,
+        step_outputs: Dict[str, Any],
+        final_cacm_outputs: Dict[str, Any],
+        run_log: _RunLog,
+        mock_outputs: bool = True,
+    ) -> bool:
+        """
+        Resolves the inputs of a single workflow step, executes it and maps its outputs.
+
+        Args:
+            step (Dict[str, Any]): The workflow step definition.
+            cacm_instance_data (dict): The CACM instance being executed.
+            shared_context (SharedContext): The shared context of the current run.
+            step_outputs (Dict[str, Any]): Results of completed steps, keyed by stepId.
+                The result of this step is added to it.
+            final_cacm_outputs (Dict[str, Any]): The CACM outputs collected so far.
+                Outputs bound by this step are added to it.
+            run_log (_RunLog): Sink for this step's log messages.
+            mock_outputs (bool): Whether to build placeholder outputs when the
+                capability has no execution path.
+
+        Returns:
+            bool: False if the run must be aborted (e.g. a required input could not
+            be coerced to its declared type), True otherwise.
+        """
+        # Step fields are read once here and used by every stage below
+        step_id = step.get("stepId", "Unknown Step")
+        description = step.get("description", "No description")
+        capability_ref = step.get("computeCapabilityRef")
+        step_input_bindings = step.get("inputBindings") or {}
+        step_output_bindings = step.get("outputBindings") or {}
+        # Interned so catalog/step_outputs lookups hit the identity fast path
+        if isinstance(step_id, str):
+            step_id = sys.intern(step_id)
+        if isinstance(capability_ref, str):
+            capability_ref = sys.intern(capability_ref)
+
+        run_log.info("--- Executing Step '%s': %s ---", step_id, description)
+
+        if not capability_ref:
+            run_log.error(
+                "Step '%s' is missing 'computeCapabilityRef'. Skipping.", step_id
             )
-            agent_type = capability_def.get("agent_type")
-
-            current_step_result_data: Optional[Dict[str, Any]] = None
-
-            # Prepare context_data for agents or function_args for skills
-            # This logic is common for both agent and skill execution paths
-            # It resolves input bindings from cacm.inputs or previous steps.
-            # For simplicity, we'll pass all resolved inputs as context_data to agents,
-            # and filter them into function_args for direct skill calls.
-
-            resolved_inputs: Dict[str, Any] = {}
-            step_input_bindings = step.get("inputBindings", {})
-            for cap_input_def in capability_def.get("inputs", []):
-                param_name = cap_input_def["name"]
-                param_type = cap_input_def["type"]  # For potential type coercion
-                is_optional = cap_input_def.get("optional", False)
-
-                binding_value_source = step_input_bindings.get(param_name)
-                resolved_value: Any = None
-                value_found = False
-
-                if binding_value_source:
-                    if isinstance(
-                        binding_value_source, str
-                    ) and binding_value_source.startswith("cacm.inputs."):
-                        key_parts = binding_value_source.split("cacm.inputs.")[
-                            -1
-                        ].split(".")
-                        current_data_val = cacm_instance_data.get("inputs", {})
-                        for i, part in enumerate(key_parts):
-                            if isinstance(current_data_val, dict):
-                                current_data_val = current_data_val.get(part)
-                            else:
-                                current_data_val = None
-                                break
-                        if current_data_val is not None:
-                            resolved_value = (
-                                current_data_val.get("value")
-                                if isinstance(current_data_val, dict)
-                                and "value" in current_data_val
-                                else current_data_val
-                            )
-                            value_found = True
-                    elif isinstance(
-                        binding_value_source, str
-                    ) and binding_value_source.startswith("steps."):
-                        parts = binding_value_source.split(".")
-                        if (
-                            len(parts) == 4 and parts[1] and parts[3]
-                        ):  # steps.stepA.outputs.result
-                            prev_step_id, _, prev_output_name = (
-                                parts[1],
-                                parts[2],
-                                parts[3],
-                            )
-                            resolved_value = step_outputs.get(prev_step_id, {}).get(
-                                prev_output_name
-                            )
-                            if resolved_value is not None:
-                                value_found = True
-                        else:
-                            log_messages.append(
-                                f"WARN: Orchestrator: Invalid step binding format: {binding_value_source}"
-                            )
-                    elif isinstance(
-                        binding_value_source, str
-                    ) and binding_value_source.startswith("cacm.outputs."):
-                        output_key = binding_value_source.split("cacm.outputs.")[-1]
-                        # final_cacm_outputs stores these as {"value": ..., "description": ...}
-                        # The agent input should receive the actual "value"
-                        output_entry = final_cacm_outputs.get(output_key)
-                        if output_entry is not None and isinstance(output_entry, dict):
-                            resolved_value = output_entry.get("value")
-                            value_found = True
-                        else:
-                            log_messages.append(
-                                f"WARN: Orchestrator: CACM output binding '{binding_value_source}' not found or not in expected format in final_cacm_outputs."
-                            )
-                    elif isinstance(
-                        binding_value_source, str
-                    ) and binding_value_source.startswith("shared_context."):
-                        context_key = binding_value_source.split("shared_context.")[-1]
-                        resolved_value = shared_context.get_data(context_key)
-                        if resolved_value is not None:
-                            value_found = True
-                            log_messages.append(
-                                f"INFO: Orchestrator: Resolved '{binding_value_source}' from SharedContext."
-                            )
-                        else:
-                            log_messages.append(
-                                f"WARN: Orchestrator: Value for '{binding_value_source}' not found in SharedContext."
-                            )
-                    else:  # Direct value
-                        resolved_value = binding_value_source
-                        value_found = True
-
-                if value_found:
-                    # Basic type coercion (can be expanded)
-                    try:
-                        if param_type == "float" and resolved_value is not None:
-                            resolved_value = float(resolved_value)
-                        elif param_type == "integer" and resolved_value is not None:
-                            resolved_value = int(resolved_value)
-                        resolved_inputs[param_name] = resolved_value
-                    except ValueError as ve:
-                        log_messages.append(
-                            f"ERROR: Orchestrator: Type coercion failed for param '{param_name}' (value: {resolved_value}) to type '{param_type}': {ve}"
-                        )
-                        if not is_optional:
-                            return False, log_messages, final_cacm_outputs
-                        resolved_inputs[param_name] = None  # Or default
-                elif not is_optional:
-                    log_messages.append(
-                        f"ERROR: Orchestrator: Missing required input '{param_name}' for {capability_ref} in step '{step_id}'."
-                    )
-                    # Halt or mark step as failed
-                    # For now, we'll let it proceed and the agent/function might fail
+            return True
+
+        capability_def = self.compute_catalog.get(capability_ref)
+        if not capability_def:
+            run_log.error(
+                "Capability '%s' not found in catalog for step '%s'. Skipping.",
+                capability_ref,
+                step_id,
+            )
+            return True
+
+        run_log.info("  Compute Capability Ref: %s", capability_ref)
+        # Execution path fields, each probed once per step
+        agent_type = capability_def.get("agent_type")
+        plugin_name = capability_def.get("skill_plugin_name")
+        function_name = capability_def.get("skill_function_name")
+        legacy_function = (
+            None
+            if agent_type or (plugin_name and function_name)
+            else self.capability_function_map.get(capability_ref)
+        )
 
-            if agent_type:
-                log_messages.append(
-                    f"INFO: Orchestrator: Attempting to execute Agent '{agent_type}' for capability '{capability_ref}'."
+        current_step_result_data: Optional[Dict[str, Any]] = None
+
+        # Prepare context_data for agents or function_args for skills
+        # This logic is common for both agent and skill execution paths
+        # It resolves input bindings from cacm.inputs or previous steps.
+        # For simplicity, we'll pass all resolved inputs as context_data to agents,
+        # and filter them into function_args for direct skill calls.
+
+        resolved_inputs: Dict[str, Any] = {}
+        for cap_input_def in capability_def.get("inputs", []):
+            param_name = cap_input_def["name"]
+            param_type = cap_input_def["type"]  # For potential type coercion
+            is_optional = cap_input_def.get("optional", False)
+
+            binding_value_source = step_input_bindings.get(param_name)
+            resolved_value: Any = None
+            value_found = False
+
+            if binding_value_source:
+                # JSON references are always plain str; other values are literals
+                binding_prefix = (
+                    _binding_prefix(binding_value_source)
+                    if type(binding_value_source) is str
+                    else None
                 )
-                agent_class = self.agents.get(agent_type)
-                if agent_class:
-                    # Get or create agent instance for this run
-                    if agent_type in self.agent_instances:
-                        agent_instance = self.agent_instances[agent_type]
-                        log_messages.append(
-                            f"INFO: Orchestrator: Reusing existing instance of agent '{agent_type}'."
+                if binding_prefix == _CACM_INPUTS_PREFIX:
+                    current_data_val = _walk_input_path(
+                        cacm_instance_data.get("inputs", {}),
+                        _input_binding_path(binding_value_source),
+                    )
+                    if current_data_val is not None:
+                        resolved_value = (
+                            current_data_val.get("value")
+                            if isinstance(current_data_val, dict)
+                            and "value" in current_data_val
+                            else current_data_val
+                        )
+                        value_found = True
+                elif binding_prefix == _STEPS_PREFIX:
+                    step_ref = _step_output_ref(binding_value_source)
+                    if step_ref is not None:  # steps.stepA.outputs.result
+                        prev_step_id, prev_output_name = step_ref
+                        resolved_value = step_outputs.get(prev_step_id, {}).get(
+                            prev_output_name
                         )
+                        if resolved_value is not None:
+                            value_found = True
                     else:
-                        log_messages.append(
-                            f"INFO: Orchestrator: Creating new instance of agent '{agent_type}'."
+                        run_log.warning(
+                            "Invalid step binding format: %s", binding_value_source
                         )
-                        agent_instance = agent_class(self.kernel_service)
-                        agent_instance.set_agent_manager(
-                            self
-                        )  # Set the orchestrator as manager
-                        self.agent_instances[agent_type] = agent_instance
-
-                    # Task description could come from step.description or capability_def.task_details_from_capability
-                    task_desc_from_step = description
-                    task_desc_from_cap = capability_def.get(
-                        "task_details_from_capability", f"Execute {capability_ref}"
-                    )
-                    effective_task_desc = (
-                        f"{task_desc_from_step} (Detail: {task_desc_from_cap})"
-                    )
-
-                    try:
-                        # Agent's run method now receives resolved_inputs as current_step_inputs and shared_context
-                        current_step_result_data = await agent_instance.run(
-                            effective_task_desc, resolved_inputs, shared_context
+                elif binding_prefix == _CACM_OUTPUTS_PREFIX:
+                    output_key = binding_value_source[_CACM_OUTPUTS_PREFIX_LEN:]
+                    # final_cacm_outputs stores these as {"value": ..., "description": ...}
+                    # The agent input should receive the actual "value"
+                    output_entry = final_cacm_outputs.get(output_key)
+                    if output_entry is not None and isinstance(output_entry, dict):
+                        resolved_value = output_entry.get("value")
+                        value_found = True
+                    else:
+                        run_log.warning(
+                            "CACM output binding '%s' not found or not in expected format in final_cacm_outputs.",
+                            binding_value_source,
                         )
-                        log_messages.append(
-                            f"INFO: Orchestrator: Agent '{agent_type}' executed. Result: {current_step_result_data}"
+                elif binding_prefix == _SHARED_CONTEXT_PREFIX:
+                    context_key = binding_value_source[_SHARED_CONTEXT_PREFIX_LEN:]
+                    resolved_value = shared_context.get_data(context_key)
+                    if resolved_value is not None:
+                        value_found = True
+                        run_log.info(
+                            "Resolved '%s' from SharedContext.", binding_value_source
                         )
-                    except Exception as e:
-                        log_messages.append(
-                            f"ERROR: Orchestrator: Agent '{agent_type}' execution failed: {e}"
+                    else:
+                        run_log.warning(
+                            "Value for '%s' not found in SharedContext.",
+                            binding_value_source,
                         )
-                        # Handle agent error (e.g., stop workflow or mark step as failed)
-                else:
-                    log_messages.append(
-                        f"ERROR: Orchestrator: Agent type '{agent_type}' not found in registered agents. Skipping step."
-                    )
-
-            elif capability_def.get("skill_plugin_name") and capability_def.get(
-                "skill_function_name"
-            ):
-                # SKILL EXECUTION LOGIC (using Kernel)
-                plugin_name = capability_def["skill_plugin_name"]
-                function_name = capability_def["skill_function_name"]
-                log_messages.append(
-                    f"INFO: Orchestrator: Attempting to execute Kernel Skill '{plugin_name}.{function_name}'."
-                )
-                kernel = self.kernel_service.get_kernel()
+                else:  # Direct value
+                    resolved_value = binding_value_source
+                    value_found = True
+
+            if value_found:
+                # Basic type coercion (can be expanded); values that already have
+                # the target type (the common case for JSON inputs) are left as-is.
+                value_type = type(resolved_value)
                 try:
-                    # Ensure resolved_inputs are packaged into KernelArguments if needed by SK version
-                    # For SK native functions, direct kwarg passing from a dict might work.
-                    # from semantic_kernel.functions.kernel_arguments import KernelArguments
-                    # kernel_args = KernelArguments(**resolved_inputs)
-                    # skill_function = kernel.plugins[plugin_name][function_name]
-                    # result_obj = await kernel.invoke(skill_function, kernel_args)
-                    # current_step_result_data = result_obj.value # Or process result_obj as needed
-
-                    # Simplified direct call assuming native function signature matches resolved_inputs keys
-                    # This needs to be robust based on how SK expects args for registered native functions.
-                    skill_function = kernel.plugins[plugin_name][function_name]
-                    # For native functions, SK might expect parameters directly, not via KernelArguments always.
-                    # The `invoke` method with function object and kwargs (from resolved_inputs) is typical.
-                    result_obj = await kernel.invoke(skill_function, **resolved_inputs)
-
-                    # The result from invoke might be a FunctionResult or directly the value.
-                    # Assuming it's FunctionResult, and .value holds the actual output.
-                    if hasattr(result_obj, "value"):
-                        current_step_result_data = result_obj.value
-                    else:  # If it's the direct value (older SK or specific function types)
-                        current_step_result_data = result_obj
-
-                    log_messages.append(
-                        f"INFO: Orchestrator: Kernel Skill '{plugin_name}.{function_name}' executed. Result: {current_step_result_data}"
-                    )
-                except Exception as e:
-                    log_messages.append(
-                        f"ERROR: Orchestrator: Kernel Skill '{plugin_name}.{function_name}' execution failed: {e}"
+                    if (
+                        param_type == "float"
+                        and value_type is not float
+                        and resolved_value is not None
+                    ):
+                        resolved_value = float(resolved_value)
+                    elif (
+                        param_type == "integer"
+                        and value_type is not int
+                        and resolved_value is not None
+                    ):
+                        resolved_value = int(resolved_value)
+                    resolved_inputs[param_name] = resolved_value
+                except ValueError as ve:
+                    run_log.error(
+                        "Type coercion failed for param '%s' (value: %s) to type '%s': %s",
+                        param_name,
+                        resolved_value,
+                        param_type,
+                        ve,
                     )
+                    if not is_optional:
+                        return False
+                    resolved_inputs[param_name] = None  # Or default
+            elif not is_optional:
+                run_log.error(
+                    "Missing required input '%s' for %s in step '%s'.",
+                    param_name,
+                    capability_ref,
+                    step_id,
+                )
+                # Halt or mark step as failed
+                # For now, we'll let it proceed and the agent/function might fail
+
+        if agent_type:
+            run_log.info(
+                "Attempting to execute Agent '%s' for capability '%s'.",
+                agent_type,
+                capability_ref,
+            )
+            agent_class = self.agents.get(agent_type)
+            if agent_class:
+                # Get the pooled agent instance or create it on first use
+                agent_instance, created = self._get_pooled_agent(agent_type)
+                if created:
+                    run_log.info("Creating new instance of agent '%s'.", agent_type)
+                else:
+                    run_log.info("Reusing existing instance of agent '%s'.", agent_type)
 
-            elif (
-                capability_ref in self.capability_function_map
-            ):  # Fallback to old Python module functions
-                log_messages.append(
-                    f"INFO: Orchestrator: Executing legacy Python function for '{capability_ref}'."
+                # Task description could come from step.description or capability_def.task_details_from_capability
+                task_desc_from_step = description
+                task_desc_from_cap = capability_def.get(
+                    "task_details_from_capability", f"Execute {capability_ref}"
+                )
+                effective_task_desc = (
+                    f"{task_desc_from_step} (Detail: {task_desc_from_cap})"
                 )
-                target_function = self.capability_function_map[capability_ref]
+
                 try:
-                    current_step_result_data = target_function(
-                        **resolved_inputs
-                    )  # Pass resolved inputs
-                    log_messages.append(
-                        f"INFO: Orchestrator: Legacy function '{capability_ref}' executed. Result: {current_step_result_data}"
+                    # Agent's run method now receives resolved_inputs as current_step_inputs and shared_context
+                    current_step_result_data = await agent_instance.run(
+                        effective_task_desc, resolved_inputs, shared_context
                     )
-                except Exception as e:
-                    log_messages.append(
-                        f"ERROR: Orchestrator: Legacy function '{capability_ref}' execution failed: {e}"
+                    run_log.info(
+                        "Agent '%s' executed. Result: %s",
+                        agent_type,
+                        _JsonText(current_step_result_data),
                     )
+                except Exception as e:
+                    run_log.error("Agent '%s' execution failed: %s", agent_type, e)
+                    # Handle agent error (e.g., stop workflow or mark step as failed)
             else:
-                log_messages.append(
-                    f"WARN: Orchestrator: No execution path (Agent, Kernel Skill, or legacy function) found for capability '{capability_ref}'. Mocking outputs if any."
+                run_log.error(
+                    "Agent type '%s' not found in registered agents. Skipping step.",
+                    agent_type,
+                )
+
+        elif plugin_name and function_name:
+            # SKILL EXECUTION LOGIC (using Kernel)
+            run_log.info(
+                "Attempting to execute Kernel Skill '%s.%s'.",
+                plugin_name,
+                function_name,
+            )
+            kernel = self.kernel_service.get_kernel()
+            try:
+                # Ensure resolved_inputs are packaged into KernelArguments if needed by SK version
+                # For SK native functions, direct kwarg passing from a dict might work.
+                # from semantic_kernel.functions.kernel_arguments import KernelArguments
+                # kernel_args = KernelArguments(**resolved_inputs)
+                # skill_function = kernel.plugins[plugin_name][function_name]
+                # result_obj = await kernel.invoke(skill_function, kernel_args)
+                # current_step_result_data = result_obj.value # Or process result_obj as needed
+
+                # Simplified direct call assuming native function signature matches resolved_inputs keys
+                # This needs to be robust based on how SK expects args for registered native functions.
+                skill_function = self._get_kernel_function(
+                    kernel, plugin_name, function_name
+                )
+                # For native functions, SK might expect parameters directly, not via KernelArguments always.
+                # The `invoke` method with function object and kwargs (from resolved_inputs) is typical.
+                result_obj = await kernel.invoke(skill_function, **resolved_inputs)
+
+                # The result from invoke might be a FunctionResult or directly the value.
+                # Assuming it's FunctionResult, and .value holds the actual output.
+                if hasattr(result_obj, "value"):
+                    current_step_result_data = result_obj.value
+                else:  # If it's the direct value (older SK or specific function types)
+                    current_step_result_data = result_obj
+
+                run_log.info(
+                    "Kernel Skill '%s.%s' executed. Result: %s",
+                    plugin_name,
+                    function_name,
+                    _JsonText(current_step_result_data),
+                )
+            except Exception as e:
+                run_log.error(
+                    "Kernel Skill '%s.%s' execution failed: %s",
+                    plugin_name,
+                    function_name,
+                    e,
+                )
+
+        elif legacy_function is not None:  # Fallback to old Python module functions
+            run_log.info("Executing legacy Python function for '%s'.", capability_ref)
+            try:
+                current_step_result_data = legacy_function(
+                    **resolved_inputs
+                )  # Pass resolved inputs
+                run_log.info(
+                    "Legacy function '%s' executed. Result: %s",
+                    capability_ref,
+                    _JsonText(current_step_result_data),
+                )
+            except Exception as e:
+                run_log.error(
+                    "Legacy function '%s' execution failed: %s", capability_ref, e
                 )
-                # Mocking logic (if needed for unhandled capabilities that have output bindings)
-                # This part can be simplified or removed if all capabilities must have an execution path.
-                mocked_outputs_for_step = {}
-                for binding_key, cacm_output_ref_str in step.get(
-                    "outputBindings", {}
-                ).items():
-                    if isinstance(
-                        cacm_output_ref_str, str
-                    ) and cacm_output_ref_str.startswith("cacm.outputs."):
-                        output_key = cacm_output_ref_str.split("cacm.outputs.")[-1]
-                        mocked_value = (
-                            f"Mocked for unhandled {capability_ref} -> {binding_key}"
+        elif not mock_outputs:
+            run_log.warning(
+                "No execution path (Agent, Kernel Skill, or legacy function) found for capability '%s'. Output mocking is disabled.",
+                capability_ref,
+            )
+        else:
+            run_log.warning(
+                "No execution path (Agent, Kernel Skill, or legacy function) found for capability '%s'. Mocking outputs if any.",
+                capability_ref,
+            )
+            # Mocking logic (if needed for unhandled capabilities that have output bindings)
+            # This part can be simplified or removed if all capabilities must have an execution path.
+            mocked_outputs_for_step = {}
+            mock_value_prefix = "Mocked for unhandled %s -> " % capability_ref
+            for binding_key, cacm_output_ref_str in step_output_bindings.items():
+                if type(cacm_output_ref_str) is str and cacm_output_ref_str.startswith(
+                    _CACM_OUTPUTS_PREFIX
+                ):
+                    output_key = cacm_output_ref_str[_CACM_OUTPUTS_PREFIX_LEN:]
+                    mocked_value = mock_value_prefix + binding_key
+                    # Ensure the mocked value is stored in a way that step_outputs can use it
+                    # The binding_key is what downstream steps will look for.
+                    mocked_outputs_for_step[binding_key] = mocked_value
+                    final_cacm_outputs[output_key] = {
+                        "value": mocked_value,
+                        "description": f"Mocked output for {output_key}",
+                    }
+            current_step_result_data = mocked_outputs_for_step
+
+        # Store step output
+        if current_step_result_data is not None:
+            # If the function/agent returns a single value but catalog defines specific named outputs,
+            # we need to map it. For now, assume result is a dict if multiple outputs expected.
+            step_outputs[step_id] = current_step_result_data
+
+            # Map to final_cacm_outputs based on step's outputBindings.
+            # Loop invariants are hoisted and the mapped outputs are applied in one update.
+            result_is_dict = isinstance(current_step_result_data, dict)
+            single_output_name = None
+            if not result_is_dict:
+                cap_outputs = capability_def.get("outputs", [])
+                if isinstance(cap_outputs, list) and len(cap_outputs) == 1:
+                    single_output_name = cap_outputs[0].get("name")
+            output_description = "Output from %s via step %s" % (
+                capability_ref,
+                step_id,
+            )
+            mapped_outputs: Dict[str, Any] = {}
+            for (
+                binding_key_in_step_output,
+                cacm_output_ref_str,
+            ) in step_output_bindings.items():
+                if isinstance(
+                    cacm_output_ref_str, str
+                ) and cacm_output_ref_str.startswith(_CACM_OUTPUTS_PREFIX):
+                    output_key_in_cacm = cacm_output_ref_str[_CACM_OUTPUTS_PREFIX_LEN:]
+
+                    # Value to set should come from the current_step_result_data
+                    # The binding_key_in_step_output is the key in the dict returned by the function/agent
+                    if result_is_dict:
+                        value_to_set = current_step_result_data.get(
+                            binding_key_in_step_output
                         )
-                        # Ensure the mocked value is stored in a way that step_outputs can use it
-                        # The binding_key is what downstream steps will look for.
-                        mocked_outputs_for_step[binding_key] = mocked_value
-                        final_cacm_outputs[output_key] = {
-                            "value": mocked_value,
-                            "description": f"Mocked output for {output_key}",
-                        }
-                current_step_result_data = mocked_outputs_for_step
-
-            # Store step output
-            if current_step_result_data is not None:
-                # If the function/agent returns a single value but catalog defines specific named outputs,
-                # we need to map it. For now, assume result is a dict if multiple outputs expected.
-                step_outputs[step_id] = current_step_result_data
-
-                # Map to final_cacm_outputs based on step's outputBindings
-                for binding_key_in_step_output, cacm_output_ref_str in step.get(
-                    "outputBindings", {}
-                ).items():
-                    if isinstance(
-                        cacm_output_ref_str, str
-                    ) and cacm_output_ref_str.startswith("cacm.outputs."):
-                        output_key_in_cacm = cacm_output_ref_str.split("cacm.outputs.")[
-                            -1
-                        ]
-
-                        # Value to set should come from the current_step_result_data
-                        # The binding_key_in_step_output is the key in the dict returned by the function/agent
+                    elif single_output_name == binding_key_in_step_output:
+                        # Handle cases where function returns a single value, and binding key matches that single output name
+                        value_to_set = current_step_result_data
+                    else:
                         value_to_set = None
-                        if isinstance(current_step_result_data, dict):
-                            value_to_set = current_step_result_data.get(
-                                binding_key_in_step_output
-                            )
-                        elif (
-                            len(capability_def.get("outputs", [])) == 1
-                            and capability_def["outputs"][0]["name"]
-                            == binding_key_in_step_output
-                        ):
-                            # Handle cases where function returns a single value, and binding key matches that single output name
-                            value_to_set = current_step_result_data
-
-                        if value_to_set is not None:
-                            # CRITICAL DEBUG LOG
-                            log_msg_detail = f"INFO: Orchestrator: Mapping step output key '{binding_key_in_step_output}' to CACM output key '{output_key_in_cacm}' with value type '{type(value_to_set).__name__}'."
-                            print(
-                                log_msg_detail
-                            )  # Print directly for immediate visibility in test output
-                            log_messages.append(log_msg_detail)
-                            final_cacm_outputs[output_key_in_cacm] = {
-                                "value": value_to_set,
-                                "description": f"Output from {capability_ref} via step {step_id}",
-                            }
-                        else:
-                            log_messages.append(
-                                f"WARN: Orchestrator: Output '{binding_key_in_step_output}' from step '{step_id}' not found in result or was None. Cannot map to CACM output '{output_key_in_cacm}'."
-                            )
-            else:
-                log_messages.append(
-                    f"WARN: Orchestrator: Step '{step_id}' for capability '{capability_ref}' produced no result data (or result was None)."
-                )
 
-        # Log final context summary
-        if shared_context:  # Ensure shared_context exists
-            shared_context.log_context_summary()
-            log_messages.append(
-                f"INFO: Orchestrator: SharedContext summary logged for session {shared_context.get_session_id()}"
+                    if value_to_set is not None:
+                        run_log.info(
+                            "Mapping step output key '%s' to CACM output key '%s' with value type '%s'.",
+                            binding_key_in_step_output,
+                            output_key_in_cacm,
+                            type(value_to_set).__name__,
+                        )
+                        mapped_outputs[output_key_in_cacm] = {
+                            "value": value_to_set,
+                            "description": output_description,
+                        }
+                    else:
+                        run_log.warning(
+                            "Output '%s' from step '%s' not found in result or was None. Cannot map to CACM output '%s'.",
+                            binding_key_in_step_output,
+                            step_id,
+                            output_key_in_cacm,
+                        )
+            final_cacm_outputs.update(mapped_outputs)
+        else:
+            run_log.warning(
+                "Step '%s' for capability '%s' produced no result data (or result was None).",
+                step_id,
+                capability_ref,
             )
 
-        log_messages.append("INFO: Orchestrator: Execution completed.")
-        return True, log_messages, final_cacm_outputs
+        return True
+
+    def _get_kernel_function(self, kernel: Any, plugin_name: str, function_name: str):
+        """
+        Returns kernel.plugins[plugin_name][function_name], resolved once per pair.
+
+        The cache is dropped if the kernel service hands out a different kernel.
+        Lookup errors (KeyError) propagate to the caller as before.
+        """
+        if kernel is not self._kernel_functions_owner:
+            self._kernel_functions.clear()
+            self._kernel_functions_owner = kernel
+        key = (plugin_name, function_name)
+        skill_function = self._kernel_functions.get(key)
+        if skill_function is None:
+            skill_function = kernel.plugins[plugin_name][function_name]
+            self._kernel_functions[key] = skill_function
+        return skill_function
+
+    def _get_pooled_agent(self, agent_name_key: str) -> Tuple[Agent, bool]:
+        """
+        Returns the instance of a registered agent, creating it on first use.
+
+        During a run_cacm call, the run's own instance is returned: on first use
+        in the run it is checked out of the pool (or created) and reset for the
+        run, so concurrent runs never share an instance. Outside a run, the
+        pooled instance is returned.
+
+        This is the only place agent instances are constructed. It is deliberately
+        synchronous: there is no await between the pool lookup and the insert, so
+        concurrent steps or agents on the event loop cannot create duplicates.
+
+        Returns:
+            Tuple[Agent, bool]: The instance and whether it was just created.
+
+        Raises:
+            KeyError: If no agent class is registered under `agent_name_key`.
+        """
+        run_agents = _current_run_agents.get()
+        if run_agents is not None:
+            instance = run_agents.instances.get(agent_name_key)
+            if instance is not None:
+                return instance, False
+            instance = self.agent_instances.pop(agent_name_key, None)
+            created = instance is None
+            if created:
+                instance = self._create_agent(agent_name_key)
+            instance.reset_for_run(run_agents.shared_context)
+            run_agents.instances[agent_name_key] = instance
+            return instance, created
+
+        instance = self.agent_instances.get(agent_name_key)
+        if instance is not None:
+            self.agent_instances.move_to_end(agent_name_key)
+            return instance, False
+        instance = self._create_agent(agent_name_key)
+        self._pool_agent(agent_name_key, instance)
+        return instance, True
+
+    def _create_agent(self, agent_name_key: str) -> Agent:
+        instance = self.agents[agent_name_key](self.kernel_service)
+        instance.set_agent_manager(self)  # Set the orchestrator as manager
+        return instance
+
+    def _pool_agent(self, agent_name_key: str, instance: Agent) -> None:
+        self.agent_instances[agent_name_key] = instance
+        if len(self.agent_instances) > self._max_agents:
+            evicted_key, _ = self.agent_instances.popitem(last=False)
+            self.logger.info("Orchestrator: Evicted pooled agent '%s'.", evicted_key)
+
+    def _return_run_agents(self, run_agents: _RunAgents) -> None:
+        """Returns the agents a finished run checked out to the pool."""
+        for agent_name_key, instance in run_agents.instances.items():
+            # Skip types re-registered during the run, and keep an instance
+            # another run already returned.
+            if (
+                type(instance) is self.agents.get(agent_name_key)
+                and agent_name_key not in self.agent_instances
+            ):
+                self._pool_agent(agent_name_key, instance)
+
+    def clear_agent_instances(self):
+        """Drops all pooled agent instances; they are recreated on next use."""
+        self.agent_instances.clear()
 
     async def get_or_create_agent_instance(
         self,
@@ -697,20 +1314,19 @@ class Orchestrator:
         Retrieves an existing agent instance or creates a new one if not found.
         This is called by agents wanting to communicate with other agents.
         """
-        if agent_name_key in self.agent_instances:
-            self.logger.info(
-                f"Orchestrator: Returning existing instance of agent '{agent_name_key}'."
-            )
-            return self.agent_instances[agent_name_key]
-
         if agent_name_key in self.agents:  # Check against registered agent classes
-            self.logger.info(
-                f"Orchestrator: Dynamically creating new instance of agent '{agent_name_key}'. Context for creation (if any): {context_data_for_creation}"
-            )
-            agent_class = self.agents[agent_name_key]
-            instance = agent_class(self.kernel_service)
-            instance.set_agent_manager(self)
-            self.agent_instances[agent_name_key] = instance
+            instance, created = self._get_pooled_agent(agent_name_key)
+            if created:
+                self.logger.info(
+                    "Orchestrator: Dynamically created new instance of agent '%s'. Context for creation (if any): %s",
+                    agent_name_key,
+                    context_data_for_creation,
+                )
+            else:
+                self.logger.info(
+                    "Orchestrator: Returning existing instance of agent '%s'.",
+                    agent_name_key,
+                )
 
             # Optional: Call a specific initialization method on the agent if it needs context
             # For example: if hasattr(instance, 'custom_init_with_context'):
@@ -719,7 +1335,8 @@ class Orchestrator:
             return instance
         else:
             self.logger.error(
-                f"Orchestrator: Agent class for '{agent_name_key}' not found in registered agents."
+                "Orchestrator: Agent class for '%s' not found in registered agents.",
+                agent_name_key,
             )
             return None
 
@@ -783,7 +1400,8 @@ if __name__ == "__main__":
             template_path=template_file_direct, input_data=sample_input_data_direct
         )
         logger_main.info(
-            f"Orchestrator execute_cacm result:\n{json.dumps(result_direct, indent=2)}"
+            "Orchestrator execute_cacm result:\n%s",
+            dumps_json(result_direct, indent=True),
         )
 
     # --- Test for run_cacm (new asynchronous workflow execution path) ---
@@ -860,8 +1478,7 @@ if __name__ == "__main__":
             )
             return
 
-        with open(msft_workflow_path, "r") as f:
-            msft_cacm_instance = json.load(f)
+        msft_cacm_instance = load_json_file(msft_workflow_path)
 
         logger_main.info(
             f"Loaded MSFT comprehensive workflow from: {msft_workflow_path}"
@@ -874,7 +1491,8 @@ if __name__ == "__main__":
             f"MSFT Comprehensive Analysis test logs:\n" + "\n".join(logs_msft)
         )
         logger_main.info(
-            f"MSFT Comprehensive Analysis test outputs:\n{json.dumps(outputs_msft, indent=2)}"
+            "MSFT Comprehensive Analysis test outputs:\n%s",
+            dumps_json(outputs_msft, indent=True),
         )
 
         # Commenting out other test runs to focus output
@@ -1,4 +1,21 @@
 # cacm_adk_core/param_helper/param_helper.py
+import functools
+import logging
+import types
+from typing import Any, Dict, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=256)
+def _recommend(component_type: str) -> Mapping[str, Any]:
+    """
+    Builds the parameter recommendations for a component type, once per type.
+
+    The result is shared between callers, so it is kept as a read-only mapping.
+    """
+    # Placeholder for actual recommendation logic
+    return types.MappingProxyType({"learning_rate": 0.01, "epochs": 100})
 
 
 class ParamHelper:
@@ -10,13 +27,15 @@ class ParamHelper:
     def __init__(self):
         pass
 
-    def get_param_recommendations(self, component_type: str):
+    def get_param_recommendations(self, component_type: str) -> Dict[str, Any]:
         """
         Provides recommended parameters for a given component type.
+
+        Recommendations are cached per component type; each call returns a
+        new dict the caller may modify.
         """
-        print(f"Getting parameter recommendations for: {component_type}")
-        # Placeholder for actual recommendation logic
-        return {"learning_rate": 0.01, "epochs": 100}
+        logger.debug("Getting parameter recommendations for: %s", component_type)
+        return dict(_recommend(component_type))
 
 
 if __name__ == "__main__":
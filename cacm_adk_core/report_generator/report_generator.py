@@ -1,91 +1,237 @@
 # cacm_adk_core/report_generator/report_generator.py
+from bisect import bisect_left, bisect_right
+import functools
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 import random
+import time
+import types
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Score bands: a score maps to the label at bisect_right(thresholds, score), so
+# each label applies from its lower threshold (inclusive) up to the next one. A
+# NaN score compares false against every threshold and gets the lowest band.
+_SP_THRESH = (500, 550, 600, 650, 700, 750, 800)
+_SP_LABELS = ("CC/C/D or Not Rated", "CCC", "B", "BB", "BBB", "A", "AA", "AAA")
+
+_SNC_THRESH = (400, 500, 600, 700)
+_SNC_LABELS = ("Loss", "Doubtful", "Substandard", "Special Mention", "Pass")
+
+# Candidate outlooks per score band; one is picked at random.
+_OUTLOOK_THRESH = (550, 650, 750)
+_OUTLOOK_CHOICES = (
+    ("Negative", "Developing"),
+    ("Stable", "Negative"),
+    ("Stable", "Positive"),
+    ("Positive", "Stable"),
+)
+
+# Fundamental view sentences: (output key, thresholds, qualifiers, template). The
+# qualifier is picked with bisect_left, so a value must exceed a threshold to
+# move to the next qualifier.
+_FUND_SPECS = (
+    (
+        "profitabilityMetric",
+        (0.05, 0.15),
+        ("weak", "moderate", "strong"),
+        "Profitability (e.g., margin {v:.2%}) appears {q}.",
+    ),
+    (
+        "leverageRatio",
+        (1.5, 3),
+        ("low", "moderate", "high"),
+        "Leverage (e.g., D/E {v:.2f}x) is considered {q}.",
+    ),
+    (
+        "freeCashFlowYield",
+        (0.05,),
+        ("adequate", "strong"),
+        "Free Cash Flow Yield ({v:.2%}) indicates {q} cash generation relative to value.",
+    ),
+)
+
+# Overall assessment per SNC rating.
+_OVERALL_ASSESSMENT_MAP: Mapping[str, str] = types.MappingProxyType(
+    {
+        "Pass": "Low to Moderate Risk",
+        "Special Mention": "Moderate Risk",
+        "Substandard": "Medium-High Risk",
+        "Doubtful": "High Risk",
+        "Loss": "Very High Risk / Default",
+        "Ungraded": "Risk Undetermined",
+    }
+)
+
+# Overall assessment per (S&P rating, SNC rating) pair: the SNC rating decides,
+# except that a "Pass" credit rated AA or better (score >= 750) is "Low Risk".
+_OVERALL_BY_RATINGS: Mapping[Tuple[str, str], str] = types.MappingProxyType(
+    {
+        (sp, snc): (
+            "Low Risk"
+            if snc == "Pass" and sp_idx >= bisect_right(_SP_THRESH, 750)
+            else _OVERALL_ASSESSMENT_MAP[snc]
+        )
+        for sp_idx, sp in enumerate(_SP_LABELS)
+        for snc in _OVERALL_ASSESSMENT_MAP
+    }
+)
+
+# Fixed report header fields, in output order; generatedDate and smeIdentifier
+# are filled in per report on a copy.
+_REPORT_HEADER_TEMPLATE: Mapping[str, Optional[str]] = types.MappingProxyType(
+    {
+        "reportTitle": "SME Credit Score Report (Simulated)",
+        "generatedDate": None,
+        "smeIdentifier": None,
+        "dataSource": "Simulated CACM Execution via ADK",
+    }
+)
+_REPORT_DISCLAIMER = "This is a simulated report based on a predefined CACM template and dynamically mocked outputs from the Orchestrator."
+
+# Last formatted report timestamp: [unix second, ISO 8601 string].
+_TS_CACHE: List[Any] = [None, ""]
+
+
+def _now_iso() -> str:
+    """
+    Returns the current UTC time as an ISO 8601 string with second precision.
+
+    The string only changes once per second, so it is formatted once per second
+    and reused for every report generated within that second.
+    """
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        # Two threads missing at once just format the same string twice.
+        _TS_CACHE[1] = datetime.fromtimestamp(now, timezone.utc).isoformat(
+            timespec="seconds"
+        )
+        _TS_CACHE[0] = now
+    return _TS_CACHE[1]
 
 
 class ReportGenerator:
+    # Regulatory perspective sentence per SNC rating; "{r}" is the rating.
+    _SNC_PERSPECTIVE_TEMPLATES: Mapping[str, str] = types.MappingProxyType(
+        {
+            "Pass": "SNC Perspective: The '{r}' rating suggests the credit is sound with no undue criticism warranted at this time.",
+            "Special Mention": "SNC Perspective: The '{r}' rating indicates potential weaknesses that, if left uncorrected, may result in deterioration of the repayment prospects.",
+            "Substandard": "SNC Perspective: The '{r}' rating means the credit is inadequately protected by the current sound worth and paying capacity of the obligor or of the collateral pledged.",
+            "Doubtful": "SNC Perspective: The '{r}' rating implies that collection or liquidation in full, on the basis of currently existing facts, conditions, and values, is highly questionable and improbable.",
+            "Loss": "SNC Perspective: The '{r}' rating indicates that the asset is considered uncollectible and of such little value that its continuance as a bankable asset is not warranted.",
+        }
+    )
+    _DEFAULT_SNC_PERSPECTIVE = "SNC Perspective: Rating of '{r}' implies significant concerns or an unmapped category."
+
+    # Market sentiment phrase per outlook rating.
+    _MARKET_SENTIMENT_MAP: Mapping[str, str] = types.MappingProxyType(
+        {
+            "Positive": "favorable market conditions and positive industry trends",
+            "Stable": "generally stable market conditions with mixed industry signals",
+            "Negative": "potential headwinds from challenging market conditions or negative industry trends",
+            "Developing": "an evolving market landscape with significant uncertainties",
+            "Uncertain": "a high degree of uncertainty in market and industry forecasts",
+        }
+    )
+    _DEFAULT_MARKET_SENTIMENT = "current economic conditions and industry trends"
+    # "{r}" is the outlook rating, "{s}" its sentiment phrase.
+    _MARKET_OUTLOOK_TEMPLATE = "Market Outlook: The current '{r}' outlook reflects {s}."
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Seed for the reporter's own random generator, which picks the
+                mocked outlooks; pass one for reproducible reports.
+        """
+        # A per-reporter generator avoids the shared module-level instance.
+        self._rng = random.Random(seed)
+
     def _get_output_value(
         self, output_data: Optional[Dict[str, Any]], default: Any = None
     ) -> Any:
-        if isinstance(output_data, dict) and "value" in output_data:
+        # Most inputs are {"value": X} or a bare scalar, so try the subscript
+        # first; scalars raise TypeError and value-less dicts raise KeyError.
+        if output_data is None:
+            return default
+        try:
             return output_data["value"]
-        elif output_data is not None and not isinstance(output_data, dict):
-            return output_data
-        elif isinstance(output_data, dict) and not output_data:
+        except (TypeError, KeyError):
+            # Only an empty dict falls back to the default; falsy scalars
+            # such as 0 or 0.0 are real values.
+            if output_data or not isinstance(output_data, dict):
+                return output_data
             return default
-        elif isinstance(output_data, dict):
-            return output_data if output_data else default
-        return default
 
-    def _map_score_to_sp(self, score: Optional[int]) -> str:
+    # The rating mappers are pure functions of a small input domain, so their
+    # results are memoized per distinct score / rating.
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _map_score_to_sp(score: Optional[int]) -> str:
         if score is None:
             return "Not Rated"
-        if score >= 800:
-            return "AAA"
-        if score >= 750:
-            return "AA"
-        if score >= 700:
-            return "A"
-        if score >= 650:
-            return "BBB"
-        if score >= 600:
-            return "BB"
-        if score >= 550:
-            return "B"
-        if score >= 500:
-            return "CCC"
-        return "CC/C/D or Not Rated"
-
-    def _map_score_to_snc(self, score: Optional[int]) -> str:
+        if score != score:  # NaN
+            return _SP_LABELS[0]
+        return _SP_LABELS[bisect_right(_SP_THRESH, score)]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _map_score_to_snc(score: Optional[int]) -> str:
         if score is None:
             return "Ungraded"
-        if score >= 700:
-            return "Pass"
-        if score >= 600:
-            return "Special Mention"  # Updated
-        if score >= 500:
-            return "Substandard"
-        if score >= 400:
-            return "Doubtful"  # Updated
-        return "Loss"  # Updated
+        if score != score:  # NaN
+            return _SNC_LABELS[0]
+        return _SNC_LABELS[bisect_right(_SNC_THRESH, score)]
 
     def _generate_mocked_outlook(self, score: Optional[int]) -> str:
         if score is None:
             return "Uncertain"
-        if score >= 750:
-            return random.choice(["Positive", "Stable"])
-        if score >= 650:
-            return random.choice(["Stable", "Positive"])
-        if score >= 550:
-            return random.choice(["Stable", "Negative"])
-        return random.choice(["Negative", "Developing"])
+        band = 0 if score != score else bisect_right(_OUTLOOK_THRESH, score)  # NaN
+        return self._rng.choice(_OUTLOOK_CHOICES[band])
+
+    def _extract_fundamental_metrics(
+        self, mocked_outputs: Dict[str, Any]
+    ) -> Dict[str, Optional[float]]:
+        """
+        Returns the numeric value of each fundamental metric (keyed as in
+        _FUND_SPECS), or None where it is missing or not a number.
+        """
+        metrics: Dict[str, Optional[float]] = {}
+        get_output_value = self._get_output_value
+        for key, _, _, _ in _FUND_SPECS:
+            value = (
+                get_output_value(mocked_outputs[key]) if key in mocked_outputs else None
+            )
+            metrics[key] = value if isinstance(value, (float, int)) else None
+        return metrics
 
     def _generate_fundamental_perspective(
         self,
         score: Optional[int],
         mocked_outputs: Dict[str, Any],
         cacm_inputs: Optional[Dict[str, Any]],
+        metrics: Optional[Dict[str, Optional[float]]] = None,
     ) -> str:
+        """
+        Args:
+            metrics: Values from _extract_fundamental_metrics, if the caller
+                already has them; otherwise they are extracted here.
+        """
+        if metrics is None:
+            metrics = self._extract_fundamental_metrics(mocked_outputs)
         parts = []
-        profitability = self._get_output_value(
-            mocked_outputs.get("profitabilityMetric")
-        )
-        leverage = self._get_output_value(mocked_outputs.get("leverageRatio"))
-        fcf_yield = self._get_output_value(mocked_outputs.get("freeCashFlowYield"))
-
-        if profitability is not None and isinstance(profitability, (float, int)):
-            parts.append(
-                f"Profitability (e.g., margin {profitability:.2%}) appears {'strong' if profitability > 0.15 else 'moderate' if profitability > 0.05 else 'weak'}."
-            )
-        if leverage is not None and isinstance(leverage, (float, int)):
-            parts.append(
-                f"Leverage (e.g., D/E {leverage:.2f}x) is considered {'high' if leverage > 3 else 'moderate' if leverage > 1.5 else 'low'}."
-            )
-        if fcf_yield is not None and isinstance(fcf_yield, (float, int)):
-            parts.append(
-                f"Free Cash Flow Yield ({fcf_yield:.2%}) indicates {'strong' if fcf_yield > 0.05 else 'adequate'} cash generation relative to value."
-            )
+        for key, thresholds, qualifiers, template in _FUND_SPECS:
+            value = metrics[key]
+            if value is not None:
+                parts.append(
+                    template.format(
+                        v=value, q=qualifiers[bisect_left(thresholds, value)]
+                    )
+                )
 
         if not parts:
             return "Fundamental View: Key quantitative financial indicators were not strongly conclusive in the simulated data."
@@ -94,34 +240,32 @@ class ReportGenerator:
     def _generate_regulatory_snc_perspective(
         self, snc_rating: str, score: Optional[int], mocked_outputs: Dict[str, Any]
     ) -> str:
-        if snc_rating == "Pass":
-            return f"SNC Perspective: The '{snc_rating}' rating suggests the credit is sound with no undue criticism warranted at this time."
-        if snc_rating == "Special Mention":
-            return f"SNC Perspective: The '{snc_rating}' rating indicates potential weaknesses that, if left uncorrected, may result in deterioration of the repayment prospects."
-        if snc_rating == "Substandard":
-            return f"SNC Perspective: The '{snc_rating}' rating means the credit is inadequately protected by the current sound worth and paying capacity of the obligor or of the collateral pledged."
-        if snc_rating == "Doubtful":
-            return f"SNC Perspective: The '{snc_rating}' rating implies that collection or liquidation in full, on the basis of currently existing facts, conditions, and values, is highly questionable and improbable."
-        if snc_rating == "Loss":
-            return f"SNC Perspective: The '{snc_rating}' rating indicates that the asset is considered uncollectible and of such little value that its continuance as a bankable asset is not warranted."
-        return f"SNC Perspective: Rating of '{snc_rating}' implies significant concerns or an unmapped category."
+        # Only the rating determines the sentence; score and outputs are unused.
+        return self._snc_perspective_for_rating(snc_rating)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _snc_perspective_for_rating(cls, snc_rating: str) -> str:
+        return cls._SNC_PERSPECTIVE_TEMPLATES.get(
+            snc_rating, cls._DEFAULT_SNC_PERSPECTIVE
+        ).format(r=snc_rating)
 
     def _generate_market_outlook_perspective(
         self, overall_outlook_rating: str, cacm_inputs: Optional[Dict[str, Any]]
     ) -> str:
         # This would ideally use actual market/industry data from cacm_inputs if available
         # For now, provide a generic statement based on the outlook rating
-        market_sentiment_map = {
-            "Positive": "favorable market conditions and positive industry trends",
-            "Stable": "generally stable market conditions with mixed industry signals",
-            "Negative": "potential headwinds from challenging market conditions or negative industry trends",
-            "Developing": "an evolving market landscape with significant uncertainties",
-            "Uncertain": "a high degree of uncertainty in market and industry forecasts",
-        }
-        sentiment = market_sentiment_map.get(
-            overall_outlook_rating, "current economic conditions and industry trends"
+        return self._market_outlook_for_rating(overall_outlook_rating)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _market_outlook_for_rating(cls, overall_outlook_rating: str) -> str:
+        return cls._MARKET_OUTLOOK_TEMPLATE.format(
+            r=overall_outlook_rating,
+            s=cls._MARKET_SENTIMENT_MAP.get(
+                overall_outlook_rating, cls._DEFAULT_MARKET_SENTIMENT
+            ),
         )
-        return f"Market Outlook: The current '{overall_outlook_rating}' outlook reflects {sentiment}."
 
     def _generate_strategic_commentary(
         self, cacm_inputs: Optional[Dict[str, Any]], mocked_outputs: Dict[str, Any]
@@ -148,39 +292,29 @@ class ReportGenerator:
         cacm_inputs: Optional[Dict[str, Any]] = None,
     ) -> Tuple[List[str], str]:
         key_risk_factors: List[str] = []
-        rationale_components: List[str] = []
+        # Extracted once; used for the fundamental view and the risk factors.
+        metrics = self._extract_fundamental_metrics(mocked_outputs)
 
-        rationale_components.append(
-            self._generate_fundamental_perspective(score, mocked_outputs, cacm_inputs)
-        )
-        rationale_components.append(
-            self._generate_regulatory_snc_perspective(snc_rating, score, mocked_outputs)
-        )
-        rationale_components.append(
+        # Each perspective helper always returns a non-empty sentence.
+        rationale_components = [
+            self._generate_fundamental_perspective(
+                score, mocked_outputs, cacm_inputs, metrics
+            ),
+            self._generate_regulatory_snc_perspective(
+                snc_rating, score, mocked_outputs
+            ),
             self._generate_market_outlook_perspective(
                 overall_outlook_rating, cacm_inputs
-            )
-        )
-        rationale_components.append(
-            self._generate_strategic_commentary(cacm_inputs, mocked_outputs)
-        )
+            ),
+            self._generate_strategic_commentary(cacm_inputs, mocked_outputs),
+        ]
 
-        leverage = self._get_output_value(mocked_outputs.get("leverageRatio"))
-        if (
-            leverage is not None
-            and isinstance(leverage, (int, float))
-            and leverage > 3.0
-        ):
+        leverage = metrics["leverageRatio"]
+        if leverage is not None and leverage > 3.0:
             key_risk_factors.append("High financial leverage.")
 
-        profitability = self._get_output_value(
-            mocked_outputs.get("profitabilityMetric")
-        )
-        if (
-            profitability is not None
-            and isinstance(profitability, (int, float))
-            and profitability < 0.05
-        ):
+        profitability = metrics["profitabilityMetric"]
+        if profitability is not None and profitability < 0.05:
             key_risk_factors.append("Weak profitability margins.")
 
         if snc_rating not in ["Pass"]:
@@ -195,7 +329,7 @@ class ReportGenerator:
                 "No overriding individual risk factors identified in this simulation; assessment based on overall profile."
             )
 
-        detailed_rationale = "\n\n".join(filter(None, rationale_components))
+        detailed_rationale = "\n\n".join(rationale_components)
         return key_risk_factors, detailed_rationale
 
     def generate_sme_score_report(
@@ -205,38 +339,106 @@ class ReportGenerator:
         cacm_inputs: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         score = self._get_output_value(mocked_outputs.get("creditScore"))
-        sp_rating = self._map_score_to_sp(score)
-        snc_rating = self._map_score_to_snc(score)
+        return self._assemble_report(
+            mocked_outputs,
+            sme_identifier,
+            cacm_inputs,
+            score,
+            self._map_score_to_sp(score),
+            self._map_score_to_snc(score),
+        )
+
+    def generate_sme_score_reports(
+        self,
+        rows: List[Dict[str, Any]],
+        sme_identifiers: Optional[List[Optional[str]]] = None,
+        cacm_inputs: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generates one SME score report per set of mocked outputs.
+
+        Equivalent to calling generate_sme_score_report for each row, but the
+        credit scores of the whole batch are mapped to S&P and SNC ratings at
+        once (with NumPy when installed).
+
+        Args:
+            rows: The mocked outputs of each SME.
+            sme_identifiers: Identifier per row; "N/A" for all rows if omitted.
+            cacm_inputs: CACM inputs shared by all rows.
+        """
+        if sme_identifiers is None:
+            sme_identifiers = ["N/A"] * len(rows)
+        elif len(sme_identifiers) != len(rows):
+            raise ValueError("sme_identifiers must have one entry per row.")
+        scores = [self._get_output_value(row.get("creditScore")) for row in rows]
+        sp_ratings, snc_ratings = self._map_scores_to_ratings(scores)
+        return [
+            self._assemble_report(
+                row, sme_identifier, cacm_inputs, score, sp_rating, snc_rating
+            )
+            for row, sme_identifier, score, sp_rating, snc_rating in zip(
+                rows, sme_identifiers, scores, sp_ratings, snc_ratings
+            )
+        ]
+
+    def _map_scores_to_ratings(self, scores: List[Any]) -> Tuple[List[str], List[str]]:
+        """
+        Maps a batch of scores to (S&P ratings, SNC ratings).
+
+        Plain int/float scores are bucketed together with np.searchsorted; any
+        other score (None, or a value the scalar mappers reject) goes through
+        _map_score_to_sp / _map_score_to_snc individually.
+        """
+        numeric = [i for i, score in enumerate(scores) if type(score) in (int, float)]
+        if not NUMPY_AVAILABLE or not numeric:
+            return (
+                [self._map_score_to_sp(score) for score in scores],
+                [self._map_score_to_snc(score) for score in scores],
+            )
+        sp_ratings: List[Optional[str]] = [None] * len(scores)
+        snc_ratings: List[Optional[str]] = [None] * len(scores)
+        values = np.array([scores[i] for i in numeric], dtype=float)
+        # searchsorted puts NaN past the last threshold; NaN gets the lowest band.
+        nan = np.isnan(values)
+        sp_idx = np.where(nan, 0, np.searchsorted(_SP_THRESH, values, side="right"))
+        snc_idx = np.where(nan, 0, np.searchsorted(_SNC_THRESH, values, side="right"))
+        sp_idx, snc_idx = sp_idx.tolist(), snc_idx.tolist()
+        for i, sp_i, snc_i in zip(numeric, sp_idx, snc_idx):
+            sp_ratings[i] = _SP_LABELS[sp_i]
+            snc_ratings[i] = _SNC_LABELS[snc_i]
+        for i, score in enumerate(scores):
+            if sp_ratings[i] is None:
+                sp_ratings[i] = self._map_score_to_sp(score)
+                snc_ratings[i] = self._map_score_to_snc(score)
+        return sp_ratings, snc_ratings
+
+    def _assemble_report(
+        self,
+        mocked_outputs: Dict[str, Any],
+        sme_identifier: Optional[str],
+        cacm_inputs: Optional[Dict[str, Any]],
+        score: Any,
+        sp_rating: str,
+        snc_rating: str,
+    ) -> Dict[str, Any]:
+        """Builds the report for one SME from its already mapped ratings."""
         outlook = self._generate_mocked_outlook(score)
 
         key_risk_factors, detailed_rationale = self._generate_mocked_xai_and_rationale(
             score, snc_rating, outlook, mocked_outputs, cacm_inputs
         )
 
-        overall_assessment_map = {
-            "Pass": "Low to Moderate Risk",
-            "Special Mention": "Moderate Risk",
-            "Substandard": "Medium-High Risk",
-            "Doubtful": "High Risk",
-            "Loss": "Very High Risk / Default",
-            "Ungraded": "Risk Undetermined",
-        }
-        snc_rating_for_map = snc_rating  # Use the direct SNC rating string
-        overall_assessment = overall_assessment_map.get(
-            snc_rating_for_map, "Risk Undetermined"
+        overall_assessment = _OVERALL_BY_RATINGS.get(
+            (sp_rating, snc_rating),
+            _OVERALL_ASSESSMENT_MAP.get(snc_rating, "Risk Undetermined"),
         )
-        if score is not None and score >= 750 and snc_rating_for_map == "Pass":
-            overall_assessment = "Low Risk"
+
+        header = dict(_REPORT_HEADER_TEMPLATE)
+        header["generatedDate"] = _now_iso()
+        header["smeIdentifier"] = sme_identifier if sme_identifier else "N/A"
 
         report = {
-            "reportHeader": {
-                "reportTitle": "SME Credit Score Report (Simulated)",
-                "generatedDate": datetime.now(timezone.utc).isoformat(
-                    timespec="seconds"
-                ),
-                "smeIdentifier": sme_identifier if sme_identifier else "N/A",
-                "dataSource": "Simulated CACM Execution via ADK",
-            },
+            "reportHeader": header,
             "creditRating": {
                 "spScaleEquivalent": sp_rating,
                 "sncRegulatoryEquivalent": snc_rating,
@@ -248,7 +450,7 @@ class ReportGenerator:
             "keyRiskFactors_XAI": key_risk_factors,
             "detailedRationale": detailed_rationale,
             "supportingMetrics": mocked_outputs,
-            "disclaimer": "This is a simulated report based on a predefined CACM template and dynamically mocked outputs from the Orchestrator.",
+            "disclaimer": _REPORT_DISCLAIMER,
         }
         return report
 
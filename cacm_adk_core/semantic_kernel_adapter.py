@@ -1,92 +1,197 @@
+import functools
 import os
 import logging
+import threading
+import types
+from typing import Dict, Mapping
+import httpx
+from openai import AsyncOpenAI
 import semantic_kernel as sk
 from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
 from semantic_kernel.functions.kernel_arguments import (
     KernelArguments,
 )  # Added for completeness / if main block is used
+from semantic_kernel.functions.kernel_plugin import KernelPlugin
+
+from cacm_adk_core import llm_throttle
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Connection pool shared by all OpenAI chat completion calls.
+OPENAI_MAX_CONNECTIONS = 256
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 128
+OPENAI_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Plugin classes are resolved once at import time, so building the kernel only
+# instantiates and registers them. Each skill group is imported separately: a
+# group that fails to import is skipped, the others are still registered.
+_SKILL_IMPORT_ERRORS: Dict[str, ImportError] = {}
+
+try:
+    from cacm_adk_core.native_skills import (
+        BasicCalculationSkill,
+        FinancialAnalysisSkill,
+    )
+
+    NATIVE_SKILLS_AVAILABLE = True
+except ImportError as e:
+    NATIVE_SKILLS_AVAILABLE = False
+    _SKILL_IMPORT_ERRORS["native"] = e
+
+try:
+    from processing_pipeline.semantic_kernel_skills import (
+        CustomReportingSkills,
+        SK_MDNA_SummarizerSkill,
+    )  # , SK_RiskAnalysisSkill
+
+    PIPELINE_SKILLS_AVAILABLE = True
+except ImportError as e:
+    PIPELINE_SKILLS_AVAILABLE = False
+    _SKILL_IMPORT_ERRORS["summarization and reporting"] = e
+
+try:
+    from cacm_adk_core.skills.kg_population_skills import KGPopulationSkill
+
+    KG_POPULATION_SKILL_AVAILABLE = True
+except ImportError as e:
+    KG_POPULATION_SKILL_AVAILABLE = False
+    _SKILL_IMPORT_ERRORS["KG population"] = e
+
+try:
+    from cacm_adk_core.skills.esg_analysis_skill import (
+        ESGAnalysisSkill,
+        register_kernel_functions,
+    )
+
+    ESG_ANALYSIS_SKILL_AVAILABLE = True
+except ImportError as e:
+    ESG_ANALYSIS_SKILL_AVAILABLE = False
+    _SKILL_IMPORT_ERRORS["ESG analysis"] = e
+
+SKILLS_AVAILABLE = not _SKILL_IMPORT_ERRORS
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_plugins() -> Mapping[str, KernelPlugin]:
+    """
+    Builds the plugins whose skills do not depend on a particular kernel (and
+    were imported), keyed by plugin name.
+
+    Scanning a skill's kernel functions into a KernelPlugin is done once per
+    process; every kernel built afterwards registers the same plugin objects.
+    """
+    skills = []
+    if NATIVE_SKILLS_AVAILABLE:
+        skills.append(("BasicCalculations", BasicCalculationSkill()))
+        skills.append(("FinancialAnalysis", FinancialAnalysisSkill()))
+    if KG_POPULATION_SKILL_AVAILABLE:
+        skills.append(("KGPopulation", KGPopulationSkill(logger=logger)))
+    if ESG_ANALYSIS_SKILL_AVAILABLE:
+        skills.append(
+            ("ESGAnalysis", register_kernel_functions(ESGAnalysisSkill)(logger=logger))
+        )
+    return types.MappingProxyType(
+        {
+            name: KernelPlugin.from_object(plugin_name=name, plugin_instance=skill)
+            for name, skill in skills
+        }
+    )
 
 
 class KernelService:
+    """
+    Process-wide holder of the Semantic Kernel instance.
+
+    Creating the service is cheap: the kernel (plugin registration and the
+    OpenAI client) is only built on the first get_kernel() call, and only
+    once even when several threads ask for it at the same time.
+    """
+
     _instance = None
+    # Reentrant: plugins constructed during _initialize_kernel may call
+    # KernelService().get_kernel() on the same thread.
+    _lock = threading.RLock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(KernelService, cls).__new__(cls)
-            cls._instance._initialize_kernel()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(KernelService, cls).__new__(cls)
+                    instance._kernel = None
+                    instance._kernel_ready = False
+                    instance._http_client = None
+                    cls._instance = instance
         return cls._instance
 
+    @property
+    def kernel(self):
+        return self.get_kernel()
+
     def _initialize_kernel(self):
         # The Kernel can use the standard Python logging, no need to pass it directly
         # to the constructor in recent versions of semantic-kernel.
         # Logging can be configured globally for the application.
-        self.kernel = sk.Kernel()
-        logger = logging.getLogger(__name__)
-
-        # Import and register native skills
-        try:
-            from cacm_adk_core.native_skills import (
-                BasicCalculationSkill,
-                FinancialAnalysisSkill,
-            )
-
-            self.kernel.add_plugin(
-                BasicCalculationSkill(), plugin_name="BasicCalculations"
-            )
-            self.kernel.add_plugin(
-                FinancialAnalysisSkill(), plugin_name="FinancialAnalysis"
-            )
-            logger.info(
-                "Successfully registered BasicCalculationSkill and FinancialAnalysisSkill."
-            )
-
-            # Register placeholder LLM skills
-            from processing_pipeline.semantic_kernel_skills import (
-                SK_MDNA_SummarizerSkill,
-            )  # , SK_RiskAnalysisSkill
-
-            # Using SK_MDNA_SummarizerSkill for generic text summarization tasks
-            # Its __init__ will try to get the kernel from KernelService itself if one isn't passed.
-            self.kernel.add_plugin(
-                SK_MDNA_SummarizerSkill(), plugin_name="SummarizationSkills"
-            )
-            logger.info("Registered SK_MDNA_SummarizerSkill as SummarizationSkills.")
+        self._kernel = sk.Kernel()
 
-            # Register CustomReportingSkills
-            from processing_pipeline.semantic_kernel_skills import CustomReportingSkills
-
-            # Pass the kernel and logger to CustomReportingSkills instance
-            self.kernel.add_plugin(
-                CustomReportingSkills(kernel=self.kernel, logger_instance=logger),
-                plugin_name="ReportingAnalysisSkills",
-            )  # Fixed: logger_instance
-            logger.info(
-                "Registered CustomReportingSkills with the kernel under plugin ReportingAnalysisSkills."
+        # Register native skills
+        for group, error in _SKILL_IMPORT_ERRORS.items():
+            logger.error(
+                f"Failed to import {group} skills: {error}. Some functions may not be available."
             )
+        try:
+            # Kernel-independent skills are shared; the summarization and
+            # reporting skills hold on to this kernel and are built per kernel.
+            shared_plugins = _shared_plugins()
+            if NATIVE_SKILLS_AVAILABLE:
+                self._kernel.add_plugin(shared_plugins["BasicCalculations"])
+                self._kernel.add_plugin(shared_plugins["FinancialAnalysis"])
+                logger.info(
+                    "Successfully registered BasicCalculationSkill and FinancialAnalysisSkill."
+                )
 
-            # Register KGPopulationSkill
-            from cacm_adk_core.skills.kg_population_skills import KGPopulationSkill
+            if PIPELINE_SKILLS_AVAILABLE:
+                # Register placeholder LLM skills
+                # Using SK_MDNA_SummarizerSkill for generic text summarization tasks
+                # Its __init__ will try to get the kernel from KernelService itself if one isn't passed.
+                self._kernel.add_plugin(
+                    SK_MDNA_SummarizerSkill(), plugin_name="SummarizationSkills"
+                )
+                logger.info(
+                    "Registered SK_MDNA_SummarizerSkill as SummarizationSkills."
+                )
 
-            self.kernel.add_plugin(
-                KGPopulationSkill(logger=logger), plugin_name="KGPopulation"
-            )
-            logger.info(
-                "KGPopulationSkill registered with the kernel as 'KGPopulation'."
-            )
+                # Register CustomReportingSkills
+                # Pass the kernel and logger to CustomReportingSkills instance
+                self._kernel.add_plugin(
+                    CustomReportingSkills(kernel=self._kernel, logger_instance=logger),
+                    plugin_name="ReportingAnalysisSkills",
+                )  # Fixed: logger_instance
+                logger.info(
+                    "Registered CustomReportingSkills with the kernel under plugin ReportingAnalysisSkills."
+                )
 
-            # Register ESGAnalysisSkill
-            from cacm_adk_core.skills.esg_analysis_skill import ESGAnalysisSkill
+            if KG_POPULATION_SKILL_AVAILABLE:
+                # Register KGPopulationSkill
+                self._kernel.add_plugin(shared_plugins["KGPopulation"])
+                logger.info(
+                    "KGPopulationSkill registered with the kernel as 'KGPopulation'."
+                )
 
-            self.kernel.add_plugin(
-                ESGAnalysisSkill(logger=logger), plugin_name="ESGAnalysis"
-            )
-            logger.info("ESGAnalysisSkill registered with the kernel as 'ESGAnalysis'.")
+            if ESG_ANALYSIS_SKILL_AVAILABLE:
+                # Register ESGAnalysisSkill
+                self._kernel.add_plugin(shared_plugins["ESGAnalysis"])
+                logger.info(
+                    "ESGAnalysisSkill registered with the kernel as 'ESGAnalysis'."
+                )
 
-        except ImportError as e:
-            logger.error(
-                f"Failed to import native or placeholder skills: {e}. Some functions may not be available."
-            )
-        except Exception as e:  # Other potential errors during plugin registration
+        except Exception as e:  # Errors during plugin registration
             logger.error(
                 f"Error registering native skills: {e}. Native functions may not be available."
             )
@@ -98,7 +203,7 @@ class KernelService:
         org_id = os.environ.get("OPENAI_ORG_ID")
 
         if not api_key:
-            logging.warning(
+            logger.warning(
                 "OPENAI_API_KEY environment variable not set. OpenAI services will not be available."
             )
             # You might want to raise an error here or handle it differently
@@ -109,9 +214,30 @@ class KernelService:
             # For SK >= 0.9, use add_service.
             # The first argument to OpenAIChatCompletion is ai_model_id.
             # service_id is specified in add_service if needed, or it's auto-named.
-            self.kernel.add_service(
-                OpenAIChatCompletion(
-                    ai_model_id="gpt-3.5-turbo", api_key=api_key, org_id=org_id
+            # One pooled HTTP client (HTTP/2 when h2 is installed) keeps
+            # connections alive across requests; closed by aclose().
+            self._http_client = httpx.AsyncClient(
+                http2=H2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=OPENAI_TIMEOUT,
+            )
+            # Calls are capped per event loop and retried with backoff; see
+            # llm_throttle and set_llm_concurrency(). The OpenAI client's own
+            # retries are off so a failed call is not retried twice over.
+            self._kernel.add_service(
+                llm_throttle.throttle_chat_completion(
+                    OpenAIChatCompletion(
+                        ai_model_id="gpt-3.5-turbo",
+                        async_client=AsyncOpenAI(
+                            api_key=api_key,
+                            organization=org_id,
+                            http_client=self._http_client,
+                            max_retries=0,
+                        ),
+                    )
                 )  # ,
                 # service_id="openai_chat_completion" # Optional: if you need to name it explicitly
             )
@@ -123,7 +249,25 @@ class KernelService:
             # Handle specific exceptions from semantic_kernel if needed
 
     def get_kernel(self):
-        return self.kernel
+        if not self._kernel_ready:
+            with self._lock:
+                # A nested call made while the kernel is being built gets the
+                # partially configured kernel rather than starting over.
+                if self._kernel is None:
+                    self._initialize_kernel()
+                    self._kernel_ready = True
+        return self._kernel
+
+    @staticmethod
+    def set_llm_concurrency(limit: int) -> None:
+        """Sets the maximum number of OpenAI chat completion calls in flight."""
+        llm_throttle.set_llm_concurrency(limit)
+
+    async def aclose(self):
+        """Closes the pooled HTTP client used by the OpenAI service, if any."""
+        http_client, self._http_client = self._http_client, None
+        if http_client is not None:
+            await http_client.aclose()
 
 
 # Example of how to get the kernel instance
@@ -145,8 +289,8 @@ if __name__ == "__main__":
             "Using a DUMMY OpenAI API key for local testing. Real calls will fail."
         )
 
-    kernel_service = KernelService()  # This will trigger _initialize_kernel
-    kernel_instance = kernel_service.get_kernel()
+    kernel_service = KernelService()
+    kernel_instance = kernel_service.get_kernel()  # This triggers _initialize_kernel
 
     if kernel_instance:
         # Check if the chat service was added, which depends on API key being present
@@ -1,6 +1,160 @@
+import asyncio
+import concurrent.futures
+import functools
+import json
 import logging
-from typing import Dict, Any, List, Optional
-from semantic_kernel.functions.kernel_function_decorator import kernel_function # Correct import
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, TypeVar
+
+import pandas as pd
+
+# semantic_kernel (and its pydantic/openai dependency tree) is only imported once
+# the skill is registered with a kernel or asks for LLM assessments, so plain
+# Python use of the summarization does not pay for it.
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.chat_completion_client_base import (
+        ChatCompletionClientBase,
+    )
+
+_logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _deferred_kernel_function(**kwargs: Any) -> Callable[[F], F]:
+    """
+    Marks a method as a kernel function without importing semantic_kernel;
+    register_kernel_functions() applies the real decorator later.
+    """
+
+    def mark(func: F) -> F:
+        func.__deferred_kernel_function__ = kwargs
+        return func
+
+    return mark
+
+
+@functools.lru_cache(maxsize=None)
+def register_kernel_functions(cls: type) -> type:
+    """
+    Applies semantic_kernel's kernel_function decorator to the methods of cls
+    marked with _deferred_kernel_function. Must run before an instance is
+    added to a kernel; KernelService does this. Runs once per class.
+    """
+    from semantic_kernel.functions.kernel_function_decorator import kernel_function
+
+    for attribute in vars(cls).values():
+        kwargs = getattr(attribute, "__deferred_kernel_function__", None)
+        if kwargs is not None:
+            kernel_function(**kwargs)(attribute)  # Sets metadata on the function
+    return cls
+
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Summary bucket per ESG metric type name (the last segment of the type URI).
+_ESG_TYPE_BUCKETS: Dict[str, str] = {
+    "EnvironmentalFactor": "environmental",
+    "CarbonEmission": "environmental",
+    "WaterUsage": "environmental",
+    "SocialFactor": "social",
+    "EmployeeSafetyRecord": "social",
+    "GovernanceFactor": "governance",
+    "BoardIndependenceRatio": "governance",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_metric_type(metric_type_uri: str) -> Tuple[str, Optional[str]]:
+    """
+    Returns (short type name, summary bucket) for a metric type URI; the bucket
+    is None for unclassified types. Cached, as a few type URIs repeat across rows.
+    """
+    # The short name follows the last "#", or the last "/" if there is no "#".
+    if "#" in metric_type_uri:
+        short_name = metric_type_uri.rpartition("#")[2]
+    else:
+        short_name = metric_type_uri.rpartition("/")[2]
+    # Interned like the table's literal keys, so the lookup matches by identity
+    # and every row of this type shares one short-name string.
+    short_name = sys.intern(short_name)
+    return short_name, _ESG_TYPE_BUCKETS.get(short_name)
+
+
+# Result sets with at least this many rows are summarized column-wise with pandas.
+VECTORIZE_MIN_ROWS = 64
+
+# In summarize_many, jobs with at least this many rows are summarized in worker
+# processes; smaller ones run inline, as pickling them would cost more than it saves.
+PROCESS_POOL_MIN_ROWS = 500
+
+# Row fields read by both summarization paths, in unpacking order.
+_KG_RESULT_COLUMNS = ("metric_label", "metric_value", "metric_unit", "metric_type")
+
+# Summary lists that get per-entry LLM commentary.
+_COMMENTED_BUCKETS = ("environmental", "social", "governance", "other_metrics")
+
+# Batched LLM commentary: entries per chat completion, and the token budget of
+# one request (model context window minus the room left for the response).
+ESG_LLM_BATCH_SIZE = 8
+ESG_LLM_CONTEXT_TOKENS = 16385  # gpt-3.5-turbo, as configured in KernelService
+ESG_LLM_RESPONSE_TOKENS = 1024
+
+_ESG_COMMENTARY_SYSTEM_PROMPT = (
+    "You are an ESG credit analyst. For each numbered ESG metric of {company}, "
+    "write a one-sentence assessment of what it means for the company's risk "
+    'profile. Reply with a JSON object {{"summaries": [...]}} holding exactly '
+    "one string per metric, in the order given."
+)
+
+
+def _freeze_lists(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Replaces the list values of mapping with tuples, in place; returns mapping."""
+    for key, value in mapping.items():
+        if isinstance(value, list):
+            mapping[key] = tuple(value)
+    return mapping
+
+
+def _count_tokens(text: str) -> int:
+    """Token count of text; estimated at ~4 characters per token without tiktoken."""
+    if TIKTOKEN_AVAILABLE:
+        return len(_token_encoding().encode(text))
+    return len(text) // 4 + 1
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding():
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _pack_batches(
+    lines: List[str], batch_size: int, token_budget: int
+) -> List[List[int]]:
+    """
+    Groups line indices into batches of at most batch_size lines and at most
+    token_budget tokens; a line over the budget on its own gets its own batch.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for i, line in enumerate(lines):
+        tokens = _count_tokens(line)
+        if current and (
+            len(current) >= batch_size or current_tokens + tokens > token_budget
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
 
 
 class ESGAnalysisSkill:
@@ -9,14 +163,26 @@ class ESGAnalysisSkill:
     factors obtained from Knowledge Graph query results.
     """
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        self.logger = logger or logging.getLogger(self.__class__.__name__)
+    __slots__ = ("logger", "chat_service")
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        chat_service: Optional["ChatCompletionClientBase"] = None,
+    ):
+        """
+        Args:
+            chat_service: Chat completion service for LLM commentary; when
+                omitted, the one configured on KernelService's kernel is used.
+        """
+        self.logger = logger or _logger
+        self.chat_service = chat_service
 
-    @kernel_function(
+    @_deferred_kernel_function(
         description="Summarizes ESG factors from Knowledge Graph query results.",
         name="summarize_esg_factors_from_kg",
     )
-    async def summarize_esg_factors_from_kg(
+    def summarize_esg_factors_from_kg(
         self, kg_query_results: List[Dict[str, Any]], company_name: str
     ) -> Dict[str, Any]:
         """
@@ -36,7 +202,10 @@ class ESGAnalysisSkill:
             company_name (str): Name of the company for context.
 
         Returns:
-            Dict[str, Any]: A dictionary summarizing the ESG factors.
+            Dict[str, Any]: A dictionary summarizing the ESG factors. The
+                category lists and processing notes are tuples, so the
+                summary can be shared (e.g., via SharedContext) without
+                defensive copies.
         """
         self.logger.info(
             f"Starting ESG factor summarization for {company_name} with {len(kg_query_results)} KG results."
@@ -54,94 +223,354 @@ class ESGAnalysisSkill:
 
         if not kg_query_results:
             esg_summary["processing_notes"].append("Received empty KG query results.")
-            return esg_summary
+            return _freeze_lists(esg_summary)
+
+        if len(kg_query_results) >= VECTORIZE_MIN_ROWS:
+            categorized = self._summarize_rows_vectorized(kg_query_results, esg_summary)
+        else:
+            categorized = self._summarize_rows(kg_query_results, esg_summary)
+
+        if not categorized:
+            esg_summary["processing_notes"].append(
+                "No specific ESG factors could be categorized from the provided KG results."
+            )
+
+        self.logger.info(f"Finished ESG factor summarization for {company_name}.")
+        return _freeze_lists(esg_summary)
+
+    @classmethod
+    async def summarize_many(
+        cls,
+        jobs: List[Tuple[List[Dict[str, Any]], str]],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs summarize_esg_factors_from_kg over many (kg_query_results,
+        company_name) jobs, e.g. a portfolio. Jobs with PROCESS_POOL_MIN_ROWS
+        or more rows are summarized in a process pool of max_workers, keeping
+        the pandas work off the event loop and out of the GIL. The others run
+        inline, synchronously on the event loop, while the pool works.
+
+        Returns:
+            List[Dict[str, Any]]: One summary per job, in job order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        offloaded = [
+            i for i, (rows, _) in enumerate(jobs) if len(rows) >= PROCESS_POOL_MIN_ROWS
+        ]
+        loop = asyncio.get_running_loop()
+        executor = (
+            concurrent.futures.ProcessPoolExecutor(max_workers) if offloaded else None
+        )
+        try:
+            futures = [
+                loop.run_in_executor(executor, cls._sync_summarize, *jobs[i])
+                for i in offloaded
+            ]
+            for i, (rows, company_name) in enumerate(jobs):
+                if len(rows) < PROCESS_POOL_MIN_ROWS:
+                    results[i] = cls._sync_summarize(rows, company_name)
+            for i, summary in zip(offloaded, await asyncio.gather(*futures)):
+                results[i] = summary
+        except BaseException:
+            # Don't block the event loop waiting for jobs nobody will read.
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        if executor is not None:
+            # The workers are idle by now; joining them still blocks, so not on the loop.
+            await loop.run_in_executor(None, executor.shutdown)
+        return results
+
+    @classmethod
+    def _sync_summarize(
+        cls, kg_query_results: List[Dict[str, Any]], company_name: str
+    ) -> Dict[str, Any]:
+        # A classmethod of a module-level class, so it pickles to worker processes.
+        return cls().summarize_esg_factors_from_kg(kg_query_results, company_name)
+
+    def _add_overall_rating(
+        self, row: Dict[str, Any], esg_summary: Dict[str, Any]
+    ) -> None:
+        rating_val = row.get(
+            "rating_value", row.get("metric_value")
+        )  # Fallback to metric_value if specific key missing
+        rating_prov = row.get("rating_provider", "N/A")
+        rating_label = row.get("metric_label") or "Overall ESG Rating"
+        esg_summary["overall_ratings"].append(
+            f"{rating_label}: {rating_val} (Provider: {rating_prov})"
+        )
+
+    def _skip_row(self, i: int, row: Dict[str, Any], notes: List[str]) -> None:
+        self.logger.warning(
+            f"Skipping result item {i+1} due to missing label or value: {row}"
+        )
+        notes.append(f"Skipped item {i+1}: missing label or value.")
 
+    def _summarize_rows(
+        self, kg_query_results: List[Dict[str, Any]], esg_summary: Dict[str, Any]
+    ) -> bool:
+        """
+        Adds each result row to its summary list. Returns whether any row was
+        categorized, i.e. not skipped (every other row lands in some list).
+        """
+        categorized = False
+        # Bound once: malformed result sets can skip a large share of their rows.
+        notes = esg_summary["processing_notes"]
+        skip_row = self._skip_row
         for i, row in enumerate(kg_query_results):
-            metric_label = row.get("metric_label")
-            metric_value = row.get("metric_value")
-            metric_unit = row.get("metric_unit", "")  # Optional
-            metric_type_full_uri = row.get(
-                "metric_type"
-            )  # Full URI, e.g., http://.../esg#EnvironmentalFactor
+            # One pass of row.get over the columns; a missing (optional) unit
+            # reads as None and is treated like an empty one. metric_type is the
+            # full type URI, e.g., http://.../esg#EnvironmentalFactor.
+            metric_label, metric_value, metric_unit, metric_type_full_uri = map(
+                row.get, _KG_RESULT_COLUMNS
+            )
 
             # For Overall Ratings (assuming a different query structure or specific type)
             # This part might need adjustment based on how OverallESGRating is queried.
             # Let's assume if 'metric_type' is 'OverallESGRating', then 'rating_value' and 'rating_provider' are primary.
             if metric_type_full_uri and "OverallESGRating" in metric_type_full_uri:
-                rating_val = row.get(
-                    "rating_value", metric_value
-                )  # Fallback to metric_value if specific key missing
-                rating_prov = row.get("rating_provider", "N/A")
-                rating_label = metric_label or "Overall ESG Rating"
-                esg_summary["overall_ratings"].append(
-                    f"{rating_label}: {rating_val} (Provider: {rating_prov})"
-                )
+                self._add_overall_rating(row, esg_summary)
+                categorized = True
                 continue  # Move to next item once processed as overall rating
 
             if not metric_label or metric_value is None:  # metric_value can be 0 or "0"
-                self.logger.warning(
-                    f"Skipping result item {i+1} due to missing label or value: {row}"
-                )
-                esg_summary["processing_notes"].append(
-                    f"Skipped item {i+1}: missing label or value."
-                )
+                skip_row(i, row, notes)
                 continue
 
-            formatted_entry = f"{metric_label}: {metric_value}{' ' + metric_unit if metric_unit else ''}"
+            categorized = True
 
+            # Pick the bucket first, so each entry string is built exactly once.
             if metric_type_full_uri:
                 # Extract the type name from the URI (e.g., "EnvironmentalFactor")
-                metric_type_short = (
-                    metric_type_full_uri.split("#")[-1]
-                    if "#" in metric_type_full_uri
-                    else metric_type_full_uri.split("/")[-1]
-                )
-
-                if (
-                    metric_type_short == "EnvironmentalFactor"
-                    or metric_type_short == "CarbonEmission"
-                    or metric_type_short == "WaterUsage"
-                ):  # etc.
-                    esg_summary["environmental"].append(formatted_entry)
-                elif (
-                    metric_type_short == "SocialFactor"
-                    or metric_type_short == "EmployeeSafetyRecord"
-                ):  # etc.
-                    esg_summary["social"].append(formatted_entry)
-                elif (
-                    metric_type_short == "GovernanceFactor"
-                    or metric_type_short == "BoardIndependenceRatio"
-                ):  # etc.
-                    esg_summary["governance"].append(formatted_entry)
-                else:
+                metric_type_short, bucket = _classify_metric_type(metric_type_full_uri)
+            else:
+                metric_type_short, bucket = "Not Specified", None
+            if bucket is None:
+                if metric_type_full_uri:
                     self.logger.info(
                         f"Metric '{metric_label}' has unclassified type '{metric_type_short}'. Adding to 'other_metrics'."
                     )
-                    esg_summary["other_metrics"].append(
-                        f"{formatted_entry} (Type: {metric_type_short})"
+                else:  # No metric_type provided
+                    self.logger.info(
+                        f"Metric '{metric_label}' has no type specified. Adding to 'other_metrics'."
                     )
-            else:  # No metric_type provided
-                self.logger.info(
-                    f"Metric '{metric_label}' has no type specified. Adding to 'other_metrics'."
+                bucket = "other_metrics"
+                type_suffix = f" (Type: {metric_type_short})"
+            else:
+                type_suffix = ""
+
+            if metric_unit:
+                esg_summary[bucket].append(
+                    f"{metric_label}: {metric_value} {metric_unit}{type_suffix}"
                 )
-                esg_summary["other_metrics"].append(
-                    formatted_entry + " (Type: Not Specified)"
+            else:
+                esg_summary[bucket].append(
+                    f"{metric_label}: {metric_value}{type_suffix}"
                 )
+        return categorized
 
-        if (
-            not esg_summary["environmental"]
-            and not esg_summary["social"]
-            and not esg_summary["governance"]
-            and not esg_summary["overall_ratings"]
-            and not esg_summary["other_metrics"]
+    def _summarize_rows_vectorized(
+        self, kg_query_results: List[Dict[str, Any]], esg_summary: Dict[str, Any]
+    ) -> bool:
+        """
+        Column-wise equivalent of _summarize_rows for large result sets.
+
+        Overall ratings and skipped rows are rare and handled row by row; the
+        entries of all other rows are built and bucketed with pandas. Instead
+        of one log line per unclassified or untyped metric, a single summary
+        line is logged.
+        """
+        # Built column by column with row.get, so a missing key reads as None
+        # while a NaN value stays NaN, as in _summarize_rows.
+        df = pd.DataFrame(
+            {
+                column: [row.get(column) for row in kg_query_results]
+                for column in _KG_RESULT_COLUMNS
+            },
+            dtype=object,
+        )
+        types = df["metric_type"]
+
+        is_rating = types.str.contains(
+            "OverallESGRating", regex=False, na=False
+        ).astype(bool)
+        # Only None counts as a missing value; NaN is formatted like any value.
+        is_skipped = ~is_rating & (
+            ~df["metric_label"].astype(bool)
+            | df["metric_value"].map(lambda value: value is None).astype(bool)
+        )
+        for i in is_rating.to_numpy().nonzero()[0]:
+            self._add_overall_rating(kg_query_results[i], esg_summary)
+        notes = esg_summary["processing_notes"]
+        skip_row = self._skip_row
+        for i in is_skipped.to_numpy().nonzero()[0].tolist():
+            skip_row(i, kg_query_results[i], notes)
+
+        regular = df[~is_rating & ~is_skipped]
+        if regular.empty:
+            return bool(is_rating.any())
+
+        entries = (
+            regular["metric_label"].astype(str)
+            + ": "
+            + regular["metric_value"].astype(str)
+            + regular["metric_unit"].map(lambda unit: f" {unit}" if unit else "")
+        )
+
+        # Classify each distinct type URI once.
+        type_info = {
+            uri: _classify_metric_type(uri)
+            for uri in regular["metric_type"].unique()
+            if uri
+        }
+        short_names = regular["metric_type"].map(
+            {uri: info[0] for uri, info in type_info.items()}
+        )
+        buckets = regular["metric_type"].map(
+            {uri: info[1] for uri, info in type_info.items()}
+        )
+        is_other = buckets.isna()
+        if is_other.any():
+            self.logger.info(
+                f"{int(is_other.sum())} metrics have an unclassified or unspecified type. Adding to 'other_metrics'."
+            )
+        entries = entries.where(
+            ~is_other,
+            entries + " (Type: " + short_names.fillna("Not Specified") + ")",
+        )
+        for bucket, group in entries.groupby(
+            buckets.fillna("other_metrics"), sort=False
         ):
-            esg_summary["processing_notes"].append(
-                "No specific ESG factors could be categorized from the provided KG results."
+            esg_summary[bucket].extend(group.tolist())
+        return True
+
+    def _get_chat_service(self) -> Optional["ChatCompletionClientBase"]:
+        if self.chat_service is not None:
+            return self.chat_service
+        try:
+            # Imported here: KernelService registers this skill at import time.
+            from cacm_adk_core.semantic_kernel_adapter import KernelService
+            from semantic_kernel.connectors.ai.chat_completion_client_base import (
+                ChatCompletionClientBase,
             )
 
-        self.logger.info(f"Finished ESG factor summarization for {company_name}.")
+            return (
+                KernelService().get_kernel().get_service(type=ChatCompletionClientBase)
+            )
+        except Exception as e:  # No kernel or no chat completion service configured
+            self.logger.warning(f"No chat completion service available: {e}")
+            return None
+
+    @_deferred_kernel_function(
+        description="Summarizes ESG factors from Knowledge Graph query results and adds a one-sentence LLM assessment per factor.",
+        name="summarize_esg_factors_batched",
+    )
+    async def summarize_esg_factors_batched(
+        self,
+        kg_query_results: List[Dict[str, Any]],
+        company_name: str,
+        batch_size: int = ESG_LLM_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Like summarize_esg_factors_from_kg, plus an "entry_assessments" dict
+        holding, per summary list, a tuple of one LLM assessment (or None) per
+        entry.
+
+        Entries are sent batch_size at a time (fewer if a batch would exceed
+        the request token budget) in one chat completion per batch, instead
+        of one request per entry; the batches are requested concurrently.
+        """
+        esg_summary = self.summarize_esg_factors_from_kg(kg_query_results, company_name)
+        positions = [
+            (bucket, j)
+            for bucket in _COMMENTED_BUCKETS
+            for j in range(len(esg_summary[bucket]))
+        ]
+        assessments: List[Optional[str]] = [None] * len(positions)
+        notes = list(esg_summary["processing_notes"])
+
+        chat_service = self._get_chat_service() if positions else None
+        if chat_service is None:
+            if positions:
+                notes.append("LLM assessments unavailable: no chat completion service.")
+        else:
+            lines = [f"[{bucket}] {esg_summary[bucket][j]}" for bucket, j in positions]
+            system_prompt = _ESG_COMMENTARY_SYSTEM_PROMPT.format(company=company_name)
+            token_budget = (
+                ESG_LLM_CONTEXT_TOKENS
+                - ESG_LLM_RESPONSE_TOKENS
+                - _count_tokens(system_prompt)
+            )
+            batches = _pack_batches(lines, max(1, batch_size), token_budget)
+            results = await asyncio.gather(
+                *(
+                    self._assess_batch(
+                        chat_service, system_prompt, [lines[i] for i in batch]
+                    )
+                    for batch in batches
+                )
+            )
+            for batch, batch_assessments in zip(batches, results):
+                if batch_assessments is None:
+                    notes.append(f"LLM assessments missing for {len(batch)} entries.")
+                    continue
+                for i, assessment in zip(batch, batch_assessments):
+                    assessments[i] = assessment
+
+        entry_assessments: Dict[str, List[Optional[str]]] = {
+            bucket: [] for bucket in _COMMENTED_BUCKETS
+        }
+        for (bucket, _), assessment in zip(positions, assessments):
+            entry_assessments[bucket].append(assessment)
+        esg_summary["entry_assessments"] = _freeze_lists(entry_assessments)
+        esg_summary["processing_notes"] = tuple(notes)
         return esg_summary
 
+    async def _assess_batch(
+        self,
+        chat_service: "ChatCompletionClientBase",
+        system_prompt: str,
+        lines: List[str],
+    ) -> Optional[List[str]]:
+        """
+        Requests one assessment per line in a single chat completion; returns
+        None if the request fails or the reply is not one string per line.
+        """
+        from semantic_kernel.connectors.ai.open_ai import (
+            OpenAIChatPromptExecutionSettings,
+        )
+        from semantic_kernel.contents import ChatHistory
+
+        chat_history = ChatHistory()
+        chat_history.add_system_message(system_prompt)
+        chat_history.add_user_message(
+            "\n".join(f"{n}. {line}" for n, line in enumerate(lines, 1))
+        )
+        settings = OpenAIChatPromptExecutionSettings(
+            response_format={"type": "json_object"},
+            max_tokens=ESG_LLM_RESPONSE_TOKENS,
+            temperature=0.2,
+        )
+        try:
+            results = await chat_service.get_chat_message_contents(
+                chat_history=chat_history, settings=settings
+            )
+            summaries = json.loads(str(results[0].content))["summaries"]
+        except Exception as e:
+            self.logger.error(f"Batched ESG assessment request failed: {e}")
+            return None
+        if (
+            not isinstance(summaries, list)
+            or len(summaries) != len(lines)
+            or not all(isinstance(summary, str) for summary in summaries)
+        ):
+            self.logger.error(
+                f"Batched ESG assessment reply does not hold {len(lines)} strings."
+            )
+            return None
+        return summaries
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
@@ -205,28 +634,23 @@ if __name__ == "__main__":
         # Missing label, value, type
     ]
 
-    import asyncio
-
-    async def main():
-        print("--- Summarizing Sample ESG KG Results ---")
-        summary_result = await skill.summarize_esg_factors_from_kg(
-            sample_kg_results_esg, "Test Example Corp"
-        )
-        import json
-
-        print(json.dumps(summary_result, indent=2))
+    print("--- Summarizing Sample ESG KG Results ---")
+    summary_result = skill.summarize_esg_factors_from_kg(
+        sample_kg_results_esg, "Test Example Corp"
+    )
+    import json
 
-        print("\n--- Summarizing Empty KG Results ---")
-        summary_empty = await skill.summarize_esg_factors_from_kg(
-            empty_kg_results, "Test Example Corp"
-        )
-        print(json.dumps(summary_empty, indent=2))
+    print(json.dumps(summary_result, indent=2))
 
-        print("\n--- Summarizing KG Results with Missing Data ---")
-        summary_missing = await skill.summarize_esg_factors_from_kg(
-            results_missing_data, "Test Example Corp"
-        )
-        print(json.dumps(summary_missing, indent=2))
+    print("\n--- Summarizing Empty KG Results ---")
+    summary_empty = skill.summarize_esg_factors_from_kg(
+        empty_kg_results, "Test Example Corp"
+    )
+    print(json.dumps(summary_empty, indent=2))
 
-    asyncio.run(main())
+    print("\n--- Summarizing KG Results with Missing Data ---")
+    summary_missing = skill.summarize_esg_factors_from_kg(
+        results_missing_data, "Test Example Corp"
+    )
+    print(json.dumps(summary_missing, indent=2))
 from typing import Optional  # Added to top for logger type hint
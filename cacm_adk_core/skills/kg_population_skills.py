@@ -1,7 +1,17 @@
+import array
+import functools
 import logging
-from typing import Dict, Any, List, Tuple, Optional # Ensure Optional is imported
+import re
+from typing import Dict, Any, BinaryIO, Iterable, List, Tuple, Optional, Union # Ensure Optional is imported
 from semantic_kernel.functions.kernel_function_decorator import kernel_function # Correct import
 
+try:
+    import pyarrow as pa  # type: ignore
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 # Assuming the ontology prefixes are known and consistent
 # These would typically be managed more centrally in a real application
@@ -18,11 +28,56 @@ ONTOLOGY_PREFIXES = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def format_uri(prefix_key: str, term: str) -> str:
     return f"{ONTOLOGY_PREFIXES[prefix_key]}{term}"
 
 
+# Expanded URIs of the fixed terms used by generate_rdf_triples, so the hot path
+# does not re-join prefix and term for every triple.
+RDF_TYPE = format_uri("rdf", "type")
+KGCLASS_OBLIGOR = format_uri("kgclass", "Obligor")
+RDFS_LABEL = format_uri("rdfs", "label")
+KGPROP_HAS_TICKER_SYMBOL = format_uri("kgprop", "hasTickerSymbol")
+KGPROP_HAS_FINANCIALS = format_uri("kgprop", "hasFinancials")
+CACM_ONT_FINANCIAL_STATEMENT = format_uri("cacm_ont", "FinancialStatement")
+KGPROP_HAS_FINANCIAL_ITEM = format_uri("kgprop", "hasFinancialItem")
+KGCLASS_BALANCE_SHEET_ITEM = format_uri("kgclass", "BalanceSheetItem")
+KGPROP_HAS_VALUE = format_uri("kgprop", "hasValue")
+ALTDATA_HAS_UTILITY_PAYMENT_HISTORY = format_uri("altdata", "hasUtilityPaymentHistory")
+ALTDATA_UTILITY_PAYMENT_RECORD = format_uri("altdata", "UtilityPaymentRecord")
+ALTDATA_UTILITY_TYPE = format_uri("altdata", "utilityType")
+ALTDATA_PAYMENT_STATUS = format_uri("altdata", "paymentStatus")
+ALTDATA_PAYMENT_DATE = format_uri("altdata", "paymentDate")
+ALTDATA_HAS_SOCIAL_MEDIA_SENTIMENT = format_uri("altdata", "hasSocialMediaSentiment")
+ALTDATA_SOCIAL_MEDIA_SENTIMENT = format_uri("altdata", "SocialMediaSentiment")
+ALTDATA_SENTIMENT_SCORE = format_uri("altdata", "sentimentScore")
+ALTDATA_SENTIMENT_SOURCE = format_uri("altdata", "sentimentSource")
+ALTDATA_SENTIMENT_DATE = format_uri("altdata", "sentimentDate")
+ESG_HAS_ESG_RATING = format_uri("esg", "hasESGRating")
+ESG_OVERALL_ESG_RATING = format_uri("esg", "OverallESGRating")
+ESG_RATING_VALUE = format_uri("esg", "ratingValue")
+ESG_DATA_SOURCE = format_uri("esg", "dataSource")
+ESG_REPORTS_ESG_METRIC = format_uri("esg", "reportsESGMetric")
+ESG_CARBON_EMISSION = format_uri("esg", "CarbonEmission")
+ESG_METRIC_VALUE = format_uri("esg", "metricValue")
+ESG_METRIC_UNIT = format_uri("esg", "metricUnit")
+ESG_REPORTING_PERIOD = format_uri("esg", "reportingPeriod")
+
+
 def format_literal(value: Any) -> str:
+    """
+    Formats value as an RDF literal term. Equal hashable values of the same
+    type share one cached result string, so repeated literals (e.g. payment
+    statuses) reference a single object across triples and calls.
+    """
+    try:
+        return _format_hashable_literal(value)
+    except TypeError:  # Unhashable, e.g. a list value
+        return _format_literal(value)
+
+
+def _format_literal(value: Any) -> str:
     # Basic literal formatting, could be expanded for specific XSD types
     if isinstance(value, bool):
         return str(value).lower()  # "true" or "false"
@@ -32,12 +87,254 @@ def format_literal(value: Any) -> str:
     return f'"{str(value)}"'
 
 
+# Enumerated values (payment statuses, units, ratings, ...) recur across records
+# and companies. typed=True: True, 1 and 1.0 are equal keys but format differently.
+_format_hashable_literal = functools.lru_cache(maxsize=4096, typed=True)(
+    _format_literal
+)
+
+
+class PredicateDict:
+    """
+    Dictionary encoding of predicate URIs: each distinct URI gets a small
+    integer ID, in order of first encounter.
+    """
+
+    __slots__ = ("_ids", "uris")
+
+    def __init__(self, uris: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self.uris: List[str] = []
+        for uri in uris:
+            self.encode(uri)
+
+    def __len__(self) -> int:
+        return len(self.uris)
+
+    def encode(self, uri: str) -> int:
+        uri_id = self._ids.get(uri)
+        if uri_id is None:
+            uri_id = self._ids[uri] = len(self.uris)
+            self.uris.append(uri)
+        return uri_id
+
+    def decode(self, uri_id: int) -> str:
+        return self.uris[uri_id]
+
+
+# Keys of financial_data_for_ratios_expanded that describe the data, not items.
+_FINANCIAL_METADATA_KEYS = frozenset(("source", "period_y1_label", "period_y2_label"))
+
+
+# rdfs:label literals of financial item keys; bulk ingests see the same keys
+# company after company.
+@functools.lru_cache(maxsize=1024)
+def _financial_item_label(key: str) -> str:
+    return format_literal(key.replace("_", " ").title())
+
+# Predicates emitted by generate_rdf_triples. Registered up front, so every
+# KGPopulationSkill assigns them the same IDs.
+PREDICATE_URIS = (
+    RDF_TYPE,
+    RDFS_LABEL,
+    KGPROP_HAS_TICKER_SYMBOL,
+    KGPROP_HAS_FINANCIALS,
+    KGPROP_HAS_FINANCIAL_ITEM,
+    KGPROP_HAS_VALUE,
+    ALTDATA_HAS_UTILITY_PAYMENT_HISTORY,
+    ALTDATA_UTILITY_TYPE,
+    ALTDATA_PAYMENT_STATUS,
+    ALTDATA_PAYMENT_DATE,
+    ALTDATA_HAS_SOCIAL_MEDIA_SENTIMENT,
+    ALTDATA_SENTIMENT_SCORE,
+    ALTDATA_SENTIMENT_SOURCE,
+    ALTDATA_SENTIMENT_DATE,
+    ESG_HAS_ESG_RATING,
+    ESG_RATING_VALUE,
+    ESG_DATA_SOURCE,
+    ESG_REPORTS_ESG_METRIC,
+    ESG_METRIC_VALUE,
+    ESG_METRIC_UNIT,
+    ESG_REPORTING_PERIOD,
+)
+
+
+class TripleBatch:
+    """
+    RDF triples stored column-wise: parallel lists of subjects (s) and
+    objects (o), and an array of predicate IDs (p, unsigned 16-bit) encoded
+    with the predicates PredicateDict. No tuple is kept per triple and a
+    single column can be scanned on its own. append/extend take (s, p, o)
+    tuples, as on a list of triples.
+    """
+
+    __slots__ = ("s", "p", "o", "predicates")
+
+    def __init__(self, predicates: Optional[PredicateDict] = None):
+        self.s: List[str] = []
+        self.p = array.array("H")
+        self.o: List[str] = []
+        self.predicates = predicates if predicates is not None else PredicateDict()
+
+    def __len__(self) -> int:
+        return len(self.s)
+
+    def append(self, triple: Tuple[str, str, str]) -> None:
+        subject, predicate, obj = triple
+        self.s.append(subject)
+        self.p.append(self.predicates.encode(predicate))
+        self.o.append(obj)
+
+    def extend(self, triples: Iterable[Tuple[str, str, str]]) -> None:
+        encode = self.predicates.encode
+        for subject, predicate, obj in triples:
+            self.s.append(subject)
+            self.p.append(encode(predicate))
+            self.o.append(obj)
+
+    def decode_predicates(self) -> List[str]:
+        """Returns the predicate column as URIs."""
+        uris = self.predicates.uris
+        return [uris[uri_id] for uri_id in self.p]
+
+    def to_tuples(self) -> List[Tuple[str, str, str]]:
+        return list(zip(self.s, self.decode_predicates(), self.o))
+
+    def to_arrow(self) -> "pa.RecordBatch":
+        """
+        Returns the triples as a pyarrow RecordBatch with dictionary-encoded
+        string columns "s", "p" and "o". The predicate column reuses the
+        PredicateDict IDs as its indices.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Arrow output of RDF triples.")
+        predicates = pa.DictionaryArray.from_arrays(
+            pa.array(self.p, type=pa.int32()),
+            pa.array(self.predicates.uris, type=pa.string()),
+        )
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array(self.s, type=pa.string()).dictionary_encode(),
+                predicates,
+                pa.array(self.o, type=pa.string()).dictionary_encode(),
+            ],
+            names=["s", "p", "o"],
+        )
+
+
+# write_ntriples hands its output to the stream in chunks of about this many bytes.
+NTRIPLES_CHUNK_SIZE = 64 * 1024
+
+_XSD = ONTOLOGY_PREFIXES["xsd"]
+
+
+def _ntriples_string(text: str) -> str:
+    escaped = (
+        text.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+    return f'"{escaped}"'
+
+
+# Characters N-Triples does not allow inside <...>; they are percent-escaped.
+_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+# Lexical forms of xsd:integer and (finite) xsd:double. Python's int() and
+# float() also accept e.g. "1_000" or " 5", which xsd does not.
+_XSD_INTEGER = re.compile(r"[+-]?[0-9]+")
+_XSD_DOUBLE = re.compile(r"[+-]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][+-]?[0-9]+)?")
+
+# Python's spellings of the special doubles (as written by format_literal)
+# mapped to their xsd forms.
+_XSD_DOUBLE_SPECIALS = {
+    "nan": "NaN",
+    "inf": "INF",
+    "+inf": "INF",
+    "infinity": "INF",
+    "+infinity": "INF",
+    "-inf": "-INF",
+    "-infinity": "-INF",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _ntriples_iri(iri: str) -> str:
+    return "<" + _IRI_UNSAFE.sub(lambda m: f"%{ord(m.group()):02X}", iri) + ">"
+
+
+@functools.lru_cache(maxsize=4096)
+def _ntriples_object(term: str) -> str:
+    """
+    N-Triples form of an object term, read the way KnowledgeGraphAgent parses
+    KGPopulationSkill terms: full URIs, quoted strings, or bare booleans and
+    numbers from format_literal.
+    """
+    if term.startswith(("http://", "https://")):
+        return _ntriples_iri(term)
+    if len(term) >= 2 and term[0] == '"' and term[-1] == '"':
+        return _ntriples_string(term[1:-1])
+    if term.lower() in ("true", "false"):
+        return f'"{term.lower()}"^^<{_XSD}boolean>'
+    if _XSD_INTEGER.fullmatch(term):
+        return f'"{term}"^^<{_XSD}integer>'
+    if _XSD_DOUBLE.fullmatch(term):
+        return f'"{term}"^^<{_XSD}double>'
+    special = _XSD_DOUBLE_SPECIALS.get(term.lower())
+    if special is not None:
+        return f'"{special}"^^<{_XSD}double>'
+    return _ntriples_string(term)
+
+
+class _NTriplesWriter:
+    """
+    Triple sink (append/extend, like a list) that serializes each triple to
+    an N-Triples line and writes the lines to a binary stream in chunks of
+    about NTRIPLES_CHUNK_SIZE bytes.
+    """
+
+    __slots__ = ("_out", "_lines", "_size", "_count")
+
+    def __init__(self, out: BinaryIO):
+        self._out = out
+        self._lines: List[str] = []
+        self._size = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, triple: Tuple[str, str, str]) -> None:
+        subject, predicate, obj = triple
+        line = f"{_ntriples_iri(subject)} <{predicate}> {_ntriples_object(obj)} .\n"
+        self._lines.append(line)
+        self._count += 1
+        self._size += len(line)
+        if self._size >= NTRIPLES_CHUNK_SIZE:
+            self.flush()
+
+    def extend(self, triples: Iterable[Tuple[str, str, str]]) -> None:
+        for triple in triples:
+            self.append(triple)
+
+    def flush(self) -> None:
+        if self._lines:
+            self._out.write("".join(self._lines).encode("utf-8"))
+            self._lines.clear()
+            self._size = 0
+
+
 class KGPopulationSkill:
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.predicates = PredicateDict(PREDICATE_URIS)
 
     @kernel_function(description="Generates RDF triples from structured company data.", name="generate_rdf_triples")
-    async def generate_rdf_triples(self, company_data: dict, company_uri_base: str = "http://example.com/entity/") -> List[Tuple[str, str, str]]:
+    def generate_rdf_triples(self, company_data: dict, company_uri_base: str = "http://example.com/entity/") -> List[Tuple[str, str, str]]:
 
         """
         Generates a list of RDF triples from structured company data.
@@ -50,25 +347,75 @@ class KGPopulationSkill:
             List[Tuple[str, str, str]]: A list of RDF triples.
         """
         triples: List[Tuple[str, str, str]] = []
+        self._add_triples(company_data, company_uri_base, triples)
+        return triples
+
+    def generate_triple_batch(
+        self, company_data: dict, company_uri_base: str = "http://example.com/entity/"
+    ) -> "TripleBatch":
+        """
+        Like generate_rdf_triples, but returns the triples column-wise as a
+        TripleBatch, for consumers that scan or load whole columns.
+        """
+        batch = TripleBatch(self.predicates)
+        self._add_triples(company_data, company_uri_base, batch)
+        return batch
 
+    def generate_rdf_triples_arrow(
+        self, company_data: dict, company_uri_base: str = "http://example.com/entity/"
+    ) -> "pa.RecordBatch":
+        """
+        Like generate_rdf_triples, but returns the triples as a pyarrow
+        RecordBatch of dictionary-encoded "s", "p" and "o" columns, for
+        loading into columnar stores.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        return self.generate_triple_batch(company_data, company_uri_base).to_arrow()
+
+    def write_ntriples(
+        self,
+        company_data: dict,
+        out: BinaryIO,
+        company_uri_base: str = "http://example.com/entity/",
+    ) -> int:
+        """
+        Writes the triples of generate_rdf_triples to out as UTF-8 N-Triples,
+        without building the list of triples first.
+
+        Returns:
+            int: The number of triples written.
+        """
+        writer = _NTriplesWriter(out)
+        self._add_triples(company_data, company_uri_base, writer)
+        writer.flush()
+        return len(writer)
+
+    def _add_triples(
+        self,
+        company_data: dict,
+        company_uri_base: str,
+        triples: Union[List[Tuple[str, str, str]], TripleBatch, _NTriplesWriter],
+    ) -> None:
         company_ticker = company_data.get("companyTicker", "unknown_company")
         company_uri = (
             company_uri_base.rstrip("/") + "/" + company_ticker.replace(" ", "_")
         )
 
         # Company Core Info
-        triples.append(
-            (company_uri, format_uri("rdf", "type"), format_uri("kgclass", "Obligor"))
-        )
         company_name = company_data.get("companyName", "Unknown Company")
-        triples.append(
-            (company_uri, format_uri("rdfs", "label"), format_literal(company_name))
+        triples.extend(
+            (
+                (company_uri, RDF_TYPE, KGCLASS_OBLIGOR),
+                (company_uri, RDFS_LABEL, format_literal(company_name)),
+            )
         )
         if company_data.get("companyTicker"):
             triples.append(
                 (
                     company_uri,
-                    format_uri("kgprop", "hasTickerSymbol"),
+                    KGPROP_HAS_TICKER_SYMBOL,
                     format_literal(company_data["companyTicker"]),
                 )
             )
@@ -77,57 +424,37 @@ class KGPopulationSkill:
         financials_expanded = company_data.get("financial_data_for_ratios_expanded")
         if isinstance(financials_expanded, dict):
             financials_uri = f"{company_uri}/financials/current_snapshot"  # Example URI
-            triples.append(
-                (company_uri, format_uri("kgprop", "hasFinancials"), financials_uri)
-            )  # Assuming kgprop:hasFinancials exists
-            triples.append(
+            triples.extend(
                 (
-                    financials_uri,
-                    format_uri("rdf", "type"),
-                    format_uri("cacm_ont", "FinancialStatement"),
+                    # Assuming kgprop:hasFinancials exists
+                    (company_uri, KGPROP_HAS_FINANCIALS, financials_uri),
+                    # Or more specific
+                    (financials_uri, RDF_TYPE, CACM_ONT_FINANCIAL_STATEMENT),
                 )
-            )  # Or more specific
+            )
 
             # Simplified mapping of keys to properties.
             # In a real scenario, this would need a more robust mapping or specific ontology properties.
+            extend = triples.extend
+            item_uri_prefix = financials_uri + "/"
             for key, value in financials_expanded.items():
-                if value is not None and key not in [
-                    "source",
-                    "period_y1_label",
-                    "period_y2_label",
-                ]:  # Skip metadata or non-numeric
-                    # Conceptual property: kgprop:has<KeyName>
-                    # This assumes properties like kgprop:hasCurrentAssets, kgprop:hasTotalDebt exist.
-                    # For a more robust approach, a predefined map or more generic properties would be used.
-                    prop_name = f"has{key.replace('_', ' ').title().replace(' ', '')}Value"  # e.g. hasCurrentAssetsValue
+                if (
+                    value is not None and key not in _FINANCIAL_METADATA_KEYS
+                ):  # Skip metadata or non-numeric
                     # For now, let's use a generic kgprop:hasValue and create an entity for the item
-                    item_uri = f"{financials_uri}/{key}"
-                    triples.append(
+                    item_uri = item_uri_prefix + key
+                    extend(
                         (
-                            financials_uri,
-                            format_uri("kgprop", "hasFinancialItem"),
-                            item_uri,
-                        )
-                    )  # Generic: hasFinancialItem
-                    triples.append(
-                        (
-                            item_uri,
-                            format_uri("rdf", "type"),
-                            format_uri("kgclass", "BalanceSheetItem"),
-                        )
-                    )  # Generic type
-                    triples.append(
-                        (
-                            item_uri,
-                            format_uri("rdfs", "label"),
-                            format_literal(key.replace("_", " ").title()),
-                        )
-                    )
-                    triples.append(
-                        (
-                            item_uri,
-                            format_uri("kgprop", "hasValue"),
-                            format_literal(value),
+                            # Generic: hasFinancialItem
+                            (financials_uri, KGPROP_HAS_FINANCIAL_ITEM, item_uri),
+                            # Generic type
+                            (item_uri, RDF_TYPE, KGCLASS_BALANCE_SHEET_ITEM),
+                            (
+                                item_uri,
+                                RDFS_LABEL,
+                                _financial_item_label(key),
+                            ),
+                            (item_uri, KGPROP_HAS_VALUE, format_literal(value)),
                         )
                     )
 
@@ -135,45 +462,46 @@ class KGPopulationSkill:
         # Utility Payments
         utility_payments = company_data.get("altdata_utility_payments")
         if isinstance(utility_payments, list):
-            for i, record in enumerate(utility_payments):
+            append = triples.append
+            payment_uri_prefix = company_uri + "/utility_payment/"
+            for i, record in enumerate(utility_payments, start=1):
                 if isinstance(record, dict):
-                    payment_uri = f"{company_uri}/utility_payment/{i+1}"
-                    triples.append(
+                    payment_uri = payment_uri_prefix + str(i)
+                    triples.extend(
                         (
-                            company_uri,
-                            format_uri("altdata", "hasUtilityPaymentHistory"),
-                            payment_uri,
-                        )
-                    )
-                    triples.append(
-                        (
-                            payment_uri,
-                            format_uri("rdf", "type"),
-                            format_uri("altdata", "UtilityPaymentRecord"),
+                            (
+                                company_uri,
+                                ALTDATA_HAS_UTILITY_PAYMENT_HISTORY,
+                                payment_uri,
+                            ),
+                            (payment_uri, RDF_TYPE, ALTDATA_UTILITY_PAYMENT_RECORD),
                         )
                     )
-                    if record.get("utilityType"):
-                        triples.append(
+                    utility_type = record.get("utilityType")
+                    if utility_type:
+                        append(
                             (
                                 payment_uri,
-                                format_uri("altdata", "utilityType"),
-                                format_literal(record.get("utilityType")),
+                                ALTDATA_UTILITY_TYPE,
+                                format_literal(utility_type),
                             )
                         )
-                    if record.get("paymentStatus"):
-                        triples.append(
+                    payment_status = record.get("paymentStatus")
+                    if payment_status:
+                        append(
                             (
                                 payment_uri,
-                                format_uri("altdata", "paymentStatus"),
-                                format_literal(record.get("paymentStatus")),
+                                ALTDATA_PAYMENT_STATUS,
+                                format_literal(payment_status),
                             )
                         )
-                    if record.get("paymentDate"):
-                        triples.append(
+                    payment_date = record.get("paymentDate")
+                    if payment_date:
+                        append(
                             (
                                 payment_uri,
-                                format_uri("altdata", "paymentDate"),
-                                format_literal(record.get("paymentDate")),
+                                ALTDATA_PAYMENT_DATE,
+                                format_literal(payment_date),
                             )
                         )  # Assuming XSD date format
 
@@ -181,25 +509,17 @@ class KGPopulationSkill:
         social_sentiment = company_data.get("altdata_social_sentiment")
         if isinstance(social_sentiment, dict):
             sentiment_uri = f"{company_uri}/social_sentiment/current"
-            triples.append(
-                (
-                    company_uri,
-                    format_uri("altdata", "hasSocialMediaSentiment"),
-                    sentiment_uri,
-                )
-            )
-            triples.append(
+            triples.extend(
                 (
-                    sentiment_uri,
-                    format_uri("rdf", "type"),
-                    format_uri("altdata", "SocialMediaSentiment"),
+                    (company_uri, ALTDATA_HAS_SOCIAL_MEDIA_SENTIMENT, sentiment_uri),
+                    (sentiment_uri, RDF_TYPE, ALTDATA_SOCIAL_MEDIA_SENTIMENT),
                 )
             )
             if social_sentiment.get("sentimentScore") is not None:
                 triples.append(
                     (
                         sentiment_uri,
-                        format_uri("altdata", "sentimentScore"),
+                        ALTDATA_SENTIMENT_SCORE,
                         format_literal(social_sentiment.get("sentimentScore")),
                     )
                 )
@@ -207,7 +527,7 @@ class KGPopulationSkill:
                 triples.append(
                     (
                         sentiment_uri,
-                        format_uri("altdata", "sentimentSource"),
+                        ALTDATA_SENTIMENT_SOURCE,
                         format_literal(social_sentiment.get("sentimentSource")),
                     )
                 )
@@ -215,7 +535,7 @@ class KGPopulationSkill:
                 triples.append(
                     (
                         sentiment_uri,
-                        format_uri("altdata", "sentimentDate"),
+                        ALTDATA_SENTIMENT_DATE,
                         format_literal(social_sentiment.get("sentimentDate")),
                     )
                 )
@@ -225,21 +545,17 @@ class KGPopulationSkill:
         esg_overall_rating = company_data.get("esg_overall_rating")
         if isinstance(esg_overall_rating, dict):
             esg_rating_uri = f"{company_uri}/esg_rating/overall"
-            triples.append(
-                (company_uri, format_uri("esg", "hasESGRating"), esg_rating_uri)
-            )
-            triples.append(
+            triples.extend(
                 (
-                    esg_rating_uri,
-                    format_uri("rdf", "type"),
-                    format_uri("esg", "OverallESGRating"),
+                    (company_uri, ESG_HAS_ESG_RATING, esg_rating_uri),
+                    (esg_rating_uri, RDF_TYPE, ESG_OVERALL_ESG_RATING),
                 )
             )
             if esg_overall_rating.get("ratingValue"):
                 triples.append(
                     (
                         esg_rating_uri,
-                        format_uri("esg", "ratingValue"),
+                        ESG_RATING_VALUE,
                         format_literal(esg_overall_rating.get("ratingValue")),
                     )
                 )
@@ -249,7 +565,7 @@ class KGPopulationSkill:
                 triples.append(
                     (
                         esg_rating_uri,
-                        format_uri("esg", "dataSource"),
+                        ESG_DATA_SOURCE,
                         format_literal(esg_overall_rating.get("ratingProvider")),
                     )
                 )
@@ -261,14 +577,10 @@ class KGPopulationSkill:
             emissions_uri = (
                 f"{company_uri}/esg_metric/carbon_emissions/{reporting_period}"
             )
-            triples.append(
-                (company_uri, format_uri("esg", "reportsESGMetric"), emissions_uri)
-            )
-            triples.append(
+            triples.extend(
                 (
-                    emissions_uri,
-                    format_uri("rdf", "type"),
-                    format_uri("esg", "CarbonEmission"),
+                    (company_uri, ESG_REPORTS_ESG_METRIC, emissions_uri),
+                    (emissions_uri, RDF_TYPE, ESG_CARBON_EMISSION),
                 )
             )
             # Example: Store total emissions. Could also store scope1, scope2, scope3 individually.
@@ -276,7 +588,7 @@ class KGPopulationSkill:
                 triples.append(
                     (
                         emissions_uri,
-                        format_uri("esg", "metricValue"),
+                        ESG_METRIC_VALUE,
                         format_literal(carbon_emissions.get("totalEmissions")),
                     )
                 )
@@ -284,7 +596,7 @@ class KGPopulationSkill:
                 triples.append(
                     (
                         emissions_uri,
-                        format_uri("esg", "metricUnit"),
+                        ESG_METRIC_UNIT,
                         format_literal(carbon_emissions.get("unit")),
                     )
                 )
@@ -292,7 +604,7 @@ class KGPopulationSkill:
                 triples.append(
                     (
                         emissions_uri,
-                        format_uri("esg", "reportingPeriod"),
+                        ESG_REPORTING_PERIOD,
                         format_literal(carbon_emissions.get("reportingPeriod")),
                     )
                 )
@@ -301,7 +613,6 @@ class KGPopulationSkill:
         self.logger.info(
             f"Generated {len(triples)} RDF triples for company {company_ticker}."
         )
-        return triples
 
 
 if __name__ == "__main__":
@@ -350,30 +661,25 @@ if __name__ == "__main__":
         },
     }
 
-    import asyncio
+    print("--- Generating RDF Triples ---")
+    triples_result = skill.generate_rdf_triples(sample_company_data)
+    for triple in triples_result:
+        print(triple)
 
-    async def main():
-        print("--- Generating RDF Triples ---")
-        triples_result = await skill.generate_rdf_triples(sample_company_data)
-        for triple in triples_result:
-            print(triple)
-
-        print(f"\n--- Total Triples Generated: {len(triples_result)} ---")
-
-        # Example with different base URI
-        print("\n--- Generating RDF Triples with custom base URI ---")
-        triples_custom_base = await skill.generate_rdf_triples(
-            sample_company_data, company_uri_base="http://mydata.org/entities/"
-        )
-        # Print first few for brevity
-        for i, triple in enumerate(triples_custom_base):
-            if i < 5:
-                print(triple)
-        print(
-            f"Custom base URI first subject: {triples_custom_base[0][0] if triples_custom_base else 'N/A'}"
-        )
+    print(f"\n--- Total Triples Generated: {len(triples_result)} ---")
 
-    asyncio.run(main())
+    # Example with different base URI
+    print("\n--- Generating RDF Triples with custom base URI ---")
+    triples_custom_base = skill.generate_rdf_triples(
+        sample_company_data, company_uri_base="http://mydata.org/entities/"
+    )
+    # Print first few for brevity
+    for i, triple in enumerate(triples_custom_base):
+        if i < 5:
+            print(triple)
+    print(
+        f"Custom base URI first subject: {triples_custom_base[0][0] if triples_custom_base else 'N/A'}"
+    )
 
 # Placeholder for KernelService registration (conceptual)
 # In semantic_kernel_adapter.py:
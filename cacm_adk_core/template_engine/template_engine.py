@@ -1,10 +1,12 @@
 # cacm_adk_core/template_engine/template_engine.py
 import os
-import json
 import uuid
 from datetime import datetime, timezone
 import copy
 import re
+from stat import S_ISREG
+
+from cacm_adk_core.json_io import load_json_file
 
 # TemplateEngine now expects pure JSON files.
 
@@ -14,18 +16,44 @@ class TemplateEngine:
         self.templates_dir = os.path.abspath(templates_dir)
         if not os.path.isdir(self.templates_dir):
             print(f"Warning: Templates directory not found: {self.templates_dir}")
+        # Parsed templates and list_templates entries by file path, each stored
+        # with the file's (mtime, size) so an edited file is read again.
+        self._cache: dict[str, tuple[tuple[int, int], dict]] = {}
+        self._summary_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+    @staticmethod
+    def _file_version(stat: os.stat_result) -> tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_template(self, filepath: str, version: tuple[int, int]) -> dict:
+        cached = self._cache.get(filepath)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        data = load_json_file(filepath)  # orjson when installed
+        self._cache[filepath] = (version, data)
+        return data
 
     def list_templates(self) -> list[dict]:
         templates_info = []
-        if not os.path.isdir(self.templates_dir):
+        try:
+            # DirEntry carries the file name, type and path from the directory
+            # read, so only a stat per template is left.
+            entries = list(os.scandir(self.templates_dir))
+        except OSError:  # Missing or not a directory
             return templates_info
-        for filename in os.listdir(self.templates_dir):
+        for entry in entries:
+            filename = entry.name
             if filename.endswith(".json"):  # Changed from .jsonc
-                filepath = os.path.join(self.templates_dir, filename)
+                filepath = entry.path
                 try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        content_raw = f.read()
-                    data = json.loads(content_raw)  # Directly parse raw content
+                    if not entry.is_file():
+                        continue
+                    version = self._file_version(entry.stat())
+                    cached = self._summary_cache.get(filepath)
+                    if cached is not None and cached[0] == version:
+                        templates_info.append(dict(cached[1]))
+                        continue
+                    data = self._read_template(filepath, version)
                     metadata = data.get("metadata", {})
                     template_details = metadata.get("templateDetails", {})
                     name = template_details.get(
@@ -35,47 +63,60 @@ class TemplateEngine:
                         "intendedUsage",
                         data.get("description", "No description available."),
                     )
-                    templates_info.append(
-                        {"filename": filename, "name": name, "description": description}
-                    )
+                    summary = {
+                        "filename": filename,
+                        "name": name,
+                        "description": description,
+                    }
+                    self._summary_cache[filepath] = (version, summary)
+                    templates_info.append(dict(summary))
                 except Exception as e:
                     print(f"Warning: Error processing template file {filename}: {e}")
         return templates_info
 
-    def load_template(self, template_filename: str) -> dict | None:
+    def _load_cached_template(self, template_filename: str) -> dict | None:
+        """Like load_template, but returns the cached dict itself; do not mutate it."""
         filepath = os.path.join(self.templates_dir, template_filename)
-        if not os.path.isfile(filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            stat = None
+        if stat is None or not S_ISREG(stat.st_mode):
             print(
                 f"Error: Template file not found: {filepath}"
             )  # Error message already generic
             return None
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content_raw = f.read()
-            return json.loads(content_raw)  # Directly parse raw content
+            return self._read_template(filepath, self._file_version(stat))
         except Exception as e:
             print(
                 f"Error loading/parsing template {template_filename}: {e}"
             )  # Error message already generic
             return None
 
-    def _deep_merge_dicts(self, base: dict, updates: dict) -> dict:
-        merged = copy.deepcopy(base)
-        for key, value in updates.items():
-            if (
-                isinstance(value, dict)
-                and key in merged
-                and isinstance(merged[key], dict)
-            ):
-                merged[key] = self._deep_merge_dicts(merged[key], value)
-            else:
-                merged[key] = value
-        return merged
+    def load_template(self, template_filename: str) -> dict | None:
+        template_data = self._load_cached_template(template_filename)
+        if template_data is None:
+            return None
+        return copy.deepcopy(template_data)
+
+    @staticmethod
+    def _deep_merge_dicts_inplace(base: dict, updates: dict) -> None:
+        """Merges updates into base, recursing into dicts present in both."""
+        stack = [(base, updates)]
+        while stack:
+            merged, pending = stack.pop()
+            for key, value in pending.items():
+                current = merged.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    merged[key] = value
 
     def instantiate_template(
         self, template_filename: str, cacm_id: str = None, overrides: dict = None
     ) -> dict | None:
-        template_data = self.load_template(template_filename)
+        template_data = self._load_cached_template(template_filename)
         if template_data is None:
             return None
         instantiated_cacm = copy.deepcopy(template_data)
@@ -86,5 +127,6 @@ class TemplateEngine:
             timezone.utc
         ).isoformat(timespec="seconds")
         if overrides:
-            instantiated_cacm = self._deep_merge_dicts(instantiated_cacm, overrides)
+            # instantiated_cacm is already a private deep copy.
+            self._deep_merge_dicts_inplace(instantiated_cacm, overrides)
         return instantiated_cacm
@@ -1,8 +1,120 @@
 # cacm_adk_core/validator/validator.py
 # Requires the 'jsonschema' library. Add to requirements.txt.
+import copy
+import hashlib
 import json
+import logging
+import math
+from collections import OrderedDict
+
 import jsonschema  # type: ignore
 
+from cacm_adk_core.json_io import canonical_json_bytes
+
+try:
+    import fastjsonschema  # type: ignore
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import jsonschema_rs  # type: ignore
+
+    JSONSCHEMA_RS_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_RS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Number of validation results remembered per Validator (least recently used evicted).
+VALIDATION_CACHE_SIZE = 256
+
+# jsonschema-rs, fastjsonschema and jsonschema validators keyed by a hash of the
+# schema's canonical JSON, so Validators built from the same schema share them.
+_rs_validator_cache: dict = {}
+_compiled_schema_cache: dict = {}
+_schema_validator_cache: dict = {}
+
+
+def _schema_key(schema: dict) -> bytes:
+    return hashlib.blake2b(canonical_json_bytes(schema), digest_size=16).digest()
+
+
+def _is_json_document(value) -> bool:
+    """
+    Returns whether `value` is built only from JSON types: dicts with string
+    keys, lists, strings, finite numbers, booleans and None. Anything else
+    (tuples, NaN, infinities, ...) would share a canonical JSON form with a
+    different document.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if not all(isinstance(key, str) for key in item):
+                return False
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, float):
+            if not math.isfinite(item):
+                return False
+        elif item is not None and not isinstance(item, (str, int)):
+            return False
+    return True
+
+
+def _build_schema_validator(schema: dict):
+    """
+    Returns the jsonschema validator for `schema` (draft chosen by its
+    "$schema"), checking the schema and building the validator once per process.
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+    """
+    key = _schema_key(schema)
+    schema_validator = _schema_validator_cache.get(key)
+    if schema_validator is None:
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        schema_validator = _schema_validator_cache[key] = validator_cls(schema)
+    return schema_validator
+
+
+def _build_rs_validator(schema: dict):
+    """
+    Returns the jsonschema-rs (Rust) validator for `schema`, building it once per process.
+
+    Raises:
+        ValueError: If jsonschema-rs rejects the schema.
+    """
+    key = _schema_key(schema)
+    rs_validator = _rs_validator_cache.get(key)
+    if rs_validator is None:
+        # No format checks, matching the jsonschema path (see _compile_schema).
+        rs_validator = _rs_validator_cache[key] = jsonschema_rs.validator_for(
+            schema, validate_formats=False
+        )
+    return rs_validator
+
+
+def _compile_schema(schema: dict):
+    """
+    Returns the fastjsonschema validator for `schema`, compiling it once per process.
+
+    Raises:
+        fastjsonschema.JsonSchemaDefinitionException: If the schema cannot be compiled.
+    """
+    key = _schema_key(schema)
+    compiled = _compiled_schema_cache.get(key)
+    if compiled is None:
+        # jsonschema ignores "format" unless given a format checker; do the same so
+        # every backend accepts exactly the same instances.
+        compiled = fastjsonschema.compile(schema, use_formats=False)
+        _compiled_schema_cache[key] = compiled
+    return compiled
+
 
 class Validator:
     """
@@ -26,6 +138,40 @@ class Validator:
             print(f"Error: Could not decode JSON from schema file {schema_filepath}")
             self.schema = None  # Or raise an exception
 
+        # Validation results keyed by a hash of the instance's canonical JSON.
+        self._validation_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+        # jsonschema validator built (and the schema checked) once, instead of on
+        # every jsonschema.validate call.
+        self._schema_validator = None
+        if self.schema:
+            try:
+                self._schema_validator = _build_schema_validator(self.schema)
+            except jsonschema.exceptions.SchemaError as e:
+                logger.warning(f"CACM schema is not a valid JSON schema: {e}")
+
+        # jsonschema-rs validates in native code; preferred over fastjsonschema
+        # for accepting instances when installed.
+        self._rs_validator = None
+        if self.schema and JSONSCHEMA_RS_AVAILABLE:
+            try:
+                self._rs_validator = _build_rs_validator(self.schema)
+            except ValueError as e:
+                logger.warning(
+                    f"Could not build schema with jsonschema-rs, falling back: {e}"
+                )
+
+        # fastjsonschema turns the schema into a plain Python function once, so
+        # instances that pass are accepted without re-interpreting the schema.
+        self._compiled_schema = None
+        if self.schema and FASTJSONSCHEMA_AVAILABLE:
+            try:
+                self._compiled_schema = _compile_schema(self.schema)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                logger.warning(
+                    f"Could not compile schema with fastjsonschema, using jsonschema only: {e}"
+                )
+
     def validate_cacm_against_schema(
         self, cacm_instance_data: dict
     ) -> tuple[bool, list]:
@@ -43,9 +189,92 @@ class Validator:
         if not self.schema:
             return False, [{"message": "CACM schema not loaded."}]
 
+        # Identical instances (e.g. one template run many times) are validated once.
+        # Documents whose canonical JSON is ambiguous are validated uncached.
+        if not _is_json_document(cacm_instance_data):
+            return self._validate_uncached(cacm_instance_data, fast_paths=False)
+        try:
+            cache_key = hashlib.blake2b(
+                canonical_json_bytes(cacm_instance_data), digest_size=16
+            ).digest()
+        except (TypeError, ValueError):  # Not JSON serializable; validate uncached
+            return self._validate_uncached(cacm_instance_data)
+
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            self._validation_cache.move_to_end(cache_key)
+            is_valid, errors = cached
+            return is_valid, copy.deepcopy(list(errors))
+
+        is_valid, errors = self._validate_uncached(cacm_instance_data)
+        # Callers own the returned error dicts; the cache keeps its own copy.
+        self._validation_cache[cache_key] = (is_valid, tuple(copy.deepcopy(errors)))
+        if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+        return is_valid, errors
+
+    def is_valid(self, cacm_instance_data: dict) -> bool:
+        """
+        Returns whether the CACM instance conforms to the schema, without
+        building error reports: validation stops at the first failure.
+        """
+        if not self.schema:
+            return False
+        if not _is_json_document(cacm_instance_data):
+            pass  # Only jsonschema judges non-JSON values (e.g. tuples) as the spec does
+        elif self._rs_validator is not None:
+            try:
+                return self._rs_validator.is_valid(cacm_instance_data)
+            except ValueError:  # Not representable as JSON; let jsonschema decide
+                pass
+        elif self._compiled_schema is not None:
+            try:
+                self._compiled_schema(cacm_instance_data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        if self._schema_validator is not None:
+            return self._schema_validator.is_valid(cacm_instance_data)
+        # Schema rejected by check_schema; report it the usual way.
+        return self.validate_cacm_against_schema(cacm_instance_data)[0]
+
+    def _validate_uncached(
+        self, cacm_instance_data: dict, fast_paths: bool = True
+    ) -> tuple[bool, list]:
+        """
+        Validates an instance against the schema without consulting the result cache.
+        With `fast_paths` False only jsonschema is used: fastjsonschema would
+        accept a tuple where the schema asks for an array, jsonschema does not.
+        """
+        if not fast_paths:
+            pass
+        elif self._rs_validator is not None:
+            try:
+                if self._rs_validator.is_valid(cacm_instance_data):
+                    return True, []
+            except ValueError:  # Not representable as JSON, e.g. a set value
+                pass
+            # Fall through so errors are reported in the usual jsonschema format.
+        elif self._compiled_schema is not None:
+            try:
+                self._compiled_schema(cacm_instance_data)
+                return True, []
+            except fastjsonschema.JsonSchemaException:
+                # Fall through so errors are reported in the usual jsonschema format.
+                pass
+
         try:
-            jsonschema.validate(instance=cacm_instance_data, schema=self.schema)
-            return True, []
+            if self._schema_validator is None:
+                # Raises the schema's SchemaError, reported below.
+                jsonschema.validate(instance=cacm_instance_data, schema=self.schema)
+                return True, []
+            # Same error choice as jsonschema.validate.
+            error = jsonschema.exceptions.best_match(
+                self._schema_validator.iter_errors(cacm_instance_data)
+            )
+            if error is None:
+                return True, []
+            raise error
         except jsonschema.exceptions.ValidationError as e:
             # Basic error reporting, can be made more detailed
             return False, [
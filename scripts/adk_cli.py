@@ -17,6 +17,7 @@ try:
     from cacm_adk_core.template_engine.template_engine import TemplateEngine
     from cacm_adk_core.validator.validator import Validator
     from cacm_adk_core.orchestrator.orchestrator import Orchestrator
+    from cacm_adk_core.json_io import load_json_file
     from cacm_adk_core.semantic_kernel_adapter import KernelService  # Added import
 except ImportError:
     # Fallback for direct execution from scripts/ if core modules are not found
@@ -28,6 +29,7 @@ except ImportError:
     from cacm_adk_core.template_engine.template_engine import TemplateEngine
     from cacm_adk_core.validator.validator import Validator
     from cacm_adk_core.orchestrator.orchestrator import Orchestrator
+    from cacm_adk_core.json_io import load_json_file
     from cacm_adk_core.semantic_kernel_adapter import (
         KernelService,
     )  # Added import for fallback
@@ -178,8 +180,7 @@ def validate_cacm_cmd(cacm_filepath):
         return
 
     try:
-        with open(cacm_filepath, "r") as f:
-            cacm_instance_data = json.load(f)
+        cacm_instance_data = load_json_file(cacm_filepath)
     except json.JSONDecodeError as e:
         click.echo(f"Error: Invalid JSON in file {cacm_filepath}: {e}", err=True)
         return
@@ -238,8 +239,7 @@ def run_cacm_cmd(cacm_filepath, output_dir):
         )
 
     try:
-        with open(cacm_filepath, "r") as f:
-            cacm_instance_data = json.load(f)
+        cacm_instance_data = load_json_file(cacm_filepath)
     except json.JSONDecodeError as e:
         click.echo(f"Error: Invalid JSON in file {cacm_filepath}: {e}", err=True)
         return
@@ -113,6 +113,17 @@ class TestSharedContext(unittest.TestCase):
             found_data_store_key, "Data store key not found in log summary."
         )
 
+    def test_slots_and_pickling(self):
+        import pickle
+
+        context = SharedContext("test_cacm_slots")
+        context.set_data("score", 0.5)
+        with self.assertRaises(AttributeError):
+            context.undeclared_attribute = True
+        restored = pickle.loads(pickle.dumps(context))
+        self.assertEqual(restored.get_session_id(), context.get_session_id())
+        self.assertEqual(restored.get_data("score"), 0.5)
+
 
 if __name__ == "__main__":
     unittest.main()
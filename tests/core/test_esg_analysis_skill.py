@@ -0,0 +1,224 @@
+# tests/core/test_esg_analysis_skill.py
+import concurrent.futures
+import json
+import logging
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from cacm_adk_core.skills import esg_analysis_skill
+from cacm_adk_core.skills.esg_analysis_skill import ESGAnalysisSkill
+
+ESG = "http://example.com/ontology/cacm_credit_ontology/0.3/esg#"
+
+SAMPLE_ROWS = [
+    {
+        "metric_label": "Scope 1 Carbon Emissions",
+        "metric_value": "1500",
+        "metric_unit": "tCO2e",
+        "metric_type": ESG + "CarbonEmission",
+    },
+    {
+        "metric_label": "Employee Turnover Rate",
+        "metric_value": 15,
+        "metric_unit": "%",
+        "metric_type": ESG + "SocialFactor",
+    },
+    {
+        "metric_label": "Board Independence",
+        "metric_value": "80",
+        "metric_type": "http://example.com/esg/BoardIndependenceRatio",
+    },
+    {
+        "metric_label": "Overall ESG Score",
+        "rating_value": "A-",
+        "rating_provider": "ESG Corp",
+        "metric_type": ESG + "OverallESGRating",
+    },
+    {
+        "metric_label": "Data Privacy Incidents",
+        "metric_value": 0,
+        "metric_unit": None,
+        "metric_type": ESG + "SocialFactor",
+    },
+    {
+        "metric_label": "Future Sustainability Index",
+        "metric_value": "7.5",
+        "metric_type": "http://example.com/custom#FutureMetric",
+    },
+    {"metric_label": "Untyped Metric", "metric_value": "1"},
+    {"metric_label": "Missing Value", "metric_type": ESG + "WaterUsage"},
+    {"metric_value": "3", "metric_type": ESG + "GovernanceFactor"},
+]
+
+
+class FakeChatService:
+    """Answers each batch with one "assessment N" string per numbered line."""
+
+    def __init__(self, reply=None):
+        self.batches = []
+        self.reply = reply
+
+    async def get_chat_message_contents(self, chat_history, settings):
+        lines = chat_history.messages[-1].content.split("\n")
+        self.batches.append(lines)
+        summaries = [f"assessment {line.split('.')[0]}" for line in lines]
+        content = (
+            self.reply
+            if self.reply is not None
+            else json.dumps({"summaries": summaries})
+        )
+        return [SimpleNamespace(content=content)]
+
+
+class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Thread pool standing in for the process pool; records shutdown calls."""
+
+    shutdowns = []
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdowns.append((threading.current_thread(), wait, cancel_futures))
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+class TestESGAnalysisSkill(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.skill = ESGAnalysisSkill(logger=logging.getLogger("TestESGAnalysisSkill"))
+
+    def test_rows_are_bucketed_by_metric_type(self):
+        summary = self.skill.summarize_esg_factors_from_kg(SAMPLE_ROWS, "TEC")
+        self.assertEqual(
+            summary["environmental"], ("Scope 1 Carbon Emissions: 1500 tCO2e",)
+        )
+        self.assertEqual(
+            summary["social"],
+            ("Employee Turnover Rate: 15 %", "Data Privacy Incidents: 0"),
+        )
+        self.assertEqual(summary["governance"], ("Board Independence: 80",))
+        self.assertEqual(
+            summary["overall_ratings"], ("Overall ESG Score: A- (Provider: ESG Corp)",)
+        )
+        self.assertEqual(
+            summary["other_metrics"],
+            (
+                "Future Sustainability Index: 7.5 (Type: FutureMetric)",
+                "Untyped Metric: 1 (Type: Not Specified)",
+            ),
+        )
+        self.assertEqual(
+            summary["processing_notes"],
+            (
+                "Skipped item 8: missing label or value.",
+                "Skipped item 9: missing label or value.",
+            ),
+        )
+
+    def test_vectorized_path_matches_row_path(self):
+        rows = SAMPLE_ROWS * 10
+        with patch.object(esg_analysis_skill, "VECTORIZE_MIN_ROWS", 10**6):
+            expected = self.skill.summarize_esg_factors_from_kg(rows, "TEC")
+        with patch.object(esg_analysis_skill, "VECTORIZE_MIN_ROWS", 1):
+            actual = self.skill.summarize_esg_factors_from_kg(rows, "TEC")
+        self.assertEqual(actual, expected)
+
+    def test_vectorized_path_matches_row_path_on_unusual_values(self):
+        rows = [
+            {"metric_label": "Numeric Unit", "metric_value": 1, "metric_unit": 2},
+            {"metric_label": "Zero Unit", "metric_value": 1, "metric_unit": 0},
+            {"metric_label": "Text Unit", "metric_value": 1, "metric_unit": "kg"},
+            {"metric_label": "NaN Value", "metric_value": float("nan")},
+            {
+                "metric_label": "NaN Unit",
+                "metric_value": 1,
+                "metric_unit": float("nan"),
+            },
+        ] * 5
+        with patch.object(esg_analysis_skill, "VECTORIZE_MIN_ROWS", 10**6):
+            expected = self.skill.summarize_esg_factors_from_kg(rows, "TEC")
+        with patch.object(esg_analysis_skill, "VECTORIZE_MIN_ROWS", 1):
+            actual = self.skill.summarize_esg_factors_from_kg(rows, "TEC")
+        self.assertEqual(actual, expected)
+        self.assertIn("NaN Value: nan (Type: Not Specified)", actual["other_metrics"])
+        self.assertEqual(actual["processing_notes"], ())
+
+    async def test_summarize_many_matches_single_calls(self):
+        large = SAMPLE_ROWS * 10
+        jobs = [(SAMPLE_ROWS, "TEC"), (large, "BIG"), ([], "EMPTY")]
+        with patch.object(esg_analysis_skill, "PROCESS_POOL_MIN_ROWS", len(large)):
+            summaries = await ESGAnalysisSkill.summarize_many(jobs, max_workers=1)
+        self.assertEqual(
+            summaries,
+            [self.skill.summarize_esg_factors_from_kg(*job) for job in jobs],
+        )
+
+    async def test_summarize_many_shuts_the_pool_down_off_the_loop(self):
+        large = SAMPLE_ROWS * 10
+        RecordingExecutor.shutdowns = []
+        with patch.object(
+            esg_analysis_skill, "PROCESS_POOL_MIN_ROWS", len(large)
+        ), patch.object(
+            esg_analysis_skill.concurrent.futures,
+            "ProcessPoolExecutor",
+            RecordingExecutor,
+        ):
+            await ESGAnalysisSkill.summarize_many([(large, "BIG")])
+            ((thread, wait, _),) = RecordingExecutor.shutdowns
+            self.assertIsNot(thread, threading.current_thread())
+            self.assertTrue(wait)
+
+            # A failing inline job drops pending pool jobs without waiting.
+            RecordingExecutor.shutdowns = []
+            with self.assertRaises(AttributeError):
+                await ESGAnalysisSkill.summarize_many([(large, "BIG"), ([None], "BAD")])
+            self.assertEqual(
+                RecordingExecutor.shutdowns,
+                [(threading.current_thread(), False, True)],
+            )
+
+    async def test_batched_assessments_follow_entries(self):
+        chat_service = FakeChatService()
+        skill = ESGAnalysisSkill(
+            logger=logging.getLogger("TestESGAnalysisSkill"), chat_service=chat_service
+        )
+        summary = await skill.summarize_esg_factors_batched(
+            SAMPLE_ROWS, "TEC", batch_size=2
+        )
+        # 6 assessable entries in batches of 2.
+        self.assertEqual([len(batch) for batch in chat_service.batches], [2, 2, 2])
+        self.assertEqual(
+            summary["entry_assessments"],
+            {
+                "environmental": ("assessment 1",),
+                "social": ("assessment 2", "assessment 1"),
+                "governance": ("assessment 2",),
+                "other_metrics": ("assessment 1", "assessment 2"),
+            },
+        )
+
+    async def test_malformed_batch_reply_leaves_assessments_empty(self):
+        skill = ESGAnalysisSkill(
+            logger=logging.getLogger("TestESGAnalysisSkill"),
+            chat_service=FakeChatService(reply='{"summaries": ["only one"]}'),
+        )
+        summary = await skill.summarize_esg_factors_batched(
+            SAMPLE_ROWS[:2], "TEC", batch_size=8
+        )
+        self.assertEqual(summary["entry_assessments"]["environmental"], (None,))
+        self.assertEqual(summary["entry_assessments"]["social"], (None,))
+        self.assertIn(
+            "LLM assessments missing for 2 entries.", summary["processing_notes"]
+        )
+
+    def test_register_kernel_functions_applies_metadata(self):
+        esg_analysis_skill.register_kernel_functions(ESGAnalysisSkill)
+        method = ESGAnalysisSkill.summarize_esg_factors_from_kg
+        self.assertTrue(method.__kernel_function__)
+        self.assertEqual(
+            method.__kernel_function_name__, "summarize_esg_factors_from_kg"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
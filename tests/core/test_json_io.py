@@ -0,0 +1,80 @@
+# tests/core/test_json_io.py
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from cacm_adk_core.json_io import dumps_json, load_json_file, load_json_file_cached
+
+
+class TestJsonIO(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "catalog.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, content: str):
+        with open(self.path, "w") as f:
+            f.write(content)
+
+    def test_load_json_file(self):
+        self._write('{"computeCapabilities": [{"id": "cap1"}]}')
+        self.assertEqual(
+            load_json_file(self.path), {"computeCapabilities": [{"id": "cap1"}]}
+        )
+
+    def test_large_files_are_parsed_from_a_mapping(self):
+        from cacm_adk_core.json_io import MMAP_MIN_SIZE
+
+        items = [{"id": "cap%d" % i} for i in range(MMAP_MIN_SIZE // 10)]
+        self._write(json.dumps({"computeCapabilities": items}))
+        self.assertGreaterEqual(os.path.getsize(self.path), MMAP_MIN_SIZE)
+        self.assertEqual(load_json_file(self.path), {"computeCapabilities": items})
+
+    def test_invalid_and_empty_files_raise_json_decode_error(self):
+        self._write("{not json")
+        with self.assertRaises(json.JSONDecodeError):
+            load_json_file(self.path)
+        self._write("")
+        with self.assertRaises(json.JSONDecodeError):
+            load_json_file(self.path)
+
+    def _age(self, seconds: int = 60):
+        mtime_ns = os.stat(self.path).st_mtime_ns - seconds * 10**9
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_cached_load_reuses_document_until_file_changes(self):
+        self._write('{"version": 1}')
+        self._age()
+        first = load_json_file_cached(self.path)
+        self.assertIs(load_json_file_cached(self.path), first)
+
+        self._write('{"version": 22}')
+        self.assertEqual(load_json_file_cached(self.path), {"version": 22})
+
+    def test_recently_modified_files_are_not_cached(self):
+        self._write('{"version": 1}')
+        self.assertEqual(load_json_file_cached(self.path), {"version": 1})
+        # Same size and mtime, as for a rewrite within the timestamp resolution.
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        self._write('{"version": 2}')
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(load_json_file_cached(self.path), {"version": 2})
+
+    def test_dumps_json_is_compact_and_tolerates_unserializable_values(self):
+        self.assertEqual(json.loads(dumps_json({"a": [1, 2.5]})), {"a": [1, 2.5]})
+        text = dumps_json({"when": object(), 1: "int key"})
+        self.assertIn("object object at", text)
+        self.assertIn("int key", text)
+
+    def test_dumps_json_indented(self):
+        text = dumps_json({"a": {"b": 1}}, indent=True)
+        self.assertEqual(text, json.dumps({"a": {"b": 1}}, indent=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
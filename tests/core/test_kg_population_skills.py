@@ -0,0 +1,197 @@
+# tests/core/test_kg_population_skills.py
+import io
+import unittest
+from unittest.mock import patch
+
+from rdflib import Graph, Literal, URIRef
+
+from cacm_adk_core.skills import kg_population_skills
+from cacm_adk_core.skills.kg_population_skills import KGPopulationSkill, format_literal
+
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDFS = "http://www.w3.org/2000/01/rdf-schema#"
+KGCLASS = "http://example.com/ontology/cacm_credit_ontology/0.3/classes/#"
+KGPROP = "http://example.com/ontology/cacm_credit_ontology/0.3/properties/#"
+ALTDATA = "http://example.com/ontology/cacm_credit_ontology/0.3/alternative_data#"
+ESG = "http://example.com/ontology/cacm_credit_ontology/0.3/esg#"
+
+COMPANY = "http://example.com/entity/TEC"
+FINANCIALS = COMPANY + "/financials/current_snapshot"
+
+SAMPLE_COMPANY_DATA = {
+    "companyName": "Test Example Corp",
+    "companyTicker": "TEC",
+    "financial_data_for_ratios_expanded": {
+        "current_assets": 750000.0,
+        "total_debt": None,
+        "source": "conceptual",
+    },
+    "altdata_utility_payments": [
+        {"utilityType": "Electricity", "paymentStatus": "on-time"},
+        "not a record",
+    ],
+    "esg_carbon_emissions": {
+        "totalEmissions": 3500,
+        "unit": "tCO2e",
+        "reportingPeriod": "2022",
+    },
+}
+
+
+class TestKGPopulationSkill(unittest.TestCase):
+
+    def test_generate_rdf_triples(self):
+        triples = KGPopulationSkill().generate_rdf_triples(SAMPLE_COMPANY_DATA)
+        payment = COMPANY + "/utility_payment/1"
+        emissions = COMPANY + "/esg_metric/carbon_emissions/2022"
+        item = FINANCIALS + "/current_assets"
+        self.assertEqual(
+            triples,
+            [
+                (COMPANY, RDF + "type", KGCLASS + "Obligor"),
+                (COMPANY, RDFS + "label", '"Test Example Corp"'),
+                (COMPANY, KGPROP + "hasTickerSymbol", '"TEC"'),
+                (COMPANY, KGPROP + "hasFinancials", FINANCIALS),
+                (
+                    FINANCIALS,
+                    RDF + "type",
+                    "http://example.com/ontology/cacm_credit_ontology/0.3#FinancialStatement",
+                ),
+                (FINANCIALS, KGPROP + "hasFinancialItem", item),
+                (item, RDF + "type", KGCLASS + "BalanceSheetItem"),
+                (item, RDFS + "label", '"Current Assets"'),
+                (item, KGPROP + "hasValue", "750000.0"),
+                (COMPANY, ALTDATA + "hasUtilityPaymentHistory", payment),
+                (payment, RDF + "type", ALTDATA + "UtilityPaymentRecord"),
+                (payment, ALTDATA + "utilityType", '"Electricity"'),
+                (payment, ALTDATA + "paymentStatus", '"on-time"'),
+                (COMPANY, ESG + "reportsESGMetric", emissions),
+                (emissions, RDF + "type", ESG + "CarbonEmission"),
+                (emissions, ESG + "metricValue", "3500"),
+                (emissions, ESG + "metricUnit", '"tCO2e"'),
+                (emissions, ESG + "reportingPeriod", '"2022"'),
+            ],
+        )
+
+    def test_triple_batch_matches_triples(self):
+        skill = KGPopulationSkill()
+        triples = skill.generate_rdf_triples(SAMPLE_COMPANY_DATA)
+        batch = skill.generate_triple_batch(SAMPLE_COMPANY_DATA)
+        self.assertEqual(len(batch), len(triples))
+        self.assertEqual(batch.decode_predicates(), [p for _, p, _ in triples])
+        # Predicates are stored as IDs shared by all skills.
+        self.assertEqual(
+            batch.p[0], KGPopulationSkill().predicates.encode(RDF + "type")
+        )
+        self.assertEqual(batch.to_tuples(), triples)
+
+    @unittest.skipUnless(
+        kg_population_skills.PYARROW_AVAILABLE, "pyarrow is not installed."
+    )
+    def test_arrow_record_batch_matches_triples(self):
+        skill = KGPopulationSkill()
+        triples = skill.generate_rdf_triples(SAMPLE_COMPANY_DATA)
+        record_batch = skill.generate_rdf_triples_arrow(SAMPLE_COMPANY_DATA)
+        self.assertEqual(record_batch.schema.names, ["s", "p", "o"])
+        columns = [record_batch.column(name).to_pylist() for name in ("s", "p", "o")]
+        self.assertEqual(list(zip(*columns)), triples)
+
+    def test_write_ntriples(self):
+        skill = KGPopulationSkill()
+        data = dict(SAMPLE_COMPANY_DATA, companyName='Test "Example"\nCorp')
+        out = io.BytesIO()
+        count = skill.write_ntriples(data, out)
+        self.assertEqual(count, len(skill.generate_rdf_triples(data)))
+
+        graph = Graph()
+        graph.parse(data=out.getvalue().decode("utf-8"), format="nt")
+        self.assertEqual(len(graph), count)
+        # Chunking does not change the output.
+        small_chunks = io.BytesIO()
+        with patch.object(kg_population_skills, "NTRIPLES_CHUNK_SIZE", 1):
+            skill.write_ntriples(data, small_chunks)
+        self.assertEqual(small_chunks.getvalue(), out.getvalue())
+
+        company = URIRef(COMPANY)
+        self.assertEqual(
+            graph.value(company, URIRef(RDFS + "label")),
+            Literal('Test "Example"\nCorp'),
+        )
+        emissions = URIRef(COMPANY + "/esg_metric/carbon_emissions/2022")
+        self.assertEqual(
+            graph.value(emissions, URIRef(ESG + "metricValue")), Literal(3500)
+        )
+        item = URIRef(FINANCIALS + "/current_assets")
+        self.assertEqual(
+            graph.value(item, URIRef(KGPROP + "hasValue")), Literal(750000.0)
+        )
+
+    def test_write_ntriples_special_doubles_and_unsafe_uris(self):
+        data = {
+            "companyTicker": "T<1>",
+            "esg_carbon_emissions": {
+                "totalEmissions": float("nan"),
+                "reportingPeriod": "2022",
+            },
+            "financial_data_for_ratios_expanded": {"current_assets": float("-inf")},
+        }
+        out = io.BytesIO()
+        count = KGPopulationSkill().write_ntriples(
+            data, out, company_uri_base="http://example.com/my entities/"
+        )
+        text = out.getvalue().decode("utf-8")
+        self.assertIn('"NaN"^^<http://www.w3.org/2001/XMLSchema#double>', text)
+        self.assertIn('"-INF"^^<http://www.w3.org/2001/XMLSchema#double>', text)
+
+        graph = Graph()
+        graph.parse(data=text, format="nt")
+        self.assertEqual(len(graph), count)
+        company = URIRef("http://example.com/my%20entities/T%3C1%3E")
+        self.assertEqual(
+            graph.value(company, URIRef(RDF + "type")), URIRef(KGCLASS + "Obligor")
+        )
+
+    def test_company_uri_base_and_defaults(self):
+        triples = KGPopulationSkill().generate_rdf_triples(
+            {}, company_uri_base="http://mydata.org/entities/"
+        )
+        self.assertEqual(
+            triples,
+            [
+                (
+                    "http://mydata.org/entities/unknown_company",
+                    RDF + "type",
+                    KGCLASS + "Obligor",
+                ),
+                (
+                    "http://mydata.org/entities/unknown_company",
+                    RDFS + "label",
+                    '"Unknown Company"',
+                ),
+            ],
+        )
+
+    def test_repeated_literals_share_one_string(self):
+        data = {
+            "altdata_utility_payments": [
+                {"paymentStatus": "".join(["on-", "time"])} for _ in range(3)
+            ]
+        }
+        statuses = [
+            o
+            for _, p, o in KGPopulationSkill().generate_rdf_triples(data)
+            if p == ALTDATA + "paymentStatus"
+        ]
+        self.assertEqual(len(statuses), 3)
+        self.assertIs(statuses[0], statuses[1])
+        self.assertIs(statuses[0], statuses[2])
+
+    def test_format_literal_keeps_equal_values_of_different_types_apart(self):
+        self.assertEqual(
+            [format_literal(v) for v in (True, 1, 1.0, True, "on-time", ["x"])],
+            ["true", "1", "1.0", "true", '"on-time"', "\"['x']\""],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# tests/core/test_llm_throttle.py
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+import openai
+
+from cacm_adk_core import llm_throttle
+
+
+def _rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+class TestLLMThrottle(unittest.IsolatedAsyncioTestCase):
+
+    def tearDown(self):
+        llm_throttle.set_llm_concurrency(llm_throttle.DEFAULT_LLM_CONCURRENCY)
+
+    async def test_concurrency_is_capped(self):
+        llm_throttle.set_llm_concurrency(2)
+        in_flight, peak = 0, 0
+
+        async def call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(
+            *(llm_throttle.call_with_llm_limits(call) for _ in range(6))
+        )
+        self.assertEqual(peak, 2)
+
+    async def test_retryable_errors_are_retried(self):
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                # semantic-kernel re-raises OpenAI errors wrapped in its own.
+                raise RuntimeError("service error") from _rate_limit_error()
+            return "ok"
+
+        with patch.object(llm_throttle.asyncio, "sleep") as sleep:
+            result = await llm_throttle.call_with_llm_limits(flaky)
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual(sleep.await_count, 2)
+
+    async def test_other_errors_are_not_retried(self):
+        attempts = []
+
+        async def broken():
+            attempts.append(1)
+            raise ValueError("bad request")
+
+        with self.assertRaises(ValueError):
+            await llm_throttle.call_with_llm_limits(broken)
+        self.assertEqual(len(attempts), 1)
+
+    def test_invalid_concurrency_is_rejected(self):
+        with self.assertRaises(ValueError):
+            llm_throttle.set_llm_concurrency(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 # tests/core/test_orchestrator.py
+import asyncio
 import unittest
 
 # No need to mock print anymore as logs are returned
 # from unittest.mock import patch
 import os
+import tempfile
 import json  # For inspecting outputs if needed, and for dummy catalog
 
 try:
@@ -148,6 +150,9 @@ class TestOrchestrator(
             "Test compute catalog should not be empty",
         )
         self.assertIn("dummy:TestCapability", self.orchestrator.compute_catalog.keys())
+        # Entries are read-only views of the (shared) parsed catalog file
+        with self.assertRaises(TypeError):
+            self.orchestrator.compute_catalog["dummy:TestCapability"]["name"] = "x"
 
     async def test_run_cacm_valid_instance_with_mocked_outputs(self):  # Made async
         valid_cacm = {
@@ -319,6 +324,544 @@ class TestOrchestrator(
             outputs, {}, "Outputs should be empty for an invalid CACM run."
         )
 
+    async def test_run_cacm_memoizes_identical_instances(self):
+        cacm = {
+            "cacmId": "test-orch-memo-003",
+            "version": "1.0.0",
+            "name": "Memoized Run",
+            "description": "Run twice with memoize=True.",
+            "metadata": {"creationDate": "2023-01-01T12:00:00Z"},
+            "inputs": {"in1": {"description": "d", "type": "string"}},
+            "outputs": {"out1": {"description": "d", "type": "string"}},
+            "workflow": [
+                {
+                    "stepId": "s1",
+                    "description": "Mocked step",
+                    "computeCapabilityRef": "dummy:TestCapability",
+                    "inputBindings": {},
+                    "outputBindings": {"result": "cacm.outputs.out1"},
+                }
+            ],
+        }
+        orchestrator = self.orchestrator
+        orchestrator.clear_run_cache()
+
+        first = await orchestrator.run_cacm(cacm, memoize=True)
+        self.assertEqual(len(orchestrator._run_cache), 1)
+        first[2]["out1"]["value"] = "mutated by caller"
+        second = await orchestrator.run_cacm(dict(cacm), memoize=True)
+        self.assertTrue(second[0])
+        self.assertEqual(second[1], first[1])
+        self.assertNotEqual(second[2]["out1"]["value"], "mutated by caller")
+
+        # Without memoize the cache is neither consulted nor filled
+        await orchestrator.run_cacm(dict(cacm, cacmId="test-orch-memo-004"))
+        self.assertEqual(len(orchestrator._run_cache), 1)
+        orchestrator.clear_run_cache()
+        self.assertEqual(len(orchestrator._run_cache), 0)
+
+    async def test_run_cacm_without_mocked_outputs(self):
+        cacm = {
+            "cacmId": "test-orch-nomock-005",
+            "version": "1.0.0",
+            "name": "Success-only Run",
+            "description": "Run with mock_outputs=False.",
+            "metadata": {"creationDate": "2023-01-01T12:00:00Z"},
+            "inputs": {"in1": {"description": "d", "type": "string"}},
+            "outputs": {"out1": {"description": "d", "type": "string"}},
+            "workflow": [
+                {
+                    "stepId": "s1",
+                    "description": "Unhandled step",
+                    "computeCapabilityRef": "dummy:TestCapability",
+                    "inputBindings": {},
+                    "outputBindings": {"result": "cacm.outputs.out1"},
+                }
+            ],
+        }
+        success, logs, outputs = await self.orchestrator.run_cacm(
+            cacm, mock_outputs=False
+        )
+        self.assertTrue(success)
+        self.assertEqual(outputs, {})
+        self.assertTrue(any("Output mocking is disabled" in log for log in logs))
+
+
+class TestInputBindingPath(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+
+    def test_walk_nested_input_path(self):
+        from cacm_adk_core.orchestrator.orchestrator import (
+            _input_binding_path,
+            _walk_input_path,
+        )
+
+        inputs = {"company": {"value": {"ticker": "ATI"}}, "flat": 3}
+        path = _input_binding_path("cacm.inputs.company.value.ticker")
+        self.assertEqual(path, ("company", "value", "ticker"))
+        self.assertEqual(_walk_input_path(inputs, path), "ATI")
+        self.assertIsNone(
+            _walk_input_path(inputs, _input_binding_path("cacm.inputs.missing.key"))
+        )
+        # Walking past a non-mapping value resolves to None rather than raising
+        self.assertIsNone(
+            _walk_input_path(inputs, _input_binding_path("cacm.inputs.flat.value"))
+        )
+
+    def test_binding_prefix_dispatch(self):
+        from cacm_adk_core.orchestrator.orchestrator import _binding_prefix
+
+        self.assertEqual(_binding_prefix("cacm.inputs.a"), "cacm.inputs.")
+        self.assertEqual(_binding_prefix("steps.s1.outputs.r"), "steps.")
+        self.assertEqual(_binding_prefix("cacm.outputs.report"), "cacm.outputs.")
+        self.assertEqual(_binding_prefix("shared_context.key"), "shared_context.")
+        self.assertIsNone(_binding_prefix("a literal value"))
+
+    def test_step_output_ref_parsing(self):
+        from cacm_adk_core.orchestrator.orchestrator import _step_output_ref
+
+        self.assertEqual(_step_output_ref("steps.s1.outputs.result"), ("s1", "result"))
+        self.assertIsNone(_step_output_ref("steps.s1.result"))
+        self.assertIsNone(_step_output_ref("steps..outputs.result"))
+        self.assertIsNone(_step_output_ref("steps.s1.outputs."))
+        # The whole string must match; as with str.split, nothing is stripped.
+        self.assertEqual(
+            _step_output_ref("steps.s1.outputs.result\n"), ("s1", "result\n")
+        )
+        self.assertIsNone(_step_output_ref("steps.s1.outputs.result.\n"))
+
+
+class TestAgentPool(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None or MockKernelService is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+
+    @staticmethod
+    def _recording_orchestrator():
+        """
+        Orchestrator whose "record" capability runs RecordingAgent, which keeps
+        the run's CACM id on the instance across an await, as
+        FundamentalAnalystAgent does with its inputs.
+        """
+        from cacm_adk_core.agents.base_agent import Agent
+
+        class RecordingAgent(Agent):
+            def __init__(self, kernel_service):
+                super().__init__("RecordingAgent", kernel_service)
+                self.current_cacm_id = self.current_task = None
+
+            async def run(self, task_description, current_step_inputs, shared_context):
+                self.current_cacm_id = shared_context.get_cacm_id()
+                self.current_task = task_description
+                await asyncio.sleep(0.01)
+                return {
+                    "cacm_id": self.current_cacm_id,
+                    "step": self.current_task.split(" ", 1)[0],
+                }
+
+        schema_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", SCHEMA_FILE_PATH_FOR_TEST
+        )
+        orchestrator = Orchestrator(
+            kernel_service=MockKernelService(),
+            validator=Validator(schema_filepath=schema_path),
+            load_catalog_on_init=False,
+        )
+        orchestrator.compute_catalog["record"] = {
+            "id": "record",
+            "name": "Record",
+            "agent_type": "RecordingAgent",
+        }
+        orchestrator.register_agent("RecordingAgent", RecordingAgent)
+        orchestrator.compute_catalog["record_other"] = dict(
+            orchestrator.compute_catalog["record"],
+            id="record_other",
+            agent_type="OtherRecordingAgent",
+        )
+        orchestrator.register_agent(
+            "OtherRecordingAgent", type("Other", (RecordingAgent,), {})
+        )
+        return orchestrator
+
+    @staticmethod
+    def _recording_cacm(cacm_id, step_ids=("s1",), capability_refs=None):
+        return {
+            "cacmId": cacm_id,
+            "version": "1.0.0",
+            "name": "Recording Run",
+            "description": "d",
+            "metadata": {"creationDate": "2023-01-01T12:00:00Z"},
+            "inputs": {"in1": {"description": "d", "type": "string"}},
+            "outputs": {
+                name: {"description": "d", "type": "string"}
+                for step_id in step_ids
+                for name in (step_id, step_id + "_step")
+            },
+            "workflow": [
+                {
+                    "stepId": step_id,
+                    "description": step_id,
+                    "computeCapabilityRef": capability_ref,
+                    "outputBindings": {
+                        "cacm_id": "cacm.outputs." + step_id,
+                        "step": "cacm.outputs." + step_id + "_step",
+                    },
+                }
+                for step_id, capability_ref in zip(
+                    step_ids, capability_refs or ["record"] * len(step_ids)
+                )
+            ],
+        }
+
+    async def test_concurrent_runs_use_separate_agent_instances(self):
+        orchestrator = self._recording_orchestrator()
+        results = await asyncio.gather(
+            orchestrator.run_cacm(self._recording_cacm("run-a")),
+            orchestrator.run_cacm(self._recording_cacm("run-b")),
+        )
+        self.assertTrue(all(success for success, _, _ in results))
+        self.assertEqual(
+            [outputs["s1"]["value"] for _, _, outputs in results], ["run-a", "run-b"]
+        )
+        # Both instances went back to the pool; one is kept for the next run.
+        self.assertEqual(list(orchestrator.agent_instances), ["RecordingAgent"])
+        pooled = orchestrator.agent_instances["RecordingAgent"]
+        _, _, outputs = await orchestrator.run_cacm(self._recording_cacm("run-c"))
+        self.assertEqual(outputs["s1"]["value"], "run-c")
+        self.assertIs(orchestrator.agent_instances["RecordingAgent"], pooled)
+
+    async def test_parallel_steps_of_one_agent_type_do_not_share_calls(self):
+        orchestrator = self._recording_orchestrator()
+        step_ids = ("a", "b", "c")
+        success, logs, outputs = await orchestrator.run_cacm(
+            self._recording_cacm(
+                "parallel", step_ids, ["record", "record", "record_other"]
+            ),
+            parallel_steps=True,
+        )
+        self.assertTrue(success, logs)
+        for step_id in step_ids:
+            self.assertEqual(outputs[step_id + "_step"]["value"], step_id)
+        # "a" and "c" run concurrently; "b" waits for the RecordingAgent of "a".
+        self.assertIn(
+            "INFO: Orchestrator: Dispatching 3 step(s) in 2 parallel wave(s).", logs
+        )
+
+    async def test_agent_instances_are_pooled_and_reset(self):
+        from cacm_adk_core.agents.report_generation_agent import (
+            ReportGenerationAgent,
+        )
+        from cacm_adk_core.context.shared_context import SharedContext
+
+        orchestrator = Orchestrator(
+            kernel_service=MockKernelService(), load_catalog_on_init=False
+        )
+        orchestrator.register_agent("ReportGenerationAgent", ReportGenerationAgent)
+        first = await orchestrator.get_or_create_agent_instance("ReportGenerationAgent")
+        second = await orchestrator.get_or_create_agent_instance(
+            "ReportGenerationAgent"
+        )
+        self.assertIs(first, second)
+
+        await first.receive_analysis_results("AnalysisAgent", {"ratio": 1.0})
+        first.reset_for_run(SharedContext(cacm_id="pool-test"))
+        self.assertEqual(first.stored_results, [])
+
+        # Re-registering an agent type drops the stale pooled instance
+        orchestrator.register_agent("ReportGenerationAgent", ReportGenerationAgent)
+        self.assertNotIn("ReportGenerationAgent", orchestrator.agent_instances)
+
+    async def test_agent_pool_evicts_least_recently_used(self):
+        orchestrator = Orchestrator(
+            kernel_service=MockKernelService(),
+            load_catalog_on_init=False,
+            max_agents=2,
+        )
+        await orchestrator.get_or_create_agent_instance("DataIngestionAgent")
+        await orchestrator.get_or_create_agent_instance("AnalysisAgent")
+        await orchestrator.get_or_create_agent_instance("DataIngestionAgent")  # touch
+        await orchestrator.get_or_create_agent_instance("ReportGenerationAgent")
+        self.assertEqual(
+            list(orchestrator.agent_instances),
+            ["DataIngestionAgent", "ReportGenerationAgent"],
+        )
+        orchestrator.clear_agent_instances()
+        self.assertEqual(len(orchestrator.agent_instances), 0)
+
+    async def test_concurrent_requests_share_one_instance(self):
+        import asyncio
+
+        orchestrator = Orchestrator(
+            kernel_service=MockKernelService(), load_catalog_on_init=False
+        )
+        instances = await asyncio.gather(
+            *(
+                orchestrator.get_or_create_agent_instance("DataIngestionAgent")
+                for _ in range(5)
+            )
+        )
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+        self.assertIsNone(
+            await orchestrator.get_or_create_agent_instance("UnregisteredAgent")
+        )
+
+
+class TestWorkflowStepWaves(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+
+    def test_steps_of_one_agent_type_get_separate_waves(self):
+        from cacm_adk_core.orchestrator.orchestrator import _workflow_step_waves
+
+        workflow = [
+            {"stepId": "a", "agent": "X"},
+            {"stepId": "b", "agent": "X"},
+            {"stepId": "c", "agent": "Y"},
+            {"stepId": "d"},
+        ]
+        waves = _workflow_step_waves(workflow, lambda step: step.get("agent"))
+        self.assertEqual(
+            [[step["stepId"] for step in wave] for wave in waves],
+            [["a", "c", "d"], ["b"]],
+        )
+
+    def test_steps_are_layered_by_declared_dependencies(self):
+        from cacm_adk_core.orchestrator.orchestrator import _workflow_step_waves
+
+        workflow = [
+            {"stepId": "a", "outputBindings": {"r": "cacm.outputs.out_a"}},
+            {"stepId": "b", "inputBindings": {"x": "cacm.inputs.x"}},
+            {"stepId": "c", "inputBindings": {"y": "steps.a.outputs.r"}},
+            {"stepId": "d", "inputBindings": {"z": "cacm.outputs.out_a"}},
+            {"stepId": "e", "inputBindings": {"w": "shared_context.some_key"}},
+        ]
+        waves = _workflow_step_waves(workflow)
+        self.assertEqual(
+            [[step["stepId"] for step in wave] for wave in waves],
+            [["a", "b"], ["c", "d"], ["e"]],
+        )
+        self.assertEqual(_workflow_step_waves([]), [])
+
+    def test_repeated_output_writes_and_forward_references(self):
+        from cacm_adk_core.orchestrator.orchestrator import _workflow_step_waves
+
+        workflow = [
+            {"stepId": "a", "inputBindings": {"y": "steps.c.outputs.r"}},
+            {"stepId": "b", "outputBindings": {"r": "cacm.outputs.shared"}},
+            {"stepId": "c", "outputBindings": {"r": "cacm.outputs.shared"}},
+            {"stepId": "d", "inputBindings": {"y": "steps.c.outputs.r"}},
+        ]
+        waves = _workflow_step_waves(workflow)
+        # 'a' only references a later step, so it has no earlier dependency
+        self.assertEqual(
+            [[step["stepId"] for step in wave] for wave in waves],
+            [["a", "b"], ["c"], ["d"]],
+        )
+
+
+class TestCatalogLoading(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None or MockKernelService is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+
+    def test_failed_load_leaves_read_only_empty_catalog(self):
+        orchestrator = Orchestrator(
+            kernel_service=MockKernelService(),
+            catalog_filepath="does/not/exist/catalog.json",
+        )
+        self.assertEqual(len(orchestrator.compute_catalog), 0)
+        with self.assertRaises(TypeError):
+            orchestrator.compute_catalog["cap"] = {}
+
+    def test_catalog_entries_are_copies_of_the_cached_document(self):
+        from cacm_adk_core.json_io import load_json_file_cached
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "catalog.json")
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "computeCapabilities": [
+                            {"id": "cap", "inputs": [{"name": "x", "type": "float"}]}
+                        ]
+                    },
+                    f,
+                )
+            os.utime(path, (0, 0))  # Old enough to be cached
+            orchestrator = Orchestrator(
+                kernel_service=MockKernelService(), catalog_filepath=path
+            )
+            cached = load_json_file_cached(path)["computeCapabilities"][0]
+            entry = orchestrator.compute_catalog["cap"]
+            self.assertEqual(dict(entry), cached)
+            self.assertIsNot(entry["inputs"], cached["inputs"])
+            # Other holders of the cached document do not affect the catalog.
+            cached["inputs"][0]["type"] = "str"
+            self.assertEqual(entry["inputs"][0]["type"], "float")
+
+    def test_empty_catalog_warning_is_logged_once(self):
+        schema_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", SCHEMA_FILE_PATH_FOR_TEST
+        )
+        cacm = {
+            "cacmId": "test-orch-catalog-006",
+            "version": "1.0.0",
+            "name": "Catalog Warning",
+            "description": "d",
+            "metadata": {"creationDate": "2023-01-01T12:00:00Z"},
+            "inputs": {"in1": {"description": "d", "type": "string"}},
+            "outputs": {"out1": {"description": "d", "type": "string"}},
+            "workflow": [
+                {"stepId": "s1", "description": "d", "computeCapabilityRef": "cap"}
+            ],
+        }
+
+        def catalog_warnings(orchestrator):
+            _, logs, _ = asyncio.run(orchestrator.run_cacm(cacm))
+            return [log for log in logs if "capability catalog is empty" in log]
+
+        failed = Orchestrator(
+            kernel_service=MockKernelService(),
+            validator=Validator(schema_filepath=schema_path),
+            catalog_filepath="does/not/exist/catalog.json",
+        )
+        self.assertEqual(len(catalog_warnings(failed)), 1)
+        self.assertEqual(catalog_warnings(failed), [])
+
+        # A catalog filled in directly is not reported as empty.
+        manual = Orchestrator(
+            kernel_service=MockKernelService(),
+            validator=Validator(schema_filepath=schema_path),
+            load_catalog_on_init=False,
+        )
+        manual.compute_catalog["cap"] = {"id": "cap", "name": "Capability"}
+        self.assertEqual(catalog_warnings(manual), [])
+
+
+class TestRunLog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+
+    def test_collected_messages_keep_level_prefixes(self):
+        from cacm_adk_core.orchestrator.orchestrator import _RunLog
+
+        run_log = _RunLog(logging.getLogger("TestRunLog"))
+        run_log.info("Step '%s' done", "s1")
+        run_log.warning("100% literal")
+        run_log.error("Failed: %r", {"a": 1})
+        self.assertEqual(
+            run_log.messages,
+            [
+                "INFO: Orchestrator: Step 's1' done",
+                "WARN: Orchestrator: 100% literal",
+                "ERROR: Orchestrator: Failed: {'a': 1}",
+            ],
+        )
+
+    def test_uncollected_messages_go_to_logger(self):
+        from cacm_adk_core.orchestrator.orchestrator import _RunLog
+
+        run_log = _RunLog(logging.getLogger("TestRunLog"), collect=False)
+        with self.assertLogs("TestRunLog", level="INFO") as captured:
+            run_log.info("Step '%s' done", "s1")
+        self.assertEqual(run_log.messages, [])
+        self.assertEqual(captured.records[0].getMessage(), "Step 's1' done")
+
+
+class TestExecuteCacmFastPaths(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None or MockKernelService is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+        project_root = os.path.abspath(
+            os.path.join(os.path.dirname(__file__), "..", "..")
+        )
+        cls.templates_dir = os.path.join(project_root, "cacm_library", "templates")
+
+    def setUp(self):
+        self.orchestrator = Orchestrator(
+            kernel_service=MockKernelService(), load_catalog_on_init=False
+        )
+
+    def test_basic_ratio_template_dispatches_to_direct_path(self):
+        result = self.orchestrator.execute_cacm(
+            os.path.join(self.templates_dir, "basic_ratio_analysis_template.json"),
+            {
+                "financialStatementData": {
+                    "current_assets": 800000.0,
+                    "current_liabilities": 250000.0,
+                    "total_debt": 450000.0,
+                    "total_equity": 950000.0,
+                    "revenue": 3000000.0,
+                    "gross_profit": 1200000.0,
+                    "net_income": 250000.0,
+                    "total_assets": 1800000.0,
+                }
+            },
+        )
+        self.assertEqual(result["calculatedRatios"]["current_ratio"], 3.2)
+
+    def test_registered_fast_path_and_fallback(self):
+        template_path = os.path.join(
+            self.templates_dir, "data_aggregation_task_template.json"
+        )
+        result = self.orchestrator.execute_cacm(template_path, {})
+        self.assertIn("is not implemented in this version", result["errors"][0])
+
+        self.orchestrator.register_template_fast_path(
+            "data_aggregation_task_template.json",
+            lambda template, input_data, log_messages: {"handled": True},
+        )
+        self.assertEqual(
+            self.orchestrator.execute_cacm(template_path, {}), {"handled": True}
+        )
+
+
+class TestKernelFunctionCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if Orchestrator is None or MockKernelService is None:
+            raise unittest.SkipTest("Orchestrator component not found or import error.")
+
+    def test_kernel_functions_are_resolved_once_per_kernel(self):
+        class FakeKernel:
+            def __init__(self, function):
+                self.plugins = {"Plugin": {"func": function}}
+
+        orchestrator = Orchestrator(
+            kernel_service=MockKernelService(), load_catalog_on_init=False
+        )
+        first_kernel = FakeKernel("first")
+        self.assertEqual(
+            orchestrator._get_kernel_function(first_kernel, "Plugin", "func"), "first"
+        )
+        first_kernel.plugins = {}  # Cached: the plugin table is not consulted again
+        self.assertEqual(
+            orchestrator._get_kernel_function(first_kernel, "Plugin", "func"), "first"
+        )
+        self.assertEqual(
+            orchestrator._get_kernel_function(FakeKernel("second"), "Plugin", "func"),
+            "second",
+        )
+        with self.assertRaises(KeyError):
+            orchestrator._get_kernel_function(first_kernel, "Plugin", "func")
+
 
 if __name__ == "__main__":
     unittest.main()
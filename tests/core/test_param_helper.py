@@ -0,0 +1,21 @@
+# tests/core/test_param_helper.py
+import unittest
+
+from cacm_adk_core.param_helper.param_helper import ParamHelper
+
+
+class TestParamHelper(unittest.TestCase):
+
+    def test_recommendations_are_modifiable_copies(self):
+        helper = ParamHelper()
+        params = helper.get_param_recommendations("NeuralNetwork")
+        self.assertIsInstance(params, dict)
+        params["epochs"] = 5
+        self.assertEqual(
+            helper.get_param_recommendations("NeuralNetwork"),
+            {"learning_rate": 0.01, "epochs": 100},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
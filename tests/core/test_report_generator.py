@@ -25,6 +25,41 @@ class TestEnhancedPersonaReportGenerator(unittest.TestCase):  # Renamed class
         self.assertEqual(self.reporter._map_score_to_sp(800), "AAA")
         self.assertEqual(self.reporter._map_score_to_sp(None), "Not Rated")
 
+    def test_score_band_boundaries(self):
+        cases = [
+            (850, "AAA"),
+            (799, "AA"),
+            (750, "AA"),
+            (749.5, "A"),
+            (650, "BBB"),
+            (600, "BB"),
+            (550, "B"),
+            (500, "CCC"),
+            (499, "CC/C/D or Not Rated"),
+        ]
+        for score, expected in cases:
+            self.assertEqual(self.reporter._map_score_to_sp(score), expected, score)
+        self.assertEqual(self.reporter._map_score_to_snc(699), "Special Mention")
+        self.assertEqual(self.reporter._map_score_to_snc(399), "Loss")
+        self.assertIn(
+            self.reporter._generate_mocked_outlook(549), ["Negative", "Developing"]
+        )
+        self.assertIn(
+            self.reporter._generate_mocked_outlook(650), ["Stable", "Positive"]
+        )
+
+    def test_nan_score_gets_the_lowest_band(self):
+        nan = float("nan")
+        self.assertEqual(self.reporter._map_score_to_sp(nan), "CC/C/D or Not Rated")
+        self.assertEqual(self.reporter._map_score_to_snc(nan), "Loss")
+        self.assertIn(
+            self.reporter._generate_mocked_outlook(nan), ["Negative", "Developing"]
+        )
+        report = self.reporter.generate_sme_score_report({"creditScore": nan})
+        self.assertEqual(
+            report["executiveSummary"]["overallAssessment"], "Very High Risk / Default"
+        )
+
     def test_map_score_to_snc_updated(self):  # Renamed for clarity
         self.assertEqual(self.reporter._map_score_to_snc(700), "Pass")
         self.assertEqual(
@@ -45,6 +80,14 @@ class TestEnhancedPersonaReportGenerator(unittest.TestCase):  # Renamed class
         )
         self.assertEqual(self.reporter._generate_mocked_outlook(None), "Uncertain")
 
+    def test_seeded_outlooks_are_reproducible(self):
+        scores = [500, 600, 700, 800] * 5
+        first, second = ReportGenerator(seed=7), ReportGenerator(seed=7)
+        self.assertEqual(
+            [first._generate_mocked_outlook(s) for s in scores],
+            [second._generate_mocked_outlook(s) for s in scores],
+        )
+
     def test_generate_fundamental_perspective(self):
         perspective_strong = self.reporter._generate_fundamental_perspective(
             750,
@@ -90,6 +133,20 @@ class TestEnhancedPersonaReportGenerator(unittest.TestCase):  # Renamed class
         perspective_na = self.reporter._generate_fundamental_perspective(600, {}, None)
         self.assertIn("not strongly conclusive", perspective_na)
 
+        # A value must exceed a threshold to earn the stronger qualifier
+        perspective_edges = self.reporter._generate_fundamental_perspective(
+            600,
+            {
+                "profitabilityMetric": 0.15,
+                "leverageRatio": 3,
+                "freeCashFlowYield": 0.05,
+            },
+            None,
+        )
+        self.assertIn("margin 15.00%) appears moderate.", perspective_edges)
+        self.assertIn("D/E 3.00x) is considered moderate.", perspective_edges)
+        self.assertIn("(5.00%) indicates adequate", perspective_edges)
+
     def test_generate_regulatory_snc_perspective(self):
         self.assertIn(
             "no undue criticism",
@@ -170,6 +227,14 @@ class TestEnhancedPersonaReportGenerator(unittest.TestCase):  # Renamed class
         )  # Added period
         self.assertIn("Negative market/business outlook.", xai_low)
 
+    def test_extract_fundamental_metrics(self):
+        metrics = self.reporter._extract_fundamental_metrics(
+            {"leverageRatio": {"value": 4.0}, "profitabilityMetric": "n/a"}
+        )
+        self.assertEqual(metrics["leverageRatio"], 4.0)
+        self.assertIsNone(metrics["profitabilityMetric"])  # Not numeric
+        self.assertIsNone(metrics["freeCashFlowYield"])  # Missing
+
     # --- Tests for the main report generation method ---
     def test_generate_full_sme_report_high_score_enhanced_rationale(self):  # Renamed
         mock_outputs = {
@@ -254,6 +319,68 @@ class TestEnhancedPersonaReportGenerator(unittest.TestCase):  # Renamed class
             report["keyRiskFactors_XAI"],
         )  # Added period
 
+    def test_every_snc_rating_has_an_overall_assessment(self):
+        # One score per SNC band, from "Loss" up to "Pass".
+        for score in [300, 450, 550, 650, 750]:
+            report = self.reporter.generate_sme_score_report({"creditScore": score})
+            self.assertNotEqual(
+                report["executiveSummary"]["overallAssessment"],
+                "Risk Undetermined",
+                score,
+            )
+
+    def test_overall_assessment_low_risk_boundary(self):
+        for score, expected in [
+            (749, "Low to Moderate Risk"),
+            (750, "Low Risk"),
+            (None, "Risk Undetermined"),
+        ]:
+            report = self.reporter.generate_sme_score_report({"creditScore": score})
+            self.assertEqual(
+                report["executiveSummary"]["overallAssessment"], expected, score
+            )
+
+    def test_generated_date_is_current_utc_second(self):
+        report = self.reporter.generate_sme_score_report({"creditScore": 700})
+        generated = datetime.fromisoformat(report["reportHeader"]["generatedDate"])
+        self.assertEqual(generated.utcoffset(), timedelta(0))
+        self.assertEqual(generated.microsecond, 0)
+        self.assertLess(
+            abs(datetime.now(timezone.utc) - generated), timedelta(seconds=5)
+        )
+        # Reports generated within the same second share the formatted timestamp
+        again = self.reporter.generate_sme_score_report({"creditScore": 700})
+        self.assertGreaterEqual(
+            datetime.fromisoformat(again["reportHeader"]["generatedDate"]), generated
+        )
+
+    def test_batch_reports_match_single_reports(self):
+        rows = [
+            {"creditScore": {"value": 780}},
+            {"creditScore": 520.5},
+            {"creditScore": {"value": None}},
+            {},
+            {"creditScore": 800, "leverageRatio": 4.0},
+            {"creditScore": float("nan")},
+        ]
+        reports = self.reporter.generate_sme_score_reports(
+            rows, sme_identifiers=["a", "b", "c", "d", "e", "f"]
+        )
+        self.assertEqual(len(reports), len(rows))
+        for row, report in zip(rows, reports):
+            single = self.reporter.generate_sme_score_report(row)
+            self.assertEqual(report["creditRating"], single["creditRating"])
+            self.assertEqual(
+                report["executiveSummary"]["overallAssessment"],
+                single["executiveSummary"]["overallAssessment"],
+            )
+        self.assertEqual(reports[2]["creditRating"]["spScaleEquivalent"], "Not Rated")
+        self.assertEqual(reports[4]["reportHeader"]["smeIdentifier"], "e")
+        self.assertEqual(reports[5]["creditRating"]["sncRegulatoryEquivalent"], "Loss")
+        self.assertEqual(self.reporter.generate_sme_score_reports([]), [])
+        with self.assertRaises(ValueError):
+            self.reporter.generate_sme_score_reports(rows, sme_identifiers=["a"])
+
     def test_get_output_value_helper(self):  # Kept from previous version
         self.assertEqual(self.reporter._get_output_value({"value": 10}), 10)
         self.assertEqual(
@@ -269,6 +396,9 @@ class TestEnhancedPersonaReportGenerator(unittest.TestCase):  # Renamed class
             self.reporter._get_output_value({}, default="EmptyReplaced"),
             "EmptyReplaced",
         )
+        # Falsy scalars are values, not missing data.
+        self.assertEqual(self.reporter._get_output_value(0.0, default="Test"), 0.0)
+        self.assertEqual(self.reporter._get_output_value("ok"), "ok")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+# tests/core/test_semantic_kernel_adapter.py
+import asyncio
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from cacm_adk_core import semantic_kernel_adapter
+from cacm_adk_core.semantic_kernel_adapter import KernelService
+
+
+class CountingKernelService(KernelService):
+    """Subclass with its own singleton slot and a stub kernel build."""
+
+    _instance = None
+    init_calls = 0
+
+    def _initialize_kernel(self):
+        type(self).init_calls += 1
+        self._kernel = object()
+
+
+class TestKernelService(unittest.TestCase):
+
+    def setUp(self):
+        CountingKernelService._instance = None
+        CountingKernelService.init_calls = 0
+
+    def test_kernel_is_built_lazily_once(self):
+        service = CountingKernelService()
+        self.assertIs(service, CountingKernelService())
+        self.assertEqual(CountingKernelService.init_calls, 0)
+
+        kernel = service.get_kernel()
+        self.assertIs(service.kernel, kernel)
+        self.assertIs(CountingKernelService().get_kernel(), kernel)
+        self.assertEqual(CountingKernelService.init_calls, 1)
+
+    def test_concurrent_first_access_builds_one_kernel(self):
+        barrier = threading.Barrier(8)
+        kernels = []
+
+        def worker():
+            barrier.wait()
+            kernels.append(CountingKernelService().get_kernel())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(CountingKernelService.init_calls, 1)
+        self.assertEqual(len({id(kernel) for kernel in kernels}), 1)
+
+    def test_openai_client_leaves_retries_to_llm_throttle(self):
+        class OpenAIService(KernelService):
+            _instance = None
+
+        service = OpenAIService()
+        self.addCleanup(lambda: asyncio.run(service.aclose()))
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}), patch.object(
+            semantic_kernel_adapter,
+            "AsyncOpenAI",
+            wraps=semantic_kernel_adapter.AsyncOpenAI,
+        ) as async_openai:
+            service.get_kernel()
+        async_openai.assert_called_once()
+        self.assertEqual(async_openai.call_args.kwargs["max_retries"], 0)
+
+    def test_kernel_independent_plugins_are_shared(self):
+        class FirstService(KernelService):
+            _instance = None
+
+        class SecondService(KernelService):
+            _instance = None
+
+        first = FirstService().get_kernel()
+        second = SecondService().get_kernel()
+        self.assertIsNot(first, second)
+        self.assertIs(first.plugins["ESGAnalysis"], second.plugins["ESGAnalysis"])
+        # Bound to their own kernel, so never shared.
+        self.assertIsNot(
+            first.plugins["ReportingAnalysisSkills"],
+            second.plugins["ReportingAnalysisSkills"],
+        )
+
+    def test_plugins_of_other_groups_survive_a_failed_import(self):
+        class PartialService(KernelService):
+            _instance = None
+
+        with patch.object(semantic_kernel_adapter, "PIPELINE_SKILLS_AVAILABLE", False):
+            plugins = PartialService().get_kernel().plugins
+        self.assertNotIn("SummarizationSkills", plugins)
+        self.assertNotIn("ReportingAnalysisSkills", plugins)
+        for name in ("BasicCalculations", "FinancialAnalysis", "ESGAnalysis"):
+            self.assertIn(name, plugins)
+
+
+if __name__ == "__main__":
+    unittest.main()
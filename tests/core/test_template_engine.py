@@ -3,6 +3,10 @@ import unittest
 import os
 import shutil
 import json  # Added for creating minimal valid JSON if needed
+import tempfile
+from unittest.mock import patch
+
+from cacm_adk_core.json_io import load_json_file
 
 try:
     from cacm_adk_core.template_engine.template_engine import TemplateEngine
@@ -121,5 +125,62 @@ class TestTemplateEngineMinimal(unittest.TestCase):
         self.assertIn("creationDate", instance.get("metadata", {}))
 
 
+class TestTemplateEngineCache(unittest.TestCase):
+
+    def setUp(self):
+        if TemplateEngine is None:
+            self.skipTest("TemplateEngine component not found or import error.")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "cached.json")
+        self._write({"name": "First", "metadata": {}})
+        self.engine = TemplateEngine(templates_dir=self.tmp_dir.name)
+
+    def _write(self, data, mtime_ns=None):
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_template_is_parsed_once(self):
+        with patch(
+            "cacm_adk_core.template_engine.template_engine.load_json_file",
+            wraps=load_json_file,
+        ) as loads:
+            self.engine.list_templates()
+            first = self.engine.load_template("cached.json")
+            self.engine.instantiate_template("cached.json")
+            self.assertEqual(self.engine.list_templates()[0]["name"], "First")
+        self.assertEqual(loads.call_count, 1)
+        # Callers get their own copy.
+        first["name"] = "Mutated"
+        self.assertEqual(self.engine.load_template("cached.json")["name"], "First")
+
+    def test_modified_template_is_reloaded(self):
+        self.assertEqual(self.engine.load_template("cached.json")["name"], "First")
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        self._write({"name": "Second", "metadata": {}}, mtime_ns=mtime_ns + 10**9)
+        self.assertEqual(self.engine.load_template("cached.json")["name"], "Second")
+        self.assertEqual(self.engine.list_templates()[0]["name"], "Second")
+
+    def test_overrides_are_deep_merged(self):
+        self._write({"name": "First", "metadata": {"a": 1, "nested": {"b": 2}}})
+        instance = self.engine.instantiate_template(
+            "cached.json",
+            cacm_id="id-1",
+            overrides={"name": "Override", "metadata": {"nested": {"c": 3}}},
+        )
+        self.assertEqual(instance["cacmId"], "id-1")
+        self.assertEqual(instance["name"], "Override")
+        self.assertEqual(instance["metadata"]["a"], 1)
+        self.assertEqual(instance["metadata"]["nested"], {"b": 2, "c": 3})
+        self.assertIn("creationDate", instance["metadata"])
+        # The cached template is left untouched.
+        self.assertEqual(
+            self.engine.load_template("cached.json")["metadata"],
+            {"a": 1, "nested": {"b": 2}},
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 # tests/core/test_validator.py
 import unittest
 import os
+from unittest.mock import patch
 
 try:
     from cacm_adk_core.validator.validator import Validator
@@ -13,6 +14,22 @@ except ImportError:
 SCHEMA_FILE_PATH = "cacm_standard/cacm_schema_v0.2.json"
 
 
+def _minimal_cacm(**overrides) -> dict:
+    """Returns a new minimal CACM instance that the schema accepts, with `overrides` applied."""
+    cacm = {
+        "cacmId": "a1b2c3d4-e5f6-7890-1234-567890abcdef",
+        "version": "0.2.0",
+        "name": "Minimal CACM",
+        "description": "d",
+        "metadata": {"creationDate": "2023-01-01T12:00:00Z"},
+        "inputs": {"dummy_input": {"description": "d", "type": "string"}},
+        "outputs": {"dummy_output": {"description": "d", "type": "string"}},
+        "workflow": [{"stepId": "s1", "description": "d", "computeCapabilityRef": "d"}],
+    }
+    cacm.update(overrides)
+    return cacm
+
+
 class TestValidator(unittest.TestCase):
 
     @classmethod
@@ -29,6 +46,7 @@ class TestValidator(unittest.TestCase):
                 f"Schema file not found at resolved path: {schema_path}. Check SCHEMA_FILE_PATH and execution directory."
             )
 
+        cls.validator_schema_path = schema_path
         cls.validator = Validator(schema_filepath=schema_path)
         if not cls.validator.schema:
             # This condition might be redundant if Validator's __init__ raises an error on load failure,
@@ -175,6 +193,178 @@ class TestValidator(unittest.TestCase):
             f"Errors: {errors}",
         )
 
+    def test_fast_path_agrees_with_jsonschema(self):
+        from cacm_adk_core.validator.validator import FASTJSONSCHEMA_AVAILABLE
+
+        if not FASTJSONSCHEMA_AVAILABLE:
+            self.skipTest("fastjsonschema is not installed.")
+        self.assertIsNotNone(self.validator._compiled_schema)
+        # Exercise the fastjsonschema path
+        rs_patch = patch.object(self.validator, "_rs_validator", None)
+        rs_patch.start()
+        self.addCleanup(rs_patch.stop)
+        cacm = _minimal_cacm()
+        self.assertEqual(self.validator.validate_cacm_against_schema(cacm), (True, []))
+        del cacm["name"]
+        is_valid, errors = self.validator.validate_cacm_against_schema(cacm)
+        self.assertFalse(is_valid)
+        # Rejections are still reported with jsonschema's messages
+        self.assertIn("'name' is a required property", errors[0]["message"])
+
+        # Validators built from the same schema share the compiled function
+        from cacm_adk_core.validator.validator import Validator as _Validator
+
+        other = _Validator(schema_filepath=self.validator_schema_path)
+        self.assertIs(other._compiled_schema, self.validator._compiled_schema)
+
+    def test_validation_results_are_cached_by_content(self):
+        from cacm_adk_core.validator.validator import Validator as _Validator
+
+        validator = _Validator(schema_filepath=self.validator_schema_path)
+        cacm = _minimal_cacm()
+        del cacm["name"]
+        first = validator.validate_cacm_against_schema(cacm)
+        self.assertFalse(first[0])
+        # An equal instance with a different key order hits the cache
+        reordered = dict(reversed(list(cacm.items())))
+        self.assertEqual(validator.validate_cacm_against_schema(reordered), first)
+        self.assertEqual(len(validator._validation_cache), 1)
+
+        cacm["name"] = "Now valid"
+        self.assertEqual(validator.validate_cacm_against_schema(cacm), (True, []))
+        self.assertEqual(len(validator._validation_cache), 2)
+
+    def test_cache_keeps_ambiguous_documents_apart(self):
+        from cacm_adk_core.validator.validator import Validator as _Validator
+
+        validator = _Validator(schema_filepath=self.validator_schema_path)
+        # NaN and None have the same canonical JSON (null) under orjson.
+        nan_errors = validator.validate_cacm_against_schema(
+            _minimal_cacm(description=float("nan"))
+        )[1]
+        self.assertIn("nan", nan_errors[0]["message"])
+        none_errors = validator.validate_cacm_against_schema(
+            _minimal_cacm(description=None)
+        )[1]
+        self.assertIn("None", none_errors[0]["message"])
+
+    def test_cached_errors_are_not_shared_with_callers(self):
+        from cacm_adk_core.validator.validator import Validator as _Validator
+
+        validator = _Validator(schema_filepath=self.validator_schema_path)
+        cacm = _minimal_cacm()
+        del cacm["name"]
+        first = validator.validate_cacm_against_schema(cacm)[1]
+        first[0]["message"] = "changed by the caller"
+        second = validator.validate_cacm_against_schema(cacm)[1]
+        self.assertIn("'name' is a required property", second[0]["message"])
+
+    def test_jsonschema_validator_is_built_once(self):
+        from cacm_adk_core.validator import validator as validator_module
+
+        validator = validator_module.Validator(
+            schema_filepath=self.validator_schema_path
+        )
+        # Exercise the jsonschema path
+        validator._rs_validator = validator._compiled_schema = None
+        cacm = _minimal_cacm()
+        del cacm["name"]
+        with patch.object(validator_module.jsonschema, "validate") as validate:
+            is_valid, errors = validator.validate_cacm_against_schema(cacm)
+            cacm["name"] = "Now valid"
+            self.assertEqual(validator.validate_cacm_against_schema(cacm), (True, []))
+        validate.assert_not_called()
+        self.assertFalse(is_valid)
+        self.assertIn("'name' is a required property", errors[0]["message"])
+        # Validators of the same schema share it.
+        self.assertIs(validator._schema_validator, self.validator._schema_validator)
+
+    def test_is_valid_agrees_with_full_validation(self):
+        cacm = _minimal_cacm()
+        invalid = dict(cacm, workflow=[{"description": "d"}])
+        backends = [
+            (self.validator._rs_validator, self.validator._compiled_schema),
+            (None, self.validator._compiled_schema),
+            (None, None),
+        ]
+        for rs_validator, compiled in backends:
+            with patch.object(
+                self.validator, "_rs_validator", rs_validator
+            ), patch.object(self.validator, "_compiled_schema", compiled):
+                self.assertTrue(self.validator.is_valid(cacm))
+                self.assertFalse(self.validator.is_valid(invalid))
+
+    def test_format_keywords_are_ignored_by_every_backend(self):
+        from cacm_adk_core.validator.validator import Validator as _Validator
+
+        # Schema-valid, but not a date-time / uri as the schema's "format" asks.
+        cacm = _minimal_cacm(
+            metadata={"creationDate": "yesterday"},
+            inputs={
+                "dummy_input": {
+                    "description": "d",
+                    "type": "string",
+                    "ontologyRef": "not a uri",
+                }
+            },
+        )
+        backends = [
+            (self.validator._rs_validator, self.validator._compiled_schema),
+            (None, self.validator._compiled_schema),
+            (None, None),
+        ]
+        for rs_validator, compiled in backends:
+            # A new Validator each time so no cached result is reused.
+            validator = _Validator(schema_filepath=self.validator_schema_path)
+            validator._rs_validator, validator._compiled_schema = rs_validator, compiled
+            self.assertTrue(validator.is_valid(cacm))
+            self.assertEqual(validator.validate_cacm_against_schema(cacm), (True, []))
+
+    def test_tuples_are_not_arrays_for_any_backend(self):
+        from cacm_adk_core.validator.validator import Validator as _Validator
+
+        # jsonschema does not treat a tuple as a JSON array.
+        cacm = _minimal_cacm()
+        cacm["workflow"] = tuple(cacm["workflow"])
+        backends = [
+            (self.validator._rs_validator, self.validator._compiled_schema),
+            (None, self.validator._compiled_schema),
+            (None, None),
+        ]
+        for rs_validator, compiled in backends:
+            validator = _Validator(schema_filepath=self.validator_schema_path)
+            validator._rs_validator, validator._compiled_schema = rs_validator, compiled
+            self.assertFalse(validator.is_valid(cacm))
+            is_valid, errors = validator.validate_cacm_against_schema(cacm)
+            self.assertFalse(is_valid)
+            self.assertIn("is not of type 'array'", errors[0]["message"])
+
+    def test_rs_validator_agrees_with_jsonschema(self):
+        from cacm_adk_core.validator import validator as validator_module
+
+        if not validator_module.JSONSCHEMA_RS_AVAILABLE:
+            self.skipTest("jsonschema-rs is not installed.")
+        validator = validator_module.Validator(
+            schema_filepath=self.validator_schema_path
+        )
+        self.assertIsNotNone(validator._rs_validator)
+        self.assertIs(validator._rs_validator, self.validator._rs_validator)
+        validator._compiled_schema = None  # Only jsonschema-rs accepts instances
+        cacm = _minimal_cacm()
+        with patch.object(validator_module.jsonschema, "validate") as validate:
+            self.assertEqual(validator.validate_cacm_against_schema(cacm), (True, []))
+        validate.assert_not_called()
+        del cacm["name"]
+        is_valid, errors = validator.validate_cacm_against_schema(cacm)
+        self.assertFalse(is_valid)
+        # Rejections are still reported with jsonschema's messages
+        self.assertIn("'name' is a required property", errors[0]["message"])
+
+        # Values jsonschema-rs cannot convert are left to jsonschema.
+        unconvertible = _minimal_cacm(description={"d"})
+        self.assertFalse(validator.is_valid(unconvertible))
+        self.assertFalse(validator.validate_cacm_against_schema(unconvertible)[0])
+
 
 if __name__ == "__main__":
     unittest.main()
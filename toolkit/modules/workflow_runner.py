@@ -9,6 +9,7 @@ try:
     from cacm_adk_core.validator.validator import Validator
     from cacm_adk_core.orchestrator.orchestrator import Orchestrator
     from cacm_adk_core.semantic_kernel_adapter import KernelService
+    from cacm_adk_core.json_io import load_json_file
 except ImportError:
     # Fallback for potential path issues during development,
     # though ideally the toolkit is installed or PYTHONPATH is set.
@@ -20,6 +21,7 @@ except ImportError:
     from cacm_adk_core.validator.validator import Validator
     from cacm_adk_core.orchestrator.orchestrator import Orchestrator
     from cacm_adk_core.semantic_kernel_adapter import KernelService
+    from cacm_adk_core.json_io import load_json_file
 
 # Default paths (mirroring scripts/adk_cli.py)
 DEFAULT_SCHEMA_PATH = "cacm_standard/cacm_schema_v0.2.json"
@@ -86,8 +88,7 @@ class WorkflowRunnerModule:  # No need to inherit from ToolkitModule for now
             return runner_output
 
         try:
-            with open(cacm_filepath, "r") as f:
-                cacm_instance_data = json.load(f)
+            cacm_instance_data = load_json_file(cacm_filepath)
         except json.JSONDecodeError as e:
             runner_output["message"] = (
                 f"Error: Invalid JSON in file {cacm_filepath}: {str(e)}"